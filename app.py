@@ -1,8 +1,15 @@
 import streamlit as st
 import json
+import time
 from datetime import datetime
-import re
-import requests
+
+from resumematch import config, metrics
+from resumematch.archive import ArchiveError, ResumeArchive, score_members
+from resumematch.cache import extract_text_cached, file_digest
+from resumematch.core import ExtractionError, analyze_resume, analyze_resume_with_budget
+from resumematch.job_store import get_default_store
+from resumematch.multi_job import build_job_profile, build_job_profiles, parse_jobs, rank_jobs
+from resumematch.work_queue import get_default_queue
 
 # =============================================================================
 # BRANDING - ResumeMatch
@@ -12,18 +19,6 @@ APP_TAGLINE = "AI-Powered Resume Analysis & Job Matching"
 APP_ICON = "📄"
 # =============================================================================
 
-# Import document processing libraries
-try:
-    from pypdf import PdfReader
-    import pdfplumber
-except ImportError:
-    st.error("Run: pip install pypdf pdfplumber")
-
-try:
-    from docx import Document as DocxDocument
-except ImportError:
-    st.error("Run: pip install python-docx")
-
 # Page configuration
 st.set_page_config(
     page_title=APP_NAME,
@@ -196,416 +191,324 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
-def extract_text_from_pdf(file):
-    """Extract text from PDF"""
-    text = ""
+def extract_resume_text(uploaded_file):
+    """(text, error) for the uploaded resume; error is a {code, message} dict or None"""
+    with metrics.timed("upload_read"):
+        data = uploaded_file.getvalue()
     try:
-        with pdfplumber.open(file) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-    except:
-        try:
-            file.seek(0)
-            reader = PdfReader(file)
-            for page in reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-        except Exception as e:
-            st.error(f"PDF extraction failed: {str(e)}")
-            return None
-    return text.strip()
-
-
-def extract_text_from_docx(file):
-    """Extract text from DOCX"""
-    try:
-        doc = DocxDocument(file)
-        text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
-        return text.strip()
-    except Exception as e:
-        st.error(f"DOCX extraction failed: {str(e)}")
-        return None
+        text = extract_text_cached(data, uploaded_file.name)
+    except ExtractionError as e:
+        metrics.increment(f"extraction_error_{e.code}")
+        return None, e.to_dict()
+    if len(text.strip()) < 100:
+        return None, {'code': 'empty', 'message': "Could not extract text. Ensure file contains readable text."}
+    return text, None
+
+
+def job_profile_for(job_description):
+    """Keyword profile of the job: stored when RESUMEMATCH_JOB_STORE is set,
+    built for this run otherwise so pasted jobs are not kept for the life of
+    the server"""
+    if config.JOB_STORE_PATH:
+        return get_default_store().ingest(job_description)
+    return build_job_profile('job', job_description)
+
+
+@st.cache_data(show_spinner=False, max_entries=config.UI_CACHE_ENTRIES, ttl=config.UI_CACHE_TTL_SECONDS)
+def cached_analysis(file_hash, job_hash, _resume_text, _job_description):
+    """analyze_resume memoized on the file and job hashes across reruns
+
+    Returns (analysis, status messages) so a cache hit can report how the
+    analysis was produced without rerunning it.
+    """
+    messages = []
+    analysis = analyze_resume(_resume_text, _job_description,
+                              on_status=lambda level, message: messages.append((level, message)),
+                              job_profile=job_profile_for(_job_description))
+    return analysis, messages
 
 
-def extract_keywords(text):
-    """Extract keywords from text"""
-    # Extended stop words including common business jargon
-    stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 
-                  'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'be',
-                  'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
-                  'should', 'may', 'might', 'can', 'this', 'that', 'these', 'those',
-                  'we', 'our', 'your', 'their', 'you', 'they', 'them', 'us', 'all',
-                  'who', 'what', 'when', 'where', 'which', 'how', 'why', 'any', 'some',
-                  'more', 'most', 'other', 'such', 'into', 'through', 'during', 'before',
-                  'after', 'above', 'below', 'between', 'under', 'again', 'further',
-                  'then', 'once', 'here', 'there', 'up', 'out', 'if', 'about', 'than',
-                  'also', 'very', 'too', 'can', 'just', 'dont', 'now', 'so', 'than',
-                  'work', 'working', 'worked', 'company', 'team', 'role', 'position',
-                  'job', 'career', 'opportunity', 'responsibilities', 'requirements',
-                  'qualifications', 'skills', 'knowledge', 'familiarity', 'understanding',
-                  'ability', 'strong', 'excellent', 'good', 'experience', 'years',
-                  'looking', 'seeking', 'required', 'preferred', 'plus', 'bonus',
-                  'etc', 'including', 'related', 'various', 'multiple', 'within'}
-    
-    words = re.findall(r'\b[a-zA-Z][a-zA-Z0-9\.\-]*\b', text.lower())
-    
-    # Filter: length > 3, not in stop words, not just numbers
-    keywords = [w for w in words if w not in stop_words and len(w) > 3 and not w.isdigit()]
-    
-    from collections import Counter
-    return Counter(keywords)
-
-
-def calculate_keyword_match(resume_text, job_text):
-    """Calculate keyword matching"""
-    resume_keywords = extract_keywords(resume_text)
-    job_keywords = extract_keywords(job_text)
-    
-    common_keywords = set(resume_keywords.keys()) & set(job_keywords.keys())
-    
-    if len(job_keywords) > 0:
-        match_percentage = (len(common_keywords) / len(job_keywords)) * 100
+@st.cache_data(show_spinner=False, max_entries=config.UI_CACHE_ENTRIES)
+def cached_job_profiles(jobs_hash, filename, _data):
+    """Parsed job descriptions and their keyword profiles, memoized on the input hash"""
+    return build_job_profiles(parse_jobs(_data, filename))
+
+
+def show_status(level, message):
+    """Forward progress updates from the scoring core to Streamlit"""
+    if level == "success":
+        st.success(message)
     else:
-        match_percentage = 0
-    
-    top_job_keywords = [k for k, v in job_keywords.most_common(20)]
-    matched = [k for k in top_job_keywords if k in resume_keywords]
-    missing = [k for k in top_job_keywords if k not in resume_keywords]
+        st.info(message)
+
+
+def display_score(score, label):
+    """Display score with color"""
+    if score >= 80:
+        color = "#10b981"
+    elif score >= 60:
+        color = "#f59e0b"
+    else:
+        color = "#ef4444"
     
-    return {
-        'match_percentage': match_percentage,
-        'matched_keywords': matched[:10],
-        'missing_keywords': missing[:10]
-    }
+    st.markdown(f"""
+    <div style="background-color: {color}; color: white; padding: 1.5rem; 
+                border-radius: 8px; text-align: center; margin: 1rem 0;">
+        <div style="font-size: 3rem; font-weight: bold;">{score}%</div>
+        <div style="font-size: 1.1rem; opacity: 0.9;">{label}</div>
+    </div>
+    """, unsafe_allow_html=True)
 
 
-def analyze_with_free_ai(resume_text, job_description):
-    """FREE AI analysis using Hugging Face (NO API KEY NEEDED!)"""
+def display_analysis(analysis, file_name, source="analysis"):
+    """Render the analysis results; source keeps widget keys unique per render"""
+    st.markdown("---")
+    st.markdown("## Analysis Results")
     
-    API_URL = "https://api-inference.huggingface.co/models/mistralai/Mistral-7B-Instruct-v0.2"
+    # Overall Score
+    st.markdown('<div class="section-header">Overall Match Score</div>', unsafe_allow_html=True)
+    display_score(analysis['match_score'], "Match Score")
     
-    resume_snippet = resume_text[:2500]
-    job_snippet = job_description[:1500]
+    # Assessment
+    st.markdown('<div class="section-header">Overall Assessment</div>', unsafe_allow_html=True)
+    st.markdown(f"<div style='background-color: #f8fafc; border-left: 4px solid #2563eb; padding: 1rem; margin: 0.5rem 0; border-radius: 4px; color: #1e293b; font-size: 1.05rem;'>{analysis['overall_assessment']}</div>", unsafe_allow_html=True)
     
-    prompt = f"""Analyze resume vs job. Be professional.
-
-RESUME:
-{resume_snippet}
-
-JOB:
-{job_snippet}
-
-Return ONLY this JSON (no other text):
-{{
-  "match_score": 75,
-  "overall_assessment": "Professional 2-3 sentence summary",
-  "strengths": ["strength 1", "strength 2", "strength 3"],
-  "weaknesses": ["weakness 1", "weakness 2", "weakness 3"],
-  "experience_score": 75,
-  "skills_score": 80,
-  "education_score": 70,
-  "recommendations": ["tip 1", "tip 2", "tip 3"]
-}}"""
-
-    try:
-        response = requests.post(
-            API_URL,
-            headers={"Content-Type": "application/json"},
-            json={
-                "inputs": prompt,
-                "parameters": {
-                    "max_new_tokens": 800,
-                    "temperature": 0.5,
-                    "return_full_text": False
-                }
-            },
-            timeout=90
-        )
+    # Detailed Scores
+    st.markdown('<div class="section-header">Detailed Analysis</div>', unsafe_allow_html=True)
+    
+    score_col1, score_col2, score_col3 = st.columns(3)
+    
+    with score_col1:
+        display_score(analysis['experience_alignment']['score'], "Experience")
+        st.markdown(f"<small>{analysis['experience_alignment']['summary']}</small>", unsafe_allow_html=True)
+    
+    with score_col2:
+        display_score(analysis['skills_alignment']['score'], "Skills")
+        st.markdown(f"<small>{analysis['skills_alignment']['summary']}</small>", unsafe_allow_html=True)
+    
+    with score_col3:
+        display_score(analysis['education_alignment']['score'], "Education")
+        st.markdown(f"<small>{analysis['education_alignment']['summary']}</small>", unsafe_allow_html=True)
+    
+    # Strengths & Weaknesses
+    st.markdown('<div class="section-header">Key Insights</div>', unsafe_allow_html=True)
+    
+    strength_col, weakness_col = st.columns(2)
+    
+    with strength_col:
+        st.markdown("#### Strengths")
+        for strength in analysis['strengths']:
+            st.markdown(f"<span class='strength'>✓</span> {strength}", unsafe_allow_html=True)
+    
+    with weakness_col:
+        st.markdown("#### Areas for Improvement")
+        for weakness in analysis['weaknesses']:
+            st.markdown(f"<span class='weakness'>✗</span> {weakness}", unsafe_allow_html=True)
+    
+    # Missing Keywords
+    if analysis['missing_skills']:
+        st.markdown('<div class="section-header">Missing Keywords</div>', unsafe_allow_html=True)
+        st.markdown("Important terms from job description not found in resume:")
         
-        if response.status_code == 200:
-            result = response.json()
-            
-            if isinstance(result, list) and len(result) > 0:
-                generated_text = result[0].get('generated_text', '')
-            elif isinstance(result, dict):
-                generated_text = result.get('generated_text', '')
-            else:
-                return None
-            
-            json_match = re.search(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', generated_text, re.DOTALL)
-            if json_match:
-                analysis_data = json.loads(json_match.group())
-                required = ['match_score', 'overall_assessment', 'strengths', 'weaknesses', 'recommendations']
-                if all(field in analysis_data for field in required):
-                    return analysis_data
+        cols = st.columns(min(3, len(analysis['missing_skills'])))
+        for idx, skill in enumerate(analysis['missing_skills']):
+            with cols[idx % len(cols)]:
+                st.markdown(f"<div style='background-color: #fef2f2; border-left: 4px solid #ef4444; padding: 1rem; margin: 0.5rem 0; border-radius: 4px; color: #1e293b;'><span style='color: #ef4444; font-weight: 500;'>⚠</span> {skill}</div>", unsafe_allow_html=True)
+    
+    # Matched Keywords
+    if analysis['keyword_matches']:
+        st.markdown('<div class="section-header">Matched Keywords</div>', unsafe_allow_html=True)
+        st.markdown("Keywords successfully included:")
         
-        return None
-    except:
-        return None
+        keyword_cols = st.columns(min(3, len(analysis['keyword_matches'])))
+        for idx, keyword in enumerate(analysis['keyword_matches']):
+            with keyword_cols[idx % len(keyword_cols)]:
+                st.markdown(f"<div style='background-color: #f0fdf4; border-left: 4px solid #10b981; padding: 1rem; margin: 0.5rem 0; border-radius: 4px; color: #1e293b;'><span style='color: #10b981; font-weight: 500;'>✓</span> {keyword}</div>", unsafe_allow_html=True)
 
+    # Semantic Match (only when RESUMEMATCH_SEMANTIC is on)
+    if analysis.get('semantic_match'):
+        semantic = analysis['semantic_match']
+        st.markdown('<div class="section-header">Semantic Match</div>', unsafe_allow_html=True)
+        display_score(semantic['match_score'], "Semantic Score")
+        with st.expander("Best-matching passages"):
+            for pair in semantic['best_pairs']:
+                st.markdown(f"**Job:** {pair['job_chunk']}")
+                st.markdown(f"**Resume:** {pair['resume_chunk']}")
+                st.caption(f"Similarity {pair['similarity']:.2f}")
 
-def rule_based_analysis(resume_text, job_description, keyword_analysis):
-    """Advanced rule-based analysis"""
+    # ATS Compatibility
+    st.markdown('<div class="section-header">ATS Compatibility</div>', unsafe_allow_html=True)
     
-    resume_lower = resume_text.lower()
-    job_lower = job_description.lower()
+    display_score(analysis['ats_compatibility']['score'], "ATS Score")
     
-    keyword_score = min(keyword_analysis['match_percentage'], 100)
+    ats_col1, ats_col2 = st.columns(2)
     
-    has_experience = any(word in resume_lower for word in ['experience', 'worked', 'employment', 'intern', 'analyst'])
-    has_education = any(word in resume_lower for word in ['education', 'degree', 'university', 'bachelor', 'master'])
-    has_skills = any(word in resume_lower for word in ['skills', 'technologies', 'proficient', 'python', 'sql'])
-    has_achievements = any(word in resume_lower for word in ['achieved', 'improved', 'increased', 'reduced', 'led', 'developed'])
-    has_metrics = bool(re.search(r'\d+%|\$\d+|\d+\+', resume_text))
+    with ats_col1:
+        st.markdown("#### Status")
+        for issue in analysis['ats_compatibility']['issues']:
+            st.markdown(f"- {issue}")
     
-    # Improved scoring
-    experience_score = 85 if (has_experience and has_achievements) else (70 if has_experience else 45)
-    education_score = 85 if has_education else 50
+    with ats_col2:
+        st.markdown("#### Recommendations")
+        for improvement in analysis['ats_compatibility']['improvements']:
+            st.markdown(f"- {improvement}")
     
-    # Better skills score based on keyword matching
-    matched_count = len(keyword_analysis['matched_keywords'])
-    if matched_count >= 15:
-        skills_score = 95
-    elif matched_count >= 10:
-        skills_score = 85
-    elif matched_count >= 7:
-        skills_score = 75
-    elif matched_count >= 5:
-        skills_score = 65
-    else:
-        skills_score = max(int(keyword_score * 0.8), 40)
+    # Recommendations
+    st.markdown('<div class="section-header">Action Items</div>', unsafe_allow_html=True)
     
-    if has_metrics:
-        experience_score = min(experience_score + 10, 100)
+    for idx, rec in enumerate(analysis['recommendations'], 1):
+        st.markdown(f"<div style='background-color: #f8fafc; border-left: 4px solid #2563eb; padding: 1rem; margin: 0.5rem 0; border-radius: 4px; color: #1e293b;'><strong>{idx}.</strong> {rec}</div>", unsafe_allow_html=True)
     
-    # Recalculated overall score with better weights
-    overall_score = int(
-        (keyword_score * 0.35) + 
-        (experience_score * 0.30) + 
-        (skills_score * 0.25) + 
-        (education_score * 0.10)
-    )
+    # Download
+    st.markdown("---")
     
-    strengths = []
-    if len(keyword_analysis['matched_keywords']) >= 10:
-        strengths.append(f"Excellent keyword alignment with {len(keyword_analysis['matched_keywords'])} key terms")
-    elif len(keyword_analysis['matched_keywords']) >= 7:
-        strengths.append(f"Strong keyword coverage with {len(keyword_analysis['matched_keywords'])} relevant terms")
-    elif len(keyword_analysis['matched_keywords']) >= 5:
-        strengths.append(f"Good keyword coverage with {len(keyword_analysis['matched_keywords'])} relevant terms")
-    
-    if has_experience and has_achievements:
-        strengths.append("Strong track record with documented achievements")
-    elif has_experience:
-        strengths.append("Relevant work experience clearly presented")
-    
-    if has_metrics:
-        strengths.append("Quantified accomplishments with specific metrics")
-    
-    if has_skills:
-        strengths.append("Technical skills clearly highlighted")
-    
-    if len(strengths) < 3:
-        strengths.append("Resume is well-formatted and professional")
-    
-    weaknesses = []
-    missing_count = len(keyword_analysis['missing_keywords'])
-    
-    if missing_count >= 10:
-        weaknesses.append(f"Missing {missing_count} important technical terms from job posting")
-    elif missing_count >= 7:
-        weaknesses.append(f"Could incorporate {missing_count} additional relevant keywords")
-    elif missing_count >= 4:
-        weaknesses.append(f"Consider adding {missing_count} more technical terms from job description")
-    
-    if not has_metrics:
-        weaknesses.append("Add quantifiable achievements with numbers and percentages")
-    
-    if not has_achievements:
-        weaknesses.append("Include more action verbs and accomplishments")
-    
-    if keyword_score < 40:
-        weaknesses.append("Needs significantly better alignment with job requirements")
-    elif keyword_score < 60:
-        weaknesses.append("Could improve keyword alignment with job posting")
-    
-    if len(weaknesses) < 3:
-        weaknesses.append("Consider tailoring resume more specifically to this role")
-    
-    recommendations = []
-    if len(keyword_analysis['missing_keywords']) > 0 and len(keyword_analysis['missing_keywords']) <= 10:
-        top = ', '.join(keyword_analysis['missing_keywords'][:3])
-        recommendations.append(f"Incorporate these technical terms if applicable: {top}")
-    elif len(keyword_analysis['missing_keywords']) > 10:
-        recommendations.append(f"Add more technical keywords from the job description to improve ATS matching")
-    
-    if not has_metrics:
-        recommendations.append("Add specific numbers and percentages to quantify impact")
-    else:
-        recommendations.append("Expand quantifiable results across all experience sections")
+    report = {
+        "date": datetime.now().isoformat(),
+        "file": file_name,
+        "analysis": analysis
+    }
     
-    if keyword_score < 60:
-        recommendations.append("Mirror the job description's technical terminology in your resume")
-    else:
-        recommendations.append("Emphasize most relevant technical experience in the top section")
-    
-    if overall_score >= 80:
-        assessment = "Excellent match. Strong alignment with job requirements and relevant qualifications."
-    elif overall_score >= 70:
-        assessment = "Very good match. Your background aligns well with most key requirements."
-    elif overall_score >= 60:
-        assessment = "Good match. Solid qualifications with room for targeted optimization."
-    elif overall_score >= 50:
-        assessment = "Moderate match. Relevant elements present but needs better highlighting of applicable skills."
+    st.download_button(
+        label="Download Report (JSON)",
+        data=json.dumps(report, indent=2),
+        file_name=f"resume_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+        mime="application/json",
+        key=f"download_{source}"
+    )
+
+
+def poll_queued_analysis(inputs_key, task_id, file_name):
+    """Show a queued analysis' progress, or its result once a worker is done
+
+    While the task is pending this reruns the script every
+    QUEUE_POLL_SECONDS, so no script thread waits on the AI call itself.
+    """
+    task = get_default_queue().status(task_id)
+    if task is None or task['status'] == "failed":
+        del st.session_state['task']
+        st.error(task['error'] if task else "Analysis was lost. Please try again.")
+        return
+    if task['status'] == "done":
+        del st.session_state['task']
+        st.session_state['analysis'] = (inputs_key, task['result'], file_name)
+        display_analysis(task['result'], file_name)
+        return
+    if task['status'] == "queued":
+        st.info(f"Waiting for an analysis worker ({task['position']} ahead in the queue)")
     else:
-        assessment = "Fair match. Consider significantly tailoring resume to emphasize transferable technical skills."
-    
-    return {
-        'match_score': overall_score,
-        'overall_assessment': assessment,
-        'strengths': strengths[:3],
-        'weaknesses': weaknesses[:3],
-        'experience_score': experience_score,
-        'skills_score': skills_score,
-        'education_score': education_score,
-        'recommendations': recommendations[:3]
-    }
+        st.info("Analyzing... AI analysis can take 30-60 seconds")
+    time.sleep(config.QUEUE_POLL_SECONDS)
+    st.rerun()
 
 
-def analyze_resume(resume_text, job_description):
-    """Main analysis - tries FREE AI first, uses rule-based as backup"""
+def score_archive(uploaded_file, job_description):
+    """Score every resume in an uploaded ZIP; returns (records, errors) or None"""
+    try:
+        archive = ResumeArchive(uploaded_file.getvalue())
+    except ArchiveError as e:
+        st.error(str(e))
+        return None
     
-    with st.spinner("Analyzing keywords..."):
-        keyword_analysis = calculate_keyword_match(resume_text, job_description)
+    records = []
+    progress = st.empty()
+    job_profile = job_profile_for(job_description)
+    with archive, metrics.timed("end_to_end"):
+        for record in score_members(archive, job_description, job_profile=job_profile):
+            records.append(record)
+            progress.info(f"Scored {len(records)} resumes...")
+    progress.empty()
+    metrics.write_textfile()
+    errors = [{"File": name, "Error": message} for name, message in archive.errors]
+    errors += [{"File": record['file'], "Error": record['error']} for record in records if 'error' in record]
+    return [record for record in records if 'analysis' in record], errors
+
+
+def display_archive_results(records, errors, file_name):
+    """Resumes from a ZIP ranked by match score, with the files that failed"""
+    ranked = sorted(records, key=lambda record: (-record['analysis']['match_score'], record['file']))
+    
+    st.markdown('<div class="section-header">Ranked Resumes</div>', unsafe_allow_html=True)
+    if ranked:
+        st.dataframe(
+            [
+                {
+                    "Rank": rank,
+                    "File": record['file'],
+                    "Match Score": record['analysis']['match_score'],
+                    "ATS Score": record['analysis']['ats_compatibility']['score'],
+                    "Matched Keywords": ", ".join(record['analysis']['keyword_matches']),
+                    "Missing Keywords": ", ".join(record['analysis']['missing_skills'])
+                }
+                for rank, record in enumerate(ranked, 1)
+            ],
+            use_container_width=True,
+            hide_index=True
+        )
+    else:
+        st.warning("No resume in the archive could be scored.")
     
-    st.info("Attempting AI analysis... (30-60 seconds)")
-    ai_analysis = analyze_with_free_ai(resume_text, job_description)
+    if errors:
+        with st.expander(f"{len(errors)} files could not be scored"):
+            st.dataframe(errors, use_container_width=True, hide_index=True)
     
-    if ai_analysis:
-        st.success("AI analysis complete!")
-        analysis = ai_analysis
-        analysis['keyword_matches'] = keyword_analysis['matched_keywords']
-        analysis['missing_skills'] = keyword_analysis['missing_keywords']
-        
-        # FIXED: Better ATS calculation based on keyword matching
-        base_ats = keyword_analysis['match_percentage']
-        
-        # Bonus points for good resume structure
-        resume_lower = resume_text.lower()
-        ats_bonus = 0
-        if 'experience' in resume_lower or 'work' in resume_lower:
-            ats_bonus += 5
-        if 'education' in resume_lower or 'degree' in resume_lower:
-            ats_bonus += 5
-        if 'skills' in resume_lower:
-            ats_bonus += 5
-        if bool(re.search(r'\d+%|\d+ years|\d+\+', resume_text)):
-            ats_bonus += 5
-        
-        ats_score = min(int(base_ats + ats_bonus), 100)
-        
-        if ats_score < 70:
-            ats_issues = ["Low keyword density", "May not pass automated screening"]
-            ats_improvements = ["Add more relevant keywords", "Use standard section headings"]
-        else:
-            ats_issues = ["Good keyword coverage"]
-            ats_improvements = ["Continue using industry terminology", "Maintain clear structure"]
-        
-        analysis['ats_compatibility'] = {
-            'score': ats_score,
-            'issues': ats_issues,
-            'improvements': ats_improvements
-        }
-        
-        analysis['experience_alignment'] = {
-            'score': analysis.get('experience_score', 70),
-            'summary': 'Based on work history'
-        }
-        analysis['skills_alignment'] = {
-            'score': analysis.get('skills_score', 70),
-            'summary': f'Matched {len(keyword_analysis["matched_keywords"])} skills'
-        }
-        analysis['education_alignment'] = {
-            'score': analysis.get('education_score', 70),
-            'summary': 'Based on education'
-        }
-        
-        return analysis
-    else:
-        st.info("Using advanced keyword analysis")
-        analysis = rule_based_analysis(resume_text, job_description, keyword_analysis)
-        
-        analysis['keyword_matches'] = keyword_analysis['matched_keywords']
-        analysis['missing_skills'] = keyword_analysis['missing_keywords']
-        
-        # FIXED: Better ATS calculation
-        base_ats = keyword_analysis['match_percentage']
-        
-        # Bonus points for good resume structure
-        resume_lower = resume_text.lower()
-        ats_bonus = 0
-        if 'experience' in resume_lower or 'work' in resume_lower:
-            ats_bonus += 5
-        if 'education' in resume_lower or 'degree' in resume_lower:
-            ats_bonus += 5
-        if 'skills' in resume_lower:
-            ats_bonus += 5
-        if bool(re.search(r'\d+%|\d+ years|\d+\+', resume_text)):
-            ats_bonus += 5
-        
-        ats_score = min(int(base_ats + ats_bonus), 100)
-        
-        if ats_score < 60:
-            ats_issues = ["Limited keyword optimization", "May struggle with ATS"]
-            ats_improvements = ["Increase keyword density", "Mirror job description terms", "Use standard headers"]
-        elif ats_score < 75:
-            ats_issues = ["Moderate ATS compatibility"]
-            ats_improvements = ["Add more industry keywords", "Use bullet points"]
-        else:
-            ats_issues = ["Strong ATS compatibility"]
-            ats_improvements = ["Maintain keyword strategy", "Keep clear formatting"]
-        
-        analysis['ats_compatibility'] = {
-            'score': ats_score,
-            'issues': ats_issues,
-            'improvements': ats_improvements
-        }
-        
-        analysis['experience_alignment'] = {
-            'score': analysis['experience_score'],
-            'summary': 'Based on work history'
-        }
-        analysis['skills_alignment'] = {
-            'score': analysis['skills_score'],
-            'summary': f'{len(keyword_analysis["matched_keywords"])} matching keywords'
-        }
-        analysis['education_alignment'] = {
-            'score': analysis['education_score'],
-            'summary': 'Based on education'
-        }
-        
-        return analysis
+    st.download_button(
+        label="Download Results (JSONL)",
+        data="".join(json.dumps(record) + "\n" for record in ranked),
+        file_name=f"{file_name.rsplit('.', 1)[0]}_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl",
+        mime="application/jsonl"
+    )
 
 
-def display_score(score, label):
-    """Display score with color"""
-    if score >= 80:
-        color = "#10b981"
-    elif score >= 60:
-        color = "#f59e0b"
+def rank_jobs_for_resume(uploaded_file, jobs_file, jobs_text):
+    """Rank every submitted job description for the uploaded resume"""
+    if not uploaded_file:
+        st.error("Please upload a resume first.")
+        return
+    
+    if uploaded_file.name.lower().endswith('.zip'):
+        st.error("Upload a single resume to rank jobs; ZIP archives are scored in Single job mode.")
+        return
+    
+    if jobs_file:
+        data, filename = jobs_file.getvalue(), jobs_file.name
     else:
-        color = "#ef4444"
+        data, filename = (jobs_text or "").encode('utf-8'), "jobs.txt"
+    job_profiles = cached_job_profiles(file_digest(data), filename, data)
+    if not job_profiles:
+        st.error("Please provide at least one job description.")
+        return
+    
+    with st.spinner("Extracting text..."):
+        resume_text, error = extract_resume_text(uploaded_file)
+    if error:
+        st.error(error['message'])
+        return
+    
+    results = rank_jobs(resume_text, job_profiles)
+    
+    st.markdown("## Best Matching Jobs")
+    st.dataframe(
+        [
+            {
+                "Rank": rank,
+                "Job": result['title'],
+                "Match Score": result['match_score'],
+                "Keyword Match": f"{result['match_percentage']:.0f}%",
+                "Matched Keywords": ", ".join(result['matched_keywords']),
+                "Missing Keywords": ", ".join(result['missing_keywords'])
+            }
+            for rank, result in enumerate(results, 1)
+        ],
+        use_container_width=True,
+        hide_index=True
+    )
     
-    st.markdown(f"""
-    <div style="background-color: {color}; color: white; padding: 1.5rem; 
-                border-radius: 8px; text-align: center; margin: 1rem 0;">
-        <div style="font-size: 3rem; font-weight: bold;">{score}%</div>
-        <div style="font-size: 1.1rem; opacity: 0.9;">{label}</div>
-    </div>
-    """, unsafe_allow_html=True)
+    st.download_button(
+        label="Download Ranking (JSON)",
+        data=json.dumps({"date": datetime.now().isoformat(), "file": uploaded_file.name, "jobs": results}, indent=2),
+        file_name=f"job_ranking_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+        mime="application/json"
+    )
 
 
 def main():
@@ -619,6 +522,8 @@ def main():
     
     # Sidebar
     with st.sidebar:
+        mode = st.radio("Mode", ["Single job", "Multiple jobs"], horizontal=True)
+        
         st.markdown(f"### About {APP_NAME}")
         st.markdown("""
         Professional resume analysis using advanced AI:
@@ -635,7 +540,7 @@ def main():
         st.markdown("---")
         st.markdown("### How It Works")
         st.markdown("""
-        1. Upload resume (PDF or DOCX)
+        1. Upload resume (PDF or DOCX), or a ZIP of resumes
         2. Paste job description
         3. Click 'Analyze Resume'
         4. Review insights
@@ -649,6 +554,10 @@ def main():
         No API keys.
         No costs.
         """)
+        
+        if config.DEBUG_PANEL:
+            with st.expander("Debug: pipeline metrics"):
+                st.json(metrics.snapshot())
     
     # Main content
     col1, col2 = st.columns([1, 1])
@@ -657,8 +566,8 @@ def main():
         st.markdown('<div class="section-header">Resume Upload</div>', unsafe_allow_html=True)
         uploaded_file = st.file_uploader(
             "Upload your resume",
-            type=['pdf', 'docx'],
-            help="Supported: PDF, DOCX"
+            type=['pdf', 'docx', 'zip'],
+            help="Supported: PDF, DOCX, or a ZIP of them to score and rank every resume"
         )
         
         if uploaded_file:
@@ -666,15 +575,39 @@ def main():
             st.text(f"Size: {uploaded_file.size / 1024:.2f} KB")
     
     with col2:
-        st.markdown('<div class="section-header">Job Description</div>', unsafe_allow_html=True)
-        job_description = st.text_area(
-            "Paste job description",
-            height=200,
-            placeholder="Paste the complete job description..."
-        )
+        if mode == "Multiple jobs":
+            st.markdown('<div class="section-header">Job Descriptions</div>', unsafe_allow_html=True)
+            jobs_file = st.file_uploader(
+                "Upload job descriptions",
+                type=['csv', 'json', 'jsonl', 'txt'],
+                help="CSV/JSON with id, title and description fields, or text with jobs separated by ---"
+            )
+            jobs_text = st.text_area(
+                "Or paste job descriptions",
+                height=200,
+                placeholder="Paste job descriptions separated by a line containing only ---"
+            )
+        else:
+            st.markdown('<div class="section-header">Job Description</div>', unsafe_allow_html=True)
+            job_description = st.text_area(
+                "Paste job description",
+                height=200,
+                placeholder="Paste the complete job description..."
+            )
     
     st.markdown("---")
     
+    if mode == "Multiple jobs":
+        if st.button("Rank Jobs", type="primary"):
+            rank_jobs_for_resume(uploaded_file, jobs_file, jobs_text)
+        return
+    
+    # Hashes of the current inputs; a stored analysis is only shown again
+    # while both still match
+    inputs_key = None
+    if uploaded_file and job_description:
+        inputs_key = (file_digest(uploaded_file.getvalue()), file_digest(job_description.encode('utf-8')))
+    
     if st.button("Analyze Resume", type="primary"):
         if not uploaded_file:
             st.error("Please upload a resume first.")
@@ -684,127 +617,79 @@ def main():
             st.error("Please provide a complete job description (min 50 characters).")
             return
         
+        if uploaded_file.name.lower().endswith('.zip'):
+            results = score_archive(uploaded_file, job_description)
+            if results:
+                st.session_state['archive_results'] = (inputs_key, *results, uploaded_file.name)
+                display_archive_results(*results, uploaded_file.name)
+            return
+        
         # Extract text
         with st.spinner("Extracting text..."):
-            if uploaded_file.type == "application/pdf":
-                resume_text = extract_text_from_pdf(uploaded_file)
-            else:
-                resume_text = extract_text_from_docx(uploaded_file)
-            
-            if not resume_text or len(resume_text.strip()) < 100:
-                st.error("Could not extract text. Ensure file contains readable text.")
-                return
+            resume_text, error = extract_resume_text(uploaded_file)
+        if error:
+            st.error(error['message'])
+            return
         
         # Analyze
-        analysis = analyze_resume(resume_text, job_description)
+        if config.QUEUE_PATH:
+            task_id = get_default_queue().submit(resume_text, job_description)
+            st.session_state['task'] = (inputs_key, task_id, uploaded_file.name)
+            poll_queued_analysis(inputs_key, task_id, uploaded_file.name)
+            return
+
+        if config.AI_BUDGET_SECONDS > 0:
+            results = st.empty()
+
+            def show_result(analysis, source):
+                if source == "ai":
+                    st.success("AI analysis complete!")
+                else:
+                    st.info(f"Showing keyword analysis; upgrading to AI analysis if it finishes within {config.AI_BUDGET_SECONDS:g} seconds")
+                with results.container(), metrics.timed("rendering"):
+                    display_analysis(analysis, uploaded_file.name, source)
+
+            with metrics.timed("end_to_end"):
+                analysis = analyze_resume_with_budget(resume_text, job_description, config.AI_BUDGET_SECONDS,
+                                                      on_result=show_result,
+                                                      job_profile=job_profile_for(job_description))
+            st.session_state['analysis'] = (inputs_key, analysis, uploaded_file.name)
+            metrics.write_textfile()
+            return
+
+        with metrics.timed("end_to_end"), st.spinner("Analyzing... AI analysis can take 30-60 seconds"):
+            analysis, messages = cached_analysis(inputs_key[0], inputs_key[1], resume_text, job_description)
         
         if not analysis:
             st.error("Analysis failed. Please try again.")
             return
         
-        # Results
-        st.markdown("---")
-        st.markdown("## Analysis Results")
-        
-        # Overall Score
-        st.markdown('<div class="section-header">Overall Match Score</div>', unsafe_allow_html=True)
-        display_score(analysis['match_score'], "Match Score")
-        
-        # Assessment
-        st.markdown('<div class="section-header">Overall Assessment</div>', unsafe_allow_html=True)
-        st.markdown(f"<div style='background-color: #f8fafc; border-left: 4px solid #2563eb; padding: 1rem; margin: 0.5rem 0; border-radius: 4px; color: #1e293b; font-size: 1.05rem;'>{analysis['overall_assessment']}</div>", unsafe_allow_html=True)
-        
-        # Detailed Scores
-        st.markdown('<div class="section-header">Detailed Analysis</div>', unsafe_allow_html=True)
-        
-        score_col1, score_col2, score_col3 = st.columns(3)
-        
-        with score_col1:
-            display_score(analysis['experience_alignment']['score'], "Experience")
-            st.markdown(f"<small>{analysis['experience_alignment']['summary']}</small>", unsafe_allow_html=True)
-        
-        with score_col2:
-            display_score(analysis['skills_alignment']['score'], "Skills")
-            st.markdown(f"<small>{analysis['skills_alignment']['summary']}</small>", unsafe_allow_html=True)
-        
-        with score_col3:
-            display_score(analysis['education_alignment']['score'], "Education")
-            st.markdown(f"<small>{analysis['education_alignment']['summary']}</small>", unsafe_allow_html=True)
-        
-        # Strengths & Weaknesses
-        st.markdown('<div class="section-header">Key Insights</div>', unsafe_allow_html=True)
-        
-        strength_col, weakness_col = st.columns(2)
-        
-        with strength_col:
-            st.markdown("#### Strengths")
-            for strength in analysis['strengths']:
-                st.markdown(f"<span class='strength'>✓</span> {strength}", unsafe_allow_html=True)
-        
-        with weakness_col:
-            st.markdown("#### Areas for Improvement")
-            for weakness in analysis['weaknesses']:
-                st.markdown(f"<span class='weakness'>✗</span> {weakness}", unsafe_allow_html=True)
-        
-        # Missing Keywords
-        if analysis['missing_skills']:
-            st.markdown('<div class="section-header">Missing Keywords</div>', unsafe_allow_html=True)
-            st.markdown("Important terms from job description not found in resume:")
-            
-            cols = st.columns(min(3, len(analysis['missing_skills'])))
-            for idx, skill in enumerate(analysis['missing_skills']):
-                with cols[idx % len(cols)]:
-                    st.markdown(f"<div style='background-color: #fef2f2; border-left: 4px solid #ef4444; padding: 1rem; margin: 0.5rem 0; border-radius: 4px; color: #1e293b;'><span style='color: #ef4444; font-weight: 500;'>⚠</span> {skill}</div>", unsafe_allow_html=True)
-        
-        # Matched Keywords
-        if analysis['keyword_matches']:
-            st.markdown('<div class="section-header">Matched Keywords</div>', unsafe_allow_html=True)
-            st.markdown("Keywords successfully included:")
-            
-            keyword_cols = st.columns(min(3, len(analysis['keyword_matches'])))
-            for idx, keyword in enumerate(analysis['keyword_matches']):
-                with keyword_cols[idx % len(keyword_cols)]:
-                    st.markdown(f"<div style='background-color: #f0fdf4; border-left: 4px solid #10b981; padding: 1rem; margin: 0.5rem 0; border-radius: 4px; color: #1e293b;'><span style='color: #10b981; font-weight: 500;'>✓</span> {keyword}</div>", unsafe_allow_html=True)
-        
-        # ATS Compatibility
-        st.markdown('<div class="section-header">ATS Compatibility</div>', unsafe_allow_html=True)
-        
-        display_score(analysis['ats_compatibility']['score'], "ATS Score")
-        
-        ats_col1, ats_col2 = st.columns(2)
-        
-        with ats_col1:
-            st.markdown("#### Status")
-            for issue in analysis['ats_compatibility']['issues']:
-                st.markdown(f"- {issue}")
-        
-        with ats_col2:
-            st.markdown("#### Recommendations")
-            for improvement in analysis['ats_compatibility']['improvements']:
-                st.markdown(f"- {improvement}")
-        
-        # Recommendations
-        st.markdown('<div class="section-header">Action Items</div>', unsafe_allow_html=True)
-        
-        for idx, rec in enumerate(analysis['recommendations'], 1):
-            st.markdown(f"<div style='background-color: #f8fafc; border-left: 4px solid #2563eb; padding: 1rem; margin: 0.5rem 0; border-radius: 4px; color: #1e293b;'><strong>{idx}.</strong> {rec}</div>", unsafe_allow_html=True)
-        
-        # Download
-        st.markdown("---")
-        
-        report = {
-            "date": datetime.now().isoformat(),
-            "file": uploaded_file.name,
-            "analysis": analysis
-        }
-        
-        st.download_button(
-            label="Download Report (JSON)",
-            data=json.dumps(report, indent=2),
-            file_name=f"resume_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-            mime="application/json"
-        )
+        if messages:
+            show_status(*messages[-1])
+        st.session_state['analysis'] = (inputs_key, analysis, uploaded_file.name)
+        with metrics.timed("rendering"):
+            display_analysis(analysis, uploaded_file.name)
+        metrics.write_textfile()
+        return
+    
+    # A queued analysis keeps polling until a worker has finished it
+    task = st.session_state.get('task')
+    if task and task[0] == inputs_key:
+        poll_queued_analysis(*task)
+        return
+    
+    # Any other rerun (a download click, a sidebar change) redraws the last
+    # analysis instead of dropping it, as long as the inputs are unchanged
+    stored = st.session_state.get('analysis')
+    if stored and stored[0] == inputs_key:
+        _, analysis, file_name = stored
+        display_analysis(analysis, file_name)
+    
+    stored = st.session_state.get('archive_results')
+    if stored and stored[0] == inputs_key:
+        display_archive_results(*stored[1:])
 
 
 if __name__ == "__main__":
+    metrics.start_http_server()
     main()
@@ -0,0 +1,80 @@
+"""Corpus store build, open, search and compact times on synthetic resumes.
+
+Usage:
+    python benchmarks/bench_corpus.py [--resumes 200000] [--terms 120] [--vocab 50000] [--dir /tmp/corpus]
+
+Each synthetic resume is a Counter of --terms keywords drawn from a Zipf-like
+vocabulary, so a few terms are in most resumes and most terms in few. Opening
+the store maps its files without reading them; the first search also loads
+the vocabulary.
+"""
+
+import argparse
+import itertools
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from resumematch.corpus import CorpusStore  # noqa: E402
+
+
+def synthetic_keywords(rng, vocabulary, cum_weights, terms):
+    return Counter(rng.choices(vocabulary, cum_weights=cum_weights, k=terms))
+
+
+def timed(func):
+    started = time.perf_counter()
+    result = func()
+    return result, (time.perf_counter() - started) * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--resumes', type=int, default=200000)
+    parser.add_argument('--terms', type=int, default=120)
+    parser.add_argument('--vocab', type=int, default=50000)
+    parser.add_argument('--dir', help="where to build the store (default: a temporary directory)")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(11)
+    vocabulary = [f"term{index}" for index in range(args.vocab)]
+    cum_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(args.vocab)))
+    path = args.dir or tempfile.mkdtemp(prefix='resumematch-corpus-')
+    shutil.rmtree(path, ignore_errors=True)
+
+    def build():
+        with CorpusStore(path, writable=True) as store:
+            for index in range(args.resumes):
+                store.add_keywords(f"resume-{index}", synthetic_keywords(rng, vocabulary, cum_weights, args.terms))
+
+    _, build_ms = timed(build)
+    size = sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(path) for name in names)
+    store, open_ms = timed(lambda: CorpusStore(path))
+    job = " ".join(rng.sample(vocabulary[:2000], 40))
+    _, first_ms = timed(lambda: store.search(job, top_k=20))
+    _, search_ms = timed(lambda: store.search(job, top_k=20))
+
+    writer = CorpusStore(path, writable=True)
+    for index in range(0, args.resumes, 10):
+        writer.remove(f"resume-{index}")
+    dropped, compact_ms = timed(writer.compact)
+
+    print(f"resumes={args.resumes} terms/resume={args.terms} vocab={args.vocab}")
+    print(f"{'build':<24} {build_ms:>10.0f} ms")
+    print(f"{'size on disk':<24} {size / (1024 * 1024):>10.1f} MB")
+    print(f"{'open':<24} {open_ms:>10.2f} ms")
+    print(f"{'first search':<24} {first_ms:>10.0f} ms")
+    print(f"{'search':<24} {search_ms:>10.0f} ms")
+    print(f"{'compact (10% removed)':<24} {compact_ms:>10.0f} ms  ({dropped} rows dropped)")
+    if not args.dir:
+        shutil.rmtree(path)
+
+
+if __name__ == "__main__":
+    main()
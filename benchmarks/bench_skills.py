@@ -0,0 +1,60 @@
+"""Skill taxonomy scan time as the dictionary grows.
+
+Usage:
+    python benchmarks/bench_skills.py [--docs 200] [--words 900] [--sizes 0 1000 10000 100000]
+
+The bundled taxonomy is padded with random synthetic skills of one to three
+words, compiled, and used to scan the same synthetic resumes. Compile time
+grows with the dictionary; scan time per document should stay flat.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_tokenizer import synthetic_resume, time_per_doc  # noqa: E402
+from benchmarks.corpus import SKILLS  # noqa: E402
+from resumematch.skills import DEFAULT_SKILLS_FILE, SkillTaxonomy  # noqa: E402
+
+
+def padded_skills(base, extra, rng):
+    skills = dict(base)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    for index in range(extra):
+        words = ["".join(rng.choice(letters) for _ in range(rng.randint(3, 9)))
+                 for _ in range(rng.randint(1, 3))]
+        skills[f"synthetic-{index}"] = [" ".join(words)]
+    return skills
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--docs', type=int, default=200)
+    parser.add_argument('--words', type=int, default=900)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[0, 1000, 10000, 100000])
+    args = parser.parse_args(argv)
+
+    rng = random.Random(7)
+    docs = []
+    for _ in range(args.docs):
+        doc = synthetic_resume(rng, args.words)
+        docs.append(doc + " " + " ".join(rng.sample(SKILLS, 12)))
+    base = SkillTaxonomy.from_file(DEFAULT_SKILLS_FILE).skills
+
+    print(f"docs={args.docs} words/doc={args.words}")
+    print(f"{'patterns':>10} {'compile ms':>12} {'scan us/doc':>12}")
+    for extra in args.sizes:
+        skills = padded_skills(base, extra, random.Random(extra))
+        started = time.perf_counter()
+        taxonomy = SkillTaxonomy(skills)
+        compile_ms = (time.perf_counter() - started) * 1000
+        scan_us = time_per_doc(taxonomy.find, docs)
+        print(f"{taxonomy.pattern_count:>10} {compile_ms:>12.1f} {scan_us:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
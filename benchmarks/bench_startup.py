@@ -0,0 +1,59 @@
+"""Cold-start import cost of the app and the scoring core.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 15]
+
+Each scenario runs in a fresh interpreter so nothing is already in
+sys.modules, and the median wall time of the imports is reported. The
+"eager" scenarios add the document and HTTP libraries that used to be
+imported at module load (pypdf, pdfplumber, python-docx, requests), which is
+what every cold start paid before they were made lazy. "first PDF" shows
+where that cost lands now: on the first extraction instead of at startup.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CORE = "import resumematch.cache, resumematch.multi_job, resumematch.metrics"
+EAGER = "import pypdf, pdfplumber, docx, requests"
+APP = "import streamlit, json, datetime; " + CORE
+
+# (name, untimed setup, timed statement)
+SCENARIOS = [
+    ("scoring core", "", CORE),
+    ("scoring core, eager", "", f"{EAGER}; {CORE}"),
+    ("app imports", "", APP),
+    ("app imports, eager", "", f"{EAGER}; {APP}"),
+    ("first PDF extraction",
+     "import io, random; from benchmarks.corpus import make_pdf, resume_pages; "
+     "data = make_pdf(resume_pages(random.Random(1), 1))",
+     "from resumematch.core import extract_text_from_pdf; extract_text_from_pdf(io.BytesIO(data))"),
+]
+
+
+def time_fresh(setup, statement):
+    """Seconds taken by statement in a new interpreter, after setup"""
+    code = f"import time\n{setup}\nt0 = time.perf_counter()\n{statement}\nprint(time.perf_counter() - t0)"
+    output = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True,
+                            text=True, check=True).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cold-start import benchmark")
+    parser.add_argument('--runs', type=int, default=15, help="fresh interpreters per scenario")
+    args = parser.parse_args(argv)
+
+    print(f"{'scenario':<24}{'median ms':>11}{'min ms':>9}")
+    for name, setup, statement in SCENARIOS:
+        samples = [time_fresh(setup, statement) for _ in range(args.runs)]
+        print(f"{name:<24}{statistics.median(samples) * 1000:>11.1f}{min(samples) * 1000:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Per-document cost of the legacy keyword/flag scans vs resumematch.tokenizer.
+
+Usage:
+    python benchmarks/bench_tokenizer.py [--docs 200] [--words 900]
+
+The "legacy" functions below are verbatim copies of what analyze_resume used
+to do per resume: extract_keywords with the stop list rebuilt per call, then
+rule_based_analysis and the ATS bonus each lowercasing and scanning the text
+again.
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from resumematch.tokenizer import Tokenizer  # noqa: E402
+
+
+def legacy_extract_keywords(text):
+    stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+                  'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'be',
+                  'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
+                  'should', 'may', 'might', 'can', 'this', 'that', 'these', 'those',
+                  'we', 'our', 'your', 'their', 'you', 'they', 'them', 'us', 'all',
+                  'who', 'what', 'when', 'where', 'which', 'how', 'why', 'any', 'some',
+                  'more', 'most', 'other', 'such', 'into', 'through', 'during', 'before',
+                  'after', 'above', 'below', 'between', 'under', 'again', 'further',
+                  'then', 'once', 'here', 'there', 'up', 'out', 'if', 'about', 'than',
+                  'also', 'very', 'too', 'can', 'just', 'dont', 'now', 'so', 'than',
+                  'work', 'working', 'worked', 'company', 'team', 'role', 'position',
+                  'job', 'career', 'opportunity', 'responsibilities', 'requirements',
+                  'qualifications', 'skills', 'knowledge', 'familiarity', 'understanding',
+                  'ability', 'strong', 'excellent', 'good', 'experience', 'years',
+                  'looking', 'seeking', 'required', 'preferred', 'plus', 'bonus',
+                  'etc', 'including', 'related', 'various', 'multiple', 'within'}
+
+    words = re.findall(r'\b[a-zA-Z][a-zA-Z0-9\.\-]*\b', text.lower())
+    keywords = [w for w in words if w not in stop_words and len(w) > 3 and not w.isdigit()]
+
+    from collections import Counter
+    return Counter(keywords)
+
+
+def legacy_profile(resume_text):
+    keywords = legacy_extract_keywords(resume_text)
+
+    resume_lower = resume_text.lower()
+    flags = [
+        any(word in resume_lower for word in ['experience', 'worked', 'employment', 'intern', 'analyst']),
+        any(word in resume_lower for word in ['education', 'degree', 'university', 'bachelor', 'master']),
+        any(word in resume_lower for word in ['skills', 'technologies', 'proficient', 'python', 'sql']),
+        any(word in resume_lower for word in ['achieved', 'improved', 'increased', 'reduced', 'led', 'developed']),
+        bool(re.search(r'\d+%|\$\d+|\d+\+', resume_text)),
+    ]
+
+    resume_lower = resume_text.lower()
+    flags += [
+        'experience' in resume_lower or 'work' in resume_lower,
+        'education' in resume_lower or 'degree' in resume_lower,
+        'skills' in resume_lower,
+        bool(re.search(r'\d+%|\d+ years|\d+\+', resume_text)),
+    ]
+    return keywords, flags
+
+
+COMMON = ("the and with for our team data python sql analysis reporting led improved "
+          "developed managed built designed delivered customers stakeholders project").split()
+
+
+def synthetic_resume(rng, words):
+    vocab = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(4, 11)))
+             for _ in range(400)]
+    out = ["Experience", "Senior Analyst, Example Corp"]
+    for _ in range(words):
+        roll = rng.random()
+        if roll < 0.45:
+            out.append(rng.choice(COMMON))
+        elif roll < 0.97:
+            out.append(rng.choice(vocab))
+        else:
+            out.append(f"{rng.randint(2, 95)}%")
+    out += ["Education", "Bachelor of Science, State University", "Skills", "Python, SQL, Tableau"]
+    return " ".join(out)
+
+
+def time_per_doc(func, docs, repeat=5):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for doc in docs:
+            func(doc)
+        best = min(best, time.perf_counter() - started)
+    return best / len(docs) * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--docs', type=int, default=200)
+    parser.add_argument('--words', type=int, default=900)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(7)
+    docs = [synthetic_resume(rng, args.words) for _ in range(args.docs)]
+    tokenizer = Tokenizer()
+
+    for doc in docs[:20]:
+        assert tokenizer.keywords(doc) == legacy_extract_keywords(doc)
+
+    legacy_us = time_per_doc(legacy_profile, docs)
+    new_us = time_per_doc(tokenizer.profile, docs)
+    print(f"docs={args.docs} words/doc={args.words}")
+    print(f"legacy keywords + flags : {legacy_us:8.1f} us/doc")
+    print(f"Tokenizer.profile       : {new_us:8.1f} us/doc")
+    print(f"speedup                 : {legacy_us / new_us:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""Deterministic synthetic corpus for the benchmarks.
+
+Resumes are written as both PDF and DOCX at several page counts, and job
+descriptions at several lengths. The PDF writer is a minimal hand-rolled one
+(Helvetica text only) so the benchmarks need nothing beyond the app's own
+requirements.
+"""
+
+import os
+import random
+
+SKILLS = (
+    "python sql java javascript typescript react node.js django flask spark hadoop airflow "
+    "kafka aws azure gcp docker kubernetes terraform ansible jenkins git linux tableau "
+    "power-bi excel pandas numpy scikit-learn tensorflow pytorch statistics forecasting "
+    "etl postgresql mysql mongodb redis graphql rest microservices agile scrum jira "
+    "salesforce sap figma photoshop seo analytics budgeting negotiation recruiting"
+).split()
+
+VERBS = ("led developed improved increased reduced built designed delivered managed "
+         "launched automated migrated analyzed optimized mentored owned shipped").split()
+
+FILLER = ("the and with for across our team data platform customers stakeholders project "
+          "reporting pipeline services quality process strategy product operations").split()
+
+SECTIONS = ["Summary", "Experience", "Projects", "Education", "Skills", "Certifications"]
+
+LINES_PER_PAGE = 48
+
+
+def _sentence(rng, words=12):
+    parts = [rng.choice(VERBS)]
+    for _ in range(words):
+        roll = rng.random()
+        if roll < 0.3:
+            parts.append(rng.choice(SKILLS))
+        elif roll < 0.93:
+            parts.append(rng.choice(FILLER))
+        elif roll < 0.97:
+            parts.append(f"{rng.randint(3, 95)}%")
+        else:
+            parts.append(f"${rng.randint(1, 900)}K")
+    return " ".join(parts)
+
+
+def resume_pages(rng, pages):
+    """List of pages, each a list of text lines"""
+    out = []
+    section = 0
+    for page in range(pages):
+        lines = []
+        if page == 0:
+            lines += ["Jordan Example", "jordan@example.com | 555-0100"]
+        while len(lines) < LINES_PER_PAGE:
+            if rng.random() < 0.12:
+                lines.append(SECTIONS[section % len(SECTIONS)])
+                section += 1
+            elif SECTIONS[(section - 1) % len(SECTIONS)] == "Education" and rng.random() < 0.5:
+                lines.append("Bachelor of Science, State University, 2016")
+            else:
+                lines.append("- " + _sentence(rng))
+        out.append(lines)
+    return out
+
+
+def job_description(rng, words):
+    parts = ["We are looking for an analyst with experience in"]
+    while len(parts) < words:
+        parts.append(_sentence(rng, 10) + ".")
+    return " ".join(parts)
+
+
+def _pdf_escape(line):
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_pdf(pages):
+    """Minimal PDF with one Helvetica text stream per page"""
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>"]
+    kids = " ".join(f"{4 + 2 * i} 0 R" for i in range(len(pages)))
+    objects.append(f"<< /Type /Pages /Kids [{kids}] /Count {len(pages)} >>".encode())
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    for i, lines in enumerate(pages):
+        objects.append((
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {5 + 2 * i} 0 R >>"
+        ).encode())
+        ops = ["BT /F1 9 Tf 40 760 Td 15 TL"]
+        ops += [f"({_pdf_escape(line)}) Tj T*" for line in lines]
+        ops.append("ET")
+        stream = "\n".join(ops).encode("latin-1", "replace")
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, obj in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n".encode() + obj + b"\nendobj\n"
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for offset in offsets:
+        out += f"{offset:010d} 00000 n \n".encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return bytes(out)
+
+
+def make_docx(pages, path):
+    from docx import Document
+
+    document = Document()
+    for page_number, lines in enumerate(pages):
+        if page_number:
+            document.add_page_break()
+        for line in lines:
+            document.add_paragraph(line)
+    document.save(path)
+
+
+def build_corpus(directory, resumes_per_size=5, page_counts=(1, 2, 4, 6),
+                 job_lengths=(60, 250, 700), seed=1234):
+    """Write the corpus under directory and return its manifest
+
+    The manifest maps "pdf"/"docx" to lists of (pages, path) and "jobs" to
+    (words, text) pairs. Files that already exist are reused.
+    """
+    rng = random.Random(seed)
+    os.makedirs(directory, exist_ok=True)
+    manifest = {'pdf': [], 'docx': [], 'jobs': []}
+    for pages in page_counts:
+        for index in range(resumes_per_size):
+            content = resume_pages(rng, pages)
+            stem = os.path.join(directory, f"resume_{pages}p_{index:02d}")
+            if not os.path.exists(stem + ".pdf"):
+                with open(stem + ".pdf", "wb") as f:
+                    f.write(make_pdf(content))
+            if not os.path.exists(stem + ".docx"):
+                make_docx(content, stem + ".docx")
+            manifest['pdf'].append((pages, stem + ".pdf"))
+            manifest['docx'].append((pages, stem + ".docx"))
+    for words in job_lengths:
+        manifest['jobs'].append((words, job_description(rng, words)))
+    return manifest
@@ -0,0 +1,193 @@
+"""Benchmark suite for extraction, keyword matching and end-to-end analysis.
+
+Usage:
+    python benchmarks/run.py                      # run everything, save results
+    python benchmarks/run.py --stages extract_keywords analyze_resume
+    python benchmarks/run.py --compare benchmarks/results/<old>.json
+
+Each stage is timed over the synthetic corpus from benchmarks/corpus.py and
+reported as throughput, p50/p95/p99 latency and peak traced memory. Peak
+memory comes from a separate tracemalloc pass, so tracing does not distort
+the timings. Results are written to benchmarks/results/ as JSON, named by
+time and git commit, for comparison across commits.
+
+The full analyze_resume pipeline runs with the AI call stubbed out to return
+a canned analysis, so it measures this code rather than the network.
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+from benchmarks.corpus import build_corpus  # noqa: E402
+from resumematch import core  # noqa: E402
+
+STUB_AI_ANALYSIS = {
+    "match_score": 75,
+    "overall_assessment": "Stubbed analysis for benchmarking.",
+    "strengths": ["a", "b", "c"],
+    "weaknesses": ["a", "b", "c"],
+    "experience_score": 75,
+    "skills_score": 80,
+    "education_score": 70,
+    "recommendations": ["a", "b", "c"]
+}
+
+
+def stub_ai(resume_text, job_description):
+    return dict(STUB_AI_ANALYSIS)
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def measure(cases, repeat):
+    """Time every case `repeat` times, then trace peak memory over one pass"""
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for func in cases:
+            t0 = time.perf_counter()
+            func()
+            latencies.append(time.perf_counter() - t0)
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    peak = 0
+    for func in cases:
+        tracemalloc.reset_peak()
+        func()
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+    tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        'calls': len(latencies),
+        'throughput_per_s': len(latencies) / elapsed if elapsed else 0.0,
+        'mean_ms': statistics.fmean(latencies) * 1000,
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p95_ms': percentile(latencies, 0.95) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+        'peak_memory_kb': peak / 1024
+    }
+
+
+def build_stages(manifest):
+    """name -> list of zero-argument callables, one per corpus item"""
+    pdf_bytes = []
+    for pages, path in manifest['pdf']:
+        with open(path, 'rb') as f:
+            pdf_bytes.append(f.read())
+    docx_bytes = []
+    for pages, path in manifest['docx']:
+        with open(path, 'rb') as f:
+            docx_bytes.append(f.read())
+
+    resume_texts = [core.extract_text_from_pdf(io.BytesIO(data)) for data in pdf_bytes]
+    jobs = [text for words, text in manifest['jobs']]
+    pairs = [(resume, job) for resume in resume_texts for job in jobs]
+
+    def keyword_analysis(resume, job):
+        return resume, job, core.calculate_keyword_match(resume, job)
+
+    prepared = [keyword_analysis(resume, job) for resume, job in pairs]
+
+    return {
+        'extract_text_from_pdf': [lambda d=data: core.extract_text_from_pdf(io.BytesIO(d)) for data in pdf_bytes],
+        'extract_text_from_docx': [lambda d=data: core.extract_text_from_docx(io.BytesIO(d)) for data in docx_bytes],
+        'extract_text_from_docx_python_docx': [
+            lambda d=data: core.extract_text_from_docx(io.BytesIO(d), mode='python-docx') for data in docx_bytes],
+        'extract_keywords': [lambda t=text: core.extract_keywords(t) for text in resume_texts + jobs],
+        'calculate_keyword_match': [lambda r=resume, j=job: core.calculate_keyword_match(r, j) for resume, job in pairs],
+        'rule_based_analysis': [lambda r=resume, j=job, k=ka: core.rule_based_analysis(r, j, k) for resume, job, ka in prepared],
+        'analyze_resume': [lambda r=resume, j=job: core.analyze_resume(r, j) for resume, job in pairs],
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=HERE,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def print_table(results, baseline=None):
+    header = f"{'stage':<36}{'calls':>7}{'ops/s':>11}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'peak KB':>10}"
+    if baseline:
+        header += f"{'p95 vs base':>13}"
+    print(header)
+    for name, stats in results.items():
+        line = (f"{name:<36}{stats['calls']:>7}{stats['throughput_per_s']:>11.1f}{stats['p50_ms']:>10.3f}"
+                f"{stats['p95_ms']:>10.3f}{stats['p99_ms']:>10.3f}{stats['peak_memory_kb']:>10.0f}")
+        if baseline and name in baseline:
+            old = baseline[name]['p95_ms']
+            change = (stats['p95_ms'] - old) / old * 100 if old else 0.0
+            line += f"{change:>+12.1f}%"
+        print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="ResumeMatch benchmark suite")
+    parser.add_argument('--stages', nargs='*', help="only run these stages")
+    parser.add_argument('--repeat', type=int, default=3, help="timed passes over the corpus per stage")
+    parser.add_argument('--resumes-per-size', type=int, default=5)
+    parser.add_argument('--corpus-dir', default=os.path.join(HERE, '.corpus'))
+    parser.add_argument('--results-dir', default=os.path.join(HERE, 'results'))
+    parser.add_argument('--compare', help="earlier results file to compare p95 latency against")
+    parser.add_argument('--no-save', action='store_true')
+    args = parser.parse_args(argv)
+
+    core.analyze_with_free_ai = stub_ai
+
+    corpus_dir = os.path.join(args.corpus_dir, f"n{args.resumes_per_size}")
+    manifest = build_corpus(corpus_dir, resumes_per_size=args.resumes_per_size)
+    stages = build_stages(manifest)
+    if args.stages:
+        unknown = set(args.stages) - set(stages)
+        if unknown:
+            parser.error(f"unknown stages: {', '.join(sorted(unknown))}")
+        stages = {name: cases for name, cases in stages.items() if name in args.stages}
+
+    results = {name: measure(cases, args.repeat) for name, cases in stages.items()}
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+    print_table(results, baseline)
+
+    if not args.no_save:
+        commit = git_commit()
+        os.makedirs(args.results_dir, exist_ok=True)
+        path = os.path.join(args.results_dir, f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{commit}.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'date': datetime.now().isoformat(),
+                'commit': commit,
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'repeat': args.repeat,
+                'resumes_per_size': args.resumes_per_size,
+                'results': results
+            }, f, indent=2)
+        print(f"\nSaved {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+"""ResumeMatch scoring core, importable without Streamlit."""
+
+from resumematch.core import (
+    ExtractionError,
+    analyze_resume,
+    analyze_with_free_ai,
+    calculate_ats_score,
+    calculate_keyword_match,
+    extract_keywords,
+    extract_text,
+    extract_text_from_docx,
+    extract_text_from_pdf,
+    match_keywords,
+    profile_text,
+    rule_based_analysis,
+)
+from resumematch.sections import ParsedResume, parse_resume
@@ -0,0 +1,146 @@
+"""Resumes read straight out of a ZIP archive.
+
+Applicant pools are usually exported as one ZIP of PDFs and DOCX files.
+``ResumeArchive`` walks the archive's members and yields each supported
+resume as ``(name, bytes)``, reading one member at a time into memory; nothing
+is unpacked to disk. Members are read with a size cap, so a member whose
+header understates its size cannot inflate past the limit, and the archive
+as a whole stops yielding once ARCHIVE_MAX_UNCOMPRESSED_BYTES have been read
+or ARCHIVE_MAX_FILES resumes taken.
+
+Problems with single members (an unsupported file, an encrypted or corrupt
+entry, a file over the size limit) are collected in ``errors`` as
+``(name, message)`` rather than raised, so one bad file does not stop the
+rest. Only an archive that cannot be opened at all raises ``ArchiveError``.
+
+``score_members`` scores a stream of members on a thread pool as they are
+read. Extraction itself runs in killable child processes (see
+resumematch.sandbox), so threads are enough to keep every core busy.
+"""
+
+import io
+import os
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from resumematch import config
+from resumematch.cache import extract_text_cached, file_digest
+from resumematch.core import ExtractionError, analyze_resume
+from resumematch.export import make_record
+
+SUPPORTED_EXTENSIONS = ('.pdf', '.docx')
+
+
+class ArchiveError(Exception):
+    """Raised when an upload is not a readable ZIP archive"""
+
+
+def _max_member_bytes(name):
+    return config.PDF_MAX_BYTES if name.lower().endswith('.pdf') else config.DOCX_MAX_BYTES
+
+
+def _ignored(name):
+    """Directories and the metadata files archivers add alongside the real ones"""
+    base = os.path.basename(name.rstrip('/'))
+    return name.endswith('/') or name.startswith('__MACOSX/') or base.startswith('.') or not base
+
+
+class ResumeArchive:
+    """Supported resumes in a ZIP archive, read one member at a time
+
+    ``file`` is a path, a binary file object or the archive's bytes.
+    """
+
+    def __init__(self, file, max_total_bytes=None, max_files=None):
+        if isinstance(file, (bytes, bytearray)):
+            file = io.BytesIO(file)
+        try:
+            self._zip = zipfile.ZipFile(file)
+        except (zipfile.BadZipFile, OSError) as e:
+            raise ArchiveError(f"Not a readable ZIP archive: {str(e)}") from e
+        self.max_total_bytes = max_total_bytes or config.ARCHIVE_MAX_UNCOMPRESSED_BYTES
+        self.max_files = max_files or config.ARCHIVE_MAX_FILES
+        self.errors = []
+        self.bytes_read = 0
+
+    def __iter__(self):
+        taken = 0
+        for info in self._zip.infolist():
+            name = info.filename
+            if _ignored(name):
+                continue
+            if not name.lower().endswith(SUPPORTED_EXTENSIONS):
+                self.errors.append((name, "Unsupported file type; only PDF and DOCX are read"))
+                continue
+            if taken >= self.max_files:
+                self.errors.append((name, f"Skipped: the archive holds more than {self.max_files} resumes"))
+                continue
+            remaining = self.max_total_bytes - self.bytes_read
+            if remaining <= 0 or info.file_size > remaining:
+                self.errors.append((name, f"Skipped: the archive expands past the "
+                                          f"{self.max_total_bytes // (1024 * 1024)} MB limit"))
+                continue
+            max_bytes = _max_member_bytes(name)
+            limit = min(max_bytes, remaining)
+            try:
+                with self._zip.open(info) as member:
+                    data = member.read(limit + 1)
+            except (zipfile.BadZipFile, RuntimeError, NotImplementedError, OSError, EOFError) as e:
+                # RuntimeError: encrypted; NotImplementedError: unknown compression
+                self.errors.append((name, f"Could not read from the archive: {str(e)}"))
+                continue
+            self.bytes_read += len(data)
+            if len(data) > max_bytes:
+                self.errors.append((name, f"File is larger than the {max_bytes // (1024 * 1024)} MB limit"))
+                continue
+            if len(data) > limit:
+                self.errors.append((name, f"Skipped: the archive expands past the "
+                                          f"{self.max_total_bytes // (1024 * 1024)} MB limit"))
+                continue
+            taken += 1
+            yield name, data
+
+    def close(self):
+        self._zip.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def score_member(name, data, job_description, use_ai=False, job_profile=None):
+    """Report record for one resume given as bytes; errors are recorded, not raised"""
+    file_hash = file_digest(data)
+    try:
+        resume_text = extract_text_cached(data, name)
+        if not resume_text or len(resume_text.strip()) < 100:
+            return make_record(name, file_hash, error="Could not extract text. Ensure file contains readable text.")
+        analysis = analyze_resume(resume_text, job_description, use_ai=use_ai, job_profile=job_profile)
+        return make_record(name, file_hash, analysis)
+    except ExtractionError as e:
+        return make_record(name, file_hash, error=str(e))
+    except Exception as e:
+        return make_record(name, file_hash, error=f"Analysis failed: {str(e)}")
+
+
+def score_members(members, job_description, workers=None, use_ai=False, job_profile=None):
+    """Score (name, bytes) members on a thread pool, yielding records as they finish
+
+    At most two members per worker are held in memory at a time; the next
+    one is read only as earlier ones complete.
+    """
+    workers = workers or config.ARCHIVE_WORKERS
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='resumematch-archive') as executor:
+        pending = set()
+        for name, data in members:
+            pending.add(executor.submit(score_member, name, data, job_description, use_ai, job_profile))
+            if len(pending) >= workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
@@ -0,0 +1,337 @@
+"""Headless batch scoring: one job description against a directory of resumes.
+
+Usage:
+    python -m resumematch.batch JOB.txt RESUME_DIR -o results.jsonl -w 16
+    python -m resumematch.batch JOB.txt resumes.zip -o results.jsonl
+
+Resumes are extracted and scored on a process pool and each result is written
+to the output as soon as it completes: one JSON object per line, or one CSV
+row when the output ends in ``.csv``. ``--resume`` continues an interrupted
+run, skipping files whose content hash is already scored in the output;
+files that failed are tried again. With ``--ranked`` a second JSONL file with
+the resumes ordered by match score is written once the run finishes.
+
+RESUME_DIR may also be a ZIP archive. Its members are read one at a time
+straight into the pool without unpacking to disk (see resumematch.archive);
+members that cannot be read are written as error records named
+``ARCHIVE/member``.
+
+``--dedup`` flags near-duplicate resumes (resubmissions, light edits) with
+MinHash signatures as they are extracted; a flagged copy is written with the
+analysis of the resume it duplicates, plus ``duplicate_of`` and
+``similarity``, instead of being scored again.
+"""
+
+import argparse
+import itertools
+import json
+import os
+import sys
+from multiprocessing import Pool
+
+from resumematch import metrics
+from resumematch.cache import extract_text_cached, file_digest
+from resumematch.core import ExtractionError, analyze_resume, extract_keywords
+from resumematch.export import make_record, open_report
+from resumematch.multi_job import build_job_profile
+
+SUPPORTED_EXTENSIONS = ('.pdf', '.docx')
+
+# Set in each worker by _init_worker so the job text and the hashes to skip
+# are shipped once per process rather than once per task, and the job is
+# tokenized once per process rather than once per resume.
+_job_description = None
+_job_profile = None
+_use_ai = False
+_skip_hashes = frozenset()
+_hasher = None
+
+# Resumes extracted and checked for duplicates per window, per worker
+DEDUP_WINDOW_PER_WORKER = 32
+
+
+def iter_resume_paths(root):
+    """Yield resume files under root in a stable order"""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if filename.lower().endswith(SUPPORTED_EXTENSIONS):
+                yield os.path.join(dirpath, filename)
+
+
+def _init_worker(job_description, use_ai, skip_hashes=frozenset(), dedup=False, job_profile=None):
+    global _job_description, _job_profile, _use_ai, _skip_hashes, _hasher
+    _job_description = job_description
+    _job_profile = job_profile or build_job_profile('job', job_description)
+    _use_ai = use_ai
+    _skip_hashes = skip_hashes
+    if dedup:
+        from resumematch.dedup import MinHasher
+
+        _hasher = MinHasher()
+
+
+def source_name(source):
+    """Report name of a resume path or (name, bytes) archive member"""
+    return source if isinstance(source, str) else source[0]
+
+
+def _read_text(source):
+    """(file_hash, resume_text, error record); a None hash means skip the file
+
+    source is a path or a (name, bytes) member read from an archive.
+    """
+    if isinstance(source, str):
+        path = source
+        with open(path, 'rb') as f:
+            data = f.read()
+    else:
+        path, data = source
+    file_hash = file_digest(data)
+    if file_hash in _skip_hashes:
+        return None, None, None
+    resume_text = extract_text_cached(data, path)
+    if not resume_text or len(resume_text.strip()) < 100:
+        return file_hash, None, make_record(
+            path, file_hash, error="Could not extract text. Ensure file contains readable text.")
+    return file_hash, resume_text, None
+
+
+def _score_text(path, file_hash, resume_text):
+    try:
+        analysis = analyze_resume(resume_text, _job_description, use_ai=_use_ai, job_profile=_job_profile)
+        return make_record(path, file_hash, analysis)
+    except Exception as e:
+        return make_record(path, file_hash, error=f"Analysis failed: {str(e)}")
+
+
+def score_file(source):
+    """Extract and score one resume (a path or (name, bytes)) into a report record
+
+    Errors are recorded, not raised. Returns None for files whose hash is
+    already in the report being resumed.
+    """
+    path = source_name(source)
+    file_hash = None
+    try:
+        file_hash, resume_text, error = _read_text(source)
+    except ExtractionError as e:
+        return make_record(path, file_hash, error=str(e))
+    except Exception as e:
+        return make_record(path, file_hash, error=f"Analysis failed: {str(e)}")
+    if file_hash is None or error is not None:
+        return error
+    return _score_text(path, file_hash, resume_text)
+
+
+def prepare_file(source):
+    """(path, file_hash, text, MinHash signature) for a dedup run
+
+    Returns an error record instead when the text cannot be extracted, and
+    None for files already in the report being resumed.
+    """
+    path = source_name(source)
+    file_hash = None
+    try:
+        file_hash, resume_text, error = _read_text(source)
+    except ExtractionError as e:
+        return make_record(path, file_hash, error=str(e))
+    except Exception as e:
+        return make_record(path, file_hash, error=f"Analysis failed: {str(e)}")
+    if file_hash is None or error is not None:
+        return error
+    return path, file_hash, resume_text, _hasher.signature(resume_text)
+
+
+def score_prepared(task):
+    """(doc_id, record) for a (doc_id, path, file_hash, text) task"""
+    doc_id, path, file_hash, resume_text = task
+    return doc_id, _score_text(path, file_hash, resume_text)
+
+
+def keywords_for_file(path):
+    """(path, keyword Counter, error) for one resume, for pool.imap
+
+    Errors are returned, not raised, so one unreadable file is reported and
+    skipped instead of ending the run.
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+        return path, extract_keywords(extract_text_cached(data, path)), None
+    except ExtractionError as e:
+        return path, None, str(e)
+    except Exception as e:
+        return path, None, f"Extraction failed: {str(e)}"
+
+
+def run_batch(job_description, paths, writer, workers=None, use_ai=False, chunksize=8, dedup_threshold=None,
+              job_profile=None):
+    """Score paths against job_description, streaming records to a report writer
+
+    Files already in writer.completed are skipped. With dedup_threshold,
+    near-duplicates at that estimated similarity reuse an earlier analysis
+    (see _run_deduplicated). job_profile is the job's stored JobProfile, if
+    it has one; otherwise each worker builds it. Returns the number of
+    resumes written in this run.
+    """
+    skip_hashes = frozenset(writer.completed)
+    dedup = dedup_threshold is not None
+    scored = 0
+    initargs = (job_description, use_ai, skip_hashes, dedup, job_profile)
+    with Pool(workers, initializer=_init_worker, initargs=initargs) as pool:
+        if dedup:
+            window = (workers or os.cpu_count() or 1) * DEDUP_WINDOW_PER_WORKER
+            return _run_deduplicated(pool, paths, writer, dedup_threshold, window, chunksize)
+        for record in pool.imap_unordered(score_file, paths, chunksize=chunksize):
+            if record is None:
+                continue
+            writer.write(record)
+            scored += 1
+    return scored
+
+
+def _run_deduplicated(pool, paths, writer, threshold, window, chunksize):
+    """Score paths a window at a time, reusing analyses for near-duplicates
+
+    Each window is extracted and signed on the pool, then checked against
+    the index in the parent, so a duplicate is caught whichever window its
+    original was in. Only new resumes are scored; duplicates are written
+    afterwards with their original's analysis. Memory is bounded by the
+    window, and the index lives in a temporary SQLite file.
+    """
+    from resumematch.dedup import DedupIndex
+
+    index = DedupIndex(threshold=threshold)
+    paths = iter(paths)
+    scored = 0
+    try:
+        while True:
+            batch = list(itertools.islice(paths, window))
+            if not batch:
+                break
+            originals, duplicates = [], []
+            # In order, so the first copy by path is the one that gets scored
+            for item in pool.imap(prepare_file, batch, chunksize=chunksize):
+                if item is None:
+                    continue
+                if isinstance(item, dict):
+                    writer.write(item)
+                    scored += 1
+                    continue
+                path, file_hash, resume_text, signature = item
+                doc_id, duplicate = index.check(path, signature)
+                if duplicate is None:
+                    originals.append((doc_id, path, file_hash, resume_text))
+                else:
+                    duplicates.append((path, file_hash, resume_text, duplicate))
+
+            for doc_id, record in pool.imap_unordered(score_prepared, originals, chunksize=chunksize):
+                if 'analysis' in record:
+                    index.set_payload(doc_id, json.dumps(record['analysis']))
+                writer.write(record)
+                scored += 1
+
+            # Copies of a resume whose own analysis failed are scored themselves
+            rescore = []
+            for path, file_hash, resume_text, (doc_id, original, similarity) in duplicates:
+                payload = index.get_payload(doc_id)
+                if payload is None:
+                    rescore.append((None, path, file_hash, resume_text))
+                    continue
+                metrics.increment("dedup_duplicate")
+                record = make_record(path, file_hash, json.loads(payload))
+                record['duplicate_of'] = original
+                record['similarity'] = round(similarity, 3)
+                writer.write(record)
+                scored += 1
+            for _, record in pool.imap_unordered(score_prepared, rescore, chunksize=chunksize):
+                writer.write(record)
+                scored += 1
+    finally:
+        index.close()
+    return scored
+
+
+def scores_from(writer):
+    """(score, path) pairs for every scored resume in a report, old and new"""
+    return [(score, file) for file, score in writer.scores.items()]
+
+
+def write_ranking(scores, out, top=None):
+    """Write resumes ordered by descending match score"""
+    ranked = sorted(scores, key=lambda item: (-item[0], item[1]))
+    if top:
+        ranked = ranked[:top]
+    for rank, (score, path) in enumerate(ranked, 1):
+        out.write(json.dumps({'rank': rank, 'file': path, 'score': score}) + "\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score a job description against a directory of resumes")
+    parser.add_argument('job', help="text file containing the job description, or a job id with --job-store")
+    parser.add_argument('resumes', help="directory or ZIP archive of PDF/DOCX resumes")
+    parser.add_argument('-o', '--output', default='-', help="JSONL or .csv output file (default: stdout)")
+    parser.add_argument('--resume', action='store_true', help="append to the output, skipping files already in it")
+    parser.add_argument('-w', '--workers', type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument('--chunksize', type=int, default=8, help="resumes handed to a worker at a time")
+    parser.add_argument('--ai', action='store_true', help="also call the Hugging Face model (slow)")
+    parser.add_argument('--ranked', help="write a ranked JSONL file here when the run finishes")
+    parser.add_argument('--top', type=int, help="only keep the top N resumes in the ranked file")
+    parser.add_argument('--job-store', help="SQLite job store (resumematch.job_store) to look the job id up in")
+    parser.add_argument('--dedup', action='store_true',
+                        help="reuse the analysis of an earlier near-duplicate resume instead of scoring it")
+    parser.add_argument('--dedup-threshold', type=float, default=0.8,
+                        help="estimated Jaccard similarity at which resumes count as duplicates")
+    args = parser.parse_args(argv)
+
+    job = None
+    if args.job_store:
+        from resumematch.job_store import JobStore
+
+        job = JobStore(args.job_store).get(args.job)
+        if job is None:
+            parser.exit(1, f"No job with id {args.job} in {args.job_store}\n")
+        job_description = job.description
+    else:
+        with open(args.job, encoding='utf-8') as f:
+            job_description = f.read()
+
+    archive = None
+    if os.path.isfile(args.resumes):
+        from resumematch.archive import ArchiveError, ResumeArchive
+
+        try:
+            archive = ResumeArchive(args.resumes)
+        except ArchiveError as e:
+            parser.exit(1, f"{args.resumes}: {e}\n")
+        sources = ((f"{args.resumes}/{name}", data) for name, data in archive)
+    else:
+        sources = iter_resume_paths(args.resumes)
+
+    try:
+        writer = open_report(args.output, resume=args.resume)
+    except ValueError as e:
+        parser.exit(1, f"{e}\n")
+    with writer:
+        if writer.completed:
+            print(f"Resuming: {len(writer.scores)} resumes already scored", file=sys.stderr)
+        scored = run_batch(job_description, sources, writer,
+                           workers=args.workers, use_ai=args.ai, chunksize=args.chunksize,
+                           dedup_threshold=args.dedup_threshold if args.dedup else None, job_profile=job)
+        if archive is not None:
+            for name, message in archive.errors:
+                writer.write(make_record(f"{args.resumes}/{name}", None, error=message))
+            scored += len(archive.errors)
+            archive.close()
+        scores = scores_from(writer)
+
+    if args.ranked:
+        with open(args.ranked, 'w', encoding='utf-8') as f:
+            write_ranking(scores, f, top=args.top)
+
+    print(f"Scored {scored} resumes", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
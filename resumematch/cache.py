@@ -0,0 +1,201 @@
+"""Content-addressed cache for extracted resume text.
+
+Text is keyed by a SHA-256 of the file bytes, so the same resume parses once no
+matter how often it is uploaded or how many jobs it is scored against. The
+key also carries a fingerprint of the extraction settings (parser modes and
+page, character and size limits), so text cached under other settings is not
+reused. There is an in-memory LRU tier and an optional on-disk tier shared by
+every process pointed at the same directory.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+from resumematch import config, metrics
+from resumematch.sandbox import extract_text_isolated
+
+# Disk eviction frees space down to this share of the budget, so a full tier
+# is rescanned once per batch of evictions rather than on every put
+DISK_LOW_WATER = 0.9
+
+
+def file_digest(data):
+    """Hex SHA-256 of a file's bytes"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def extraction_key(data):
+    """Cache key for a file's text: its digest plus the extraction settings"""
+    settings = (config.PDF_EXTRACTION_MODE, config.DOCX_EXTRACTION_MODE, config.PDF_MAX_PAGES,
+                config.EXTRACT_MAX_CHARS, config.PDF_MAX_BYTES, config.DOCX_MAX_BYTES)
+    fingerprint = hashlib.sha256(repr(settings).encode('utf-8')).hexdigest()[:16]
+    return f"{file_digest(data)}-{fingerprint}"
+
+
+class TextCache:
+    """Two-tier LRU cache of extracted text keyed by file digest"""
+
+    def __init__(self, max_entries=256, disk_dir=None, max_disk_bytes=512 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        # Running size of the disk tier, seeded by one scan; only when it
+        # goes over budget is the directory scanned (and resynced) again
+        self._disk_bytes = 0
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+            self._disk_bytes = sum(size for _, size, _ in self._disk_files())
+
+    def _disk_path(self, key):
+        return os.path.join(self.disk_dir, key + '.txt')
+
+    def get(self, key):
+        """Return cached text for key, or None on a miss"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+                return self._entries[key]
+
+        if self.disk_dir:
+            path = self._disk_path(key)
+            try:
+                with open(path, encoding='utf-8') as f:
+                    text = f.read()
+            except OSError:
+                pass
+            else:
+                # Bump the mtime so disk eviction is least-recently-used
+                try:
+                    os.utime(path)
+                except OSError:
+                    pass
+                with self._lock:
+                    self.disk_hits += 1
+                self._remember(key, text)
+                return text
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key, text):
+        self._remember(key, text)
+        if self.disk_dir:
+            path = self._disk_path(key)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+            try:
+                replaced = os.path.getsize(path)
+            except OSError:
+                replaced = 0
+            os.replace(tmp_path, path)
+            with self._lock:
+                self._disk_bytes += os.path.getsize(path) - replaced
+                over_budget = self._disk_bytes > self.max_disk_bytes
+            if over_budget:
+                self._evict_disk()
+
+    def _remember(self, key, text):
+        with self._lock:
+            self._entries[key] = text
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _disk_files(self):
+        """(mtime, size, path) of every cached text file"""
+        files = []
+        with os.scandir(self.disk_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.txt'):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+        return files
+
+    def _evict_disk(self):
+        """Delete least recently used files until the tier is under its low water mark
+
+        The scan also picks up files other processes sharing the directory
+        have added or removed.
+        """
+        files = self._disk_files()
+        total = sum(size for _, size, _ in files)
+        if total > self.max_disk_bytes:
+            target = self.max_disk_bytes * DISK_LOW_WATER
+            files.sort()
+            for mtime, size, path in files:
+                if total <= target:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+        with self._lock:
+            self._disk_bytes = total
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            hits = self.memory_hits + self.disk_hits
+            lookups = hits + self.misses
+            return {
+                'memory_hits': self.memory_hits,
+                'disk_hits': self.disk_hits,
+                'hits': hits,
+                'misses': self.misses,
+                'hit_rate': hits / lookups if lookups else 0.0,
+                'memory_entries': len(self._entries)
+            }
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache():
+    """Process-wide cache configured from resumematch.config"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = TextCache(
+                max_entries=config.CACHE_MEMORY_ENTRIES,
+                disk_dir=config.CACHE_DIR,
+                max_disk_bytes=config.CACHE_DISK_MAX_BYTES
+            )
+        return _default_cache
+
+
+def extract_text_cached(data, filename, cache=None):
+    """Extract text from file bytes, parsing each distinct file only once
+
+    Raises ExtractionError like extract_text_isolated; failures are not cached.
+    """
+    if cache is None:
+        cache = get_default_cache()
+    key = extraction_key(data)
+    text = cache.get(key)
+    if text is None:
+        metrics.increment("extraction_cache_miss")
+        with metrics.timed("extraction"):
+            text = extract_text_isolated(data, filename)
+        cache.put(key, text)
+    else:
+        metrics.increment("extraction_cache_hit")
+    return text
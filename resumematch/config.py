@@ -0,0 +1,118 @@
+"""Deployment settings, read from environment variables.
+
+Every setting has a default that matches the hosted app, so nothing needs to
+be set for local use.
+"""
+
+import os
+
+
+def _env_int(name, default):
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+
+def _env_bool(name, default=False):
+    value = os.environ.get(name)
+    if not value:
+        return default
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def _env_float(name, default):
+    value = os.environ.get(name)
+    return float(value) if value else default
+
+
+# Extracted-text cache
+CACHE_MEMORY_ENTRIES = _env_int("RESUMEMATCH_CACHE_MEMORY_ENTRIES", 256)
+CACHE_DIR = os.environ.get("RESUMEMATCH_CACHE_DIR") or None
+CACHE_DISK_MAX_BYTES = _env_int("RESUMEMATCH_CACHE_DISK_MAX_BYTES", 512 * 1024 * 1024)
+
+# Web app memoization of finished analyses, keyed on (file hash, job hash).
+# The TTL lets a rule-based fallback be retried against the AI later.
+UI_CACHE_ENTRIES = _env_int("RESUMEMATCH_UI_CACHE_ENTRIES", 64)
+UI_CACHE_TTL_SECONDS = _env_int("RESUMEMATCH_UI_CACHE_TTL_SECONDS", 3600)
+
+# Parsed resumes (sections, keywords, flags) kept in memory, keyed on text
+PARSE_CACHE_ENTRIES = _env_int("RESUMEMATCH_PARSE_CACHE_ENTRIES", 128)
+
+# Offline semantic scorer (resumematch.semantic): embeddings kept per
+# document hash, and whether analyses include a semantic_match section
+SEMANTIC_CACHE_ENTRIES = _env_int("RESUMEMATCH_SEMANTIC_CACHE_ENTRIES", 256)
+SEMANTIC_SCORING = _env_bool("RESUMEMATCH_SEMANTIC")
+
+# Skill taxonomy matching (resumematch.skills): whether keyword matching and
+# the skills score also use canonical multi-word skills, and an optional
+# taxonomy file replacing the bundled one
+SKILL_MATCHING = _env_bool("RESUMEMATCH_SKILLS")
+SKILLS_FILE = os.environ.get("RESUMEMATCH_SKILLS_FILE") or None
+
+# SQLite file of preprocessed job descriptions (resumematch.job_store); when
+# unset the web app keeps its job store in memory
+JOB_STORE_PATH = os.environ.get("RESUMEMATCH_JOB_STORE") or None
+
+# PDF extraction: "fast" reads the pypdf text layer and only re-reads pages
+# that look empty or garbled with pdfplumber; "thorough" uses pdfplumber for
+# every page like the original extractor.
+PDF_EXTRACTION_MODE = os.environ.get("RESUMEMATCH_PDF_MODE", "fast")
+PDF_MAX_PAGES = _env_int("RESUMEMATCH_PDF_MAX_PAGES", 50)
+PDF_MAX_BYTES = _env_int("RESUMEMATCH_PDF_MAX_BYTES", 20 * 1024 * 1024)
+# Documents with at least this many pages are split across worker processes
+PDF_PARALLEL_MIN_PAGES = _env_int("RESUMEMATCH_PDF_PARALLEL_MIN_PAGES", 12)
+PDF_WORKERS = _env_int("RESUMEMATCH_PDF_WORKERS", min(4, os.cpu_count() or 1))
+
+# Limits for untrusted uploads. Extraction stops after EXTRACT_MAX_CHARS
+# characters and runs in a child process that is killed after
+# EXTRACT_TIMEOUT_SECONDS (zero extracts in-process with no time limit) or
+# when it exceeds EXTRACT_MAX_MEMORY_MB of address space.
+EXTRACT_MAX_CHARS = _env_int("RESUMEMATCH_EXTRACT_MAX_CHARS", 200_000)
+EXTRACT_TIMEOUT_SECONDS = _env_float("RESUMEMATCH_EXTRACT_TIMEOUT_SECONDS", 30)
+EXTRACT_MAX_MEMORY_MB = _env_int("RESUMEMATCH_EXTRACT_MAX_MEMORY_MB", 1024)
+
+# DOCX extraction: "fast" stream-parses the document, header and footer XML
+# (including tables and text boxes); "python-docx" reads body paragraphs
+# through python-docx like the original extractor. Fast falls back to
+# python-docx for files it cannot parse.
+DOCX_EXTRACTION_MODE = os.environ.get("RESUMEMATCH_DOCX_MODE", "fast")
+DOCX_MAX_BYTES = _env_int("RESUMEMATCH_DOCX_MAX_BYTES", 20 * 1024 * 1024)
+DOCX_MAX_UNCOMPRESSED_BYTES = _env_int("RESUMEMATCH_DOCX_MAX_UNCOMPRESSED_BYTES", 100 * 1024 * 1024)
+
+# ZIP archives of resumes (resumematch.archive): total bytes read out of one
+# archive, number of resumes taken from it, and extraction threads in the app
+ARCHIVE_MAX_UNCOMPRESSED_BYTES = _env_int("RESUMEMATCH_ARCHIVE_MAX_UNCOMPRESSED_BYTES", 500 * 1024 * 1024)
+ARCHIVE_MAX_FILES = _env_int("RESUMEMATCH_ARCHIVE_MAX_FILES", 1000)
+ARCHIVE_WORKERS = _env_int("RESUMEMATCH_ARCHIVE_WORKERS", min(8, os.cpu_count() or 1))
+
+# Hugging Face inference endpoint used for the AI analysis
+HF_API_URL = os.environ.get(
+    "RESUMEMATCH_HF_API_URL",
+    "https://api-inference.huggingface.co/models/mistralai/Mistral-7B-Instruct-v0.2"
+)
+HF_TIMEOUT = _env_int("RESUMEMATCH_HF_TIMEOUT", 90)
+HF_MAX_CONCURRENCY = _env_int("RESUMEMATCH_HF_MAX_CONCURRENCY", 4)
+HF_MAX_RETRIES = _env_int("RESUMEMATCH_HF_MAX_RETRIES", 3)
+HF_CACHE_ENTRIES = _env_int("RESUMEMATCH_HF_CACHE_ENTRIES", 1024)
+
+# Latency budget for the AI analysis in the web app. When set above zero the
+# rule-based result is shown at once and replaced by the AI result only if it
+# arrives within this many seconds; zero waits for the AI call as before.
+AI_BUDGET_SECONDS = _env_float("RESUMEMATCH_AI_BUDGET_SECONDS", 0)
+
+# Pipeline metrics (see resumematch.metrics). Off by default; when on they can
+# be written to a Prometheus textfile, served over HTTP, and shown in a
+# sidebar debug panel.
+METRICS_ENABLED = _env_bool("RESUMEMATCH_METRICS")
+METRICS_FILE = os.environ.get("RESUMEMATCH_METRICS_FILE") or None
+METRICS_PORT = _env_int("RESUMEMATCH_METRICS_PORT", 0)
+DEBUG_PANEL = _env_bool("RESUMEMATCH_DEBUG_PANEL")
+
+# Work-queue mode (resumematch.work_queue): when RESUMEMATCH_QUEUE names a
+# SQLite file, the web app submits analyses there and polls for results
+# while `python -m resumematch.work_queue` runs the workers.
+QUEUE_PATH = os.environ.get("RESUMEMATCH_QUEUE") or None
+QUEUE_WORKERS = _env_int("RESUMEMATCH_QUEUE_WORKERS", 4)
+QUEUE_LEASE_SECONDS = _env_float("RESUMEMATCH_QUEUE_LEASE_SECONDS", 60)
+QUEUE_POLL_SECONDS = _env_float("RESUMEMATCH_QUEUE_POLL_SECONDS", 1)
+QUEUE_MAX_ATTEMPTS = _env_int("RESUMEMATCH_QUEUE_MAX_ATTEMPTS", 3)
+QUEUE_RETENTION_SECONDS = _env_int("RESUMEMATCH_QUEUE_RETENTION_SECONDS", 24 * 3600)
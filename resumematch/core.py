@@ -0,0 +1,810 @@
+"""UI-free scoring core for ResumeMatch.
+
+Everything in here runs without Streamlit so it can be imported from the web
+app, the batch CLI or a worker process alike.
+"""
+
+import importlib.util
+import io
+import multiprocessing
+import re
+import time
+import zipfile
+import xml.etree.ElementTree as ElementTree
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeout
+
+from resumematch import config, metrics
+from resumematch.hf_client import get_default_client
+from resumematch.sections import parse_resume
+from resumematch.skills import get_default_taxonomy, match_skills, skill_counts
+from resumematch.tokenizer import default_tokenizer
+
+
+class ExtractionError(Exception):
+    """Raised when text cannot be extracted from an uploaded document
+
+    ``code`` says why, so callers can react without parsing the message:
+    "too_large", "timeout", "memory", "crashed", "unsupported",
+    "missing_dependency" or "failed".
+    """
+
+    def __init__(self, message, code="failed"):
+        super().__init__(message)
+        self.code = code
+
+    def __reduce__(self):
+        # Keep the code when the error crosses a process boundary
+        return ExtractionError, (str(self), self.code)
+
+    def to_dict(self):
+        return {'code': self.code, 'message': str(self)}
+
+
+def _read_bytes(file, max_bytes, kind):
+    file.seek(0)
+    data = file.read(max_bytes + 1)
+    if len(data) > max_bytes:
+        raise ExtractionError(f"{kind} is larger than the {max_bytes // (1024 * 1024)} MB limit", code="too_large")
+    return data
+
+
+def _check_deadline(deadline):
+    """Raise once the wall-clock budget (a time.monotonic() value) is spent"""
+    if deadline is not None and time.monotonic() > deadline:
+        raise ExtractionError("Extraction took longer than the time limit", code="timeout")
+
+
+def _looks_garbled(text):
+    """True when a page's text layer is empty or unlikely to be real prose"""
+    stripped = text.strip() if text else ""
+    if len(stripped) < 20:
+        return True
+    if '\ufffd' in stripped or '(cid:' in stripped:
+        return True
+    readable = sum(1 for ch in stripped if ch.isalnum() or ch.isspace())
+    if readable / len(stripped) < 0.7:
+        return True
+    # Text layers without word spacing come out as one long run of letters
+    return len(stripped) / (stripped.count(' ') + stripped.count('\n') + 1) > 25
+
+
+# Document libraries are imported the first time a document of that kind is
+# read: pdfplumber alone pulls in pdfminer and Pillow, which would otherwise
+# load on every cold start of the app and every worker process.
+def _pdf_reader(data):
+    from pypdf import PdfReader
+    return PdfReader(io.BytesIO(data))
+
+
+def _open_plumber(data):
+    import pdfplumber
+    return pdfplumber.open(io.BytesIO(data))
+
+
+def _pdf_libraries_installed():
+    return importlib.util.find_spec("pypdf") is not None and importlib.util.find_spec("pdfplumber") is not None
+
+
+def _extract_pdf_pages(data, start, stop, max_chars=None, deadline=None):
+    """Fast-path text for pages [start, stop): pypdf first, pdfplumber for bad pages
+
+    Stops early once max_chars have been read.
+    """
+    reader = _pdf_reader(data)
+    plumber = None
+    texts = []
+    total = 0
+    try:
+        for number in range(start, stop):
+            _check_deadline(deadline)
+            try:
+                page_text = reader.pages[number].extract_text()
+            except Exception:
+                page_text = ""
+            if _looks_garbled(page_text):
+                if plumber is None:
+                    plumber = _open_plumber(data)
+                page_text = plumber.pages[number].extract_text() or page_text
+            texts.append(page_text)
+            total += len(page_text or "")
+            if max_chars and total >= max_chars:
+                break
+    finally:
+        if plumber is not None:
+            plumber.close()
+    return texts
+
+
+_page_pool = None
+
+
+def _get_page_pool():
+    global _page_pool
+    if _page_pool is None:
+        _page_pool = ProcessPoolExecutor(max_workers=config.PDF_WORKERS)
+    return _page_pool
+
+
+def shutdown_page_pool():
+    """Stop the page workers, e.g. before a sandboxed extraction child exits"""
+    global _page_pool
+    if _page_pool is not None:
+        _page_pool.shutdown(cancel_futures=True)
+        _page_pool = None
+
+
+def _extract_pdf_fast(data, max_pages, max_chars=None, deadline=None):
+    page_count = min(len(_pdf_reader(data).pages), max_pages)
+    # Batch pool workers are daemonic and cannot start processes of their
+    # own, so batch runs (already one resume per core) take the sequential
+    # path. The sandbox's extraction child is not daemonic and splits pages.
+    parallel = (page_count >= config.PDF_PARALLEL_MIN_PAGES and config.PDF_WORKERS > 1
+                and not multiprocessing.current_process().daemon)
+    if not parallel:
+        return _extract_pdf_pages(data, 0, page_count, max_chars, deadline)
+
+    step = -(-page_count // config.PDF_WORKERS)
+    pool = _get_page_pool()
+    futures = [pool.submit(_extract_pdf_pages, data, start, min(start + step, page_count), max_chars, deadline)
+               for start in range(0, page_count, step)]
+    texts = []
+    for future in futures:
+        texts.extend(future.result())
+    return texts
+
+
+def _extract_pdf_thorough(data, max_pages, max_chars=None, deadline=None):
+    texts = []
+    total = 0
+    with _open_plumber(data) as pdf:
+        for page in pdf.pages[:max_pages]:
+            _check_deadline(deadline)
+            page_text = page.extract_text()
+            texts.append(page_text)
+            total += len(page_text or "")
+            if max_chars and total >= max_chars:
+                break
+    return texts
+
+
+def extract_text_from_pdf(file, mode=None, max_pages=None, max_bytes=None, max_chars=None, deadline=None):
+    """Extract text from PDF
+
+    In "fast" mode (the default) the cheap pypdf text layer is used and only
+    pages that look empty or garbled are re-read with pdfplumber; long
+    documents are split across worker processes. "thorough" mode runs
+    pdfplumber over every page. Whichever parser goes first, the other one is
+    tried on the whole document if it fails outright.
+
+    Reading stops after max_pages pages or max_chars characters, and raises
+    ExtractionError("timeout") once time.monotonic() passes deadline.
+    """
+    if not _pdf_libraries_installed():
+        raise ExtractionError("Run: pip install pypdf pdfplumber", code="missing_dependency")
+
+    mode = mode or config.PDF_EXTRACTION_MODE
+    max_pages = max_pages or config.PDF_MAX_PAGES
+    max_chars = max_chars or config.EXTRACT_MAX_CHARS
+    data = _read_bytes(file, max_bytes or config.PDF_MAX_BYTES, "PDF")
+
+    if mode == "thorough":
+        extractors = [_extract_pdf_thorough, _extract_pdf_fast]
+    else:
+        extractors = [_extract_pdf_fast, _extract_pdf_thorough]
+
+    try:
+        texts = extractors[0](data, max_pages, max_chars, deadline)
+    except ExtractionError:
+        raise
+    except Exception:
+        try:
+            texts = extractors[1](data, max_pages, max_chars, deadline)
+        except ExtractionError:
+            raise
+        except Exception as e:
+            raise ExtractionError(f"PDF extraction failed: {str(e)}") from e
+    return "\n".join(text for text in texts if text).strip()[:max_chars]
+
+
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+# Subtrees holding no document text: paragraph properties (whose w:tab
+# elements are tab stops, not tabs) and the VML fallback copy of each text box,
+# which is stored twice
+_DOCX_SKIP = frozenset({
+    _W + 'pPr',
+    '{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback',
+})
+_DOCX_RUN_TEXT = {_W + 'tab': '\t', _W + 'br': '\n', _W + 'cr': '\n', _W + 'noBreakHyphen': '-'}
+_DOCX_PART = re.compile(r'word/(header|footer)(\d*)\.xml')
+
+# Paragraphs read between deadline checks
+_DOCX_DEADLINE_EVERY = 200
+
+
+def _docx_paragraphs(stream):
+    """Text of every paragraph in a WordprocessingML part, in document order
+
+    Table cells and text boxes are paragraphs too, so they are included.
+    Elements are cleared once read, so memory stays flat however long the
+    part is.
+    """
+    open_paragraphs = []
+    skip_depth = 0
+    for event, element in ElementTree.iterparse(stream, events=('start', 'end')):
+        tag = element.tag
+        if tag in _DOCX_SKIP:
+            skip_depth += 1 if event == 'start' else -1
+        elif skip_depth:
+            pass
+        elif event == 'start':
+            if tag == _W + 'p':
+                # A text box paragraph sits inside its anchor's paragraph
+                open_paragraphs.append([])
+            continue
+        elif tag == _W + 't':
+            if open_paragraphs and element.text:
+                open_paragraphs[-1].append(element.text)
+        elif tag in _DOCX_RUN_TEXT:
+            if open_paragraphs:
+                open_paragraphs[-1].append(_DOCX_RUN_TEXT[tag])
+        elif tag == _W + 'p':
+            yield "".join(open_paragraphs.pop())
+        if event == 'end':
+            element.clear()
+
+
+def _docx_part_names(names):
+    """Headers, the main document, then footers, numbered parts in order"""
+    parts = {'header': [], 'footer': []}
+    for name in names:
+        match = _DOCX_PART.fullmatch(name)
+        if match:
+            parts[match.group(1)].append((int(match.group(2) or 0), name))
+    return ([name for _, name in sorted(parts['header'])] + ['word/document.xml'] +
+            [name for _, name in sorted(parts['footer'])])
+
+
+def _extract_docx_streaming(data, max_chars, deadline=None):
+    """Text of a DOCX read straight from its XML parts, without python-docx
+
+    A header or footer repeated for first, odd and even pages is read once.
+    """
+    lines = []
+    total = 0
+    seen = set()
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        names = set(archive.namelist())
+        if 'word/document.xml' not in names:
+            raise ValueError("word/document.xml is missing")
+        for name in _docx_part_names(names):
+            part = []
+            with archive.open(name) as stream:
+                for index, text in enumerate(_docx_paragraphs(stream)):
+                    if index % _DOCX_DEADLINE_EVERY == 0:
+                        _check_deadline(deadline)
+                    part.append(text)
+                    total += len(text) + 1
+                    if total >= max_chars:
+                        break
+            if name != 'word/document.xml':
+                key = "\n".join(part).strip()
+                if not key or key in seen:
+                    continue
+                seen.add(key)
+            lines.extend(part)
+            if total >= max_chars:
+                break
+    return "\n".join(lines).strip()[:max_chars]
+
+
+def extract_text_from_docx(file, max_bytes=None, max_chars=None, mode=None, deadline=None):
+    """Extract text from DOCX
+
+    In "fast" mode (the default) the document, header and footer XML is
+    stream-parsed, so text in tables, text boxes and headers is kept; a file
+    that cannot be read that way is passed to python-docx. "python-docx"
+    mode reads the body paragraphs through python-docx only.
+
+    Files over max_bytes, or whose zipped parts would inflate past
+    DOCX_MAX_UNCOMPRESSED_BYTES, are refused before parsing; the text is cut
+    at max_chars characters.
+    """
+    mode = mode or config.DOCX_EXTRACTION_MODE
+    max_chars = max_chars or config.EXTRACT_MAX_CHARS
+    data = _read_bytes(file, max_bytes or config.DOCX_MAX_BYTES, "DOCX")
+    try:
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            inflated = sum(info.file_size for info in archive.infolist())
+    except zipfile.BadZipFile as e:
+        raise ExtractionError(f"DOCX extraction failed: {str(e)}") from e
+    if inflated > config.DOCX_MAX_UNCOMPRESSED_BYTES:
+        raise ExtractionError("DOCX expands to more data than allowed", code="too_large")
+
+    if mode == "fast":
+        try:
+            return _extract_docx_streaming(data, max_chars, deadline)
+        except ExtractionError:
+            raise
+        except Exception:
+            metrics.increment("docx_stream_fallback")
+
+    try:
+        from docx import Document
+    except ImportError:
+        raise ExtractionError("Run: pip install python-docx", code="missing_dependency") from None
+
+    try:
+        doc = Document(io.BytesIO(data))
+        paragraphs = []
+        total = 0
+        for paragraph in doc.paragraphs:
+            paragraphs.append(paragraph.text)
+            total += len(paragraph.text) + 1
+            if total >= max_chars:
+                break
+        return "\n".join(paragraphs).strip()[:max_chars]
+    except Exception as e:
+        raise ExtractionError(f"DOCX extraction failed: {str(e)}") from e
+
+
+def extract_text(file, filename, deadline=None):
+    """Extract text from a PDF or DOCX file, picking the parser by extension"""
+    if filename.lower().endswith('.pdf'):
+        return extract_text_from_pdf(file, deadline=deadline)
+    if filename.lower().endswith('.docx'):
+        return extract_text_from_docx(file, deadline=deadline)
+    raise ExtractionError(f"Unsupported file type: {filename}", code="unsupported")
+
+
+def extract_keywords(text):
+    """Extract keywords from text"""
+    return default_tokenizer.keywords(text)
+
+
+def profile_text(text):
+    """Keyword counts plus section/metric flags, computed once per document"""
+    return default_tokenizer.profile(text)
+
+
+def match_keywords(resume_keywords, job_keywords, top_job_keywords=None):
+    """Keyword match between two keyword Counters
+
+    top_job_keywords (the job's 20 most common keywords) can be passed in
+    when the job side is precomputed.
+    """
+    common_keywords = set(resume_keywords.keys()) & set(job_keywords.keys())
+
+    if len(job_keywords) > 0:
+        match_percentage = (len(common_keywords) / len(job_keywords)) * 100
+    else:
+        match_percentage = 0
+
+    if top_job_keywords is None:
+        top_job_keywords = [k for k, v in job_keywords.most_common(20)]
+    matched = [k for k in top_job_keywords if k in resume_keywords]
+    missing = [k for k in top_job_keywords if k not in resume_keywords]
+
+    return {
+        'match_percentage': match_percentage,
+        'matched_keywords': matched[:10],
+        'missing_keywords': missing[:10]
+    }
+
+
+def add_skill_match(keyword_analysis, resume_text, job_text):
+    """Fold skill taxonomy matches into a keyword analysis
+
+    Adds ``skill_match_percentage``, ``matched_skills`` and
+    ``missing_skills``. Canonical skills lead the matched and missing
+    keyword lists, and single words a listed skill already covers ("learning"
+    under "Machine Learning") are dropped from them.
+    """
+    skill_analysis = match_skills(skill_counts(resume_text), skill_counts(job_text))
+    taxonomy = get_default_taxonomy()
+    covered = {term for skill in skill_analysis['matched_skills'] + skill_analysis['missing_skills']
+               for alias in taxonomy.terms(skill) for term in alias.split()}
+    for field, skills in (('matched_keywords', 'matched_skills'), ('missing_keywords', 'missing_skills')):
+        keywords = [k for k in keyword_analysis[field] if k not in covered]
+        keyword_analysis[field] = (skill_analysis[skills] + keywords)[:10]
+    keyword_analysis.update(skill_analysis)
+    return keyword_analysis
+
+
+def calculate_keyword_match(resume_text, job_text, resume_keywords=None, use_skills=None):
+    """Calculate keyword matching
+
+    Pass resume_keywords (e.g. from profile_text) to skip re-tokenizing the
+    resume. With use_skills (default RESUMEMATCH_SKILLS) canonical skills
+    from the taxonomy are matched too; see add_skill_match.
+    """
+    if resume_keywords is None:
+        resume_keywords = extract_keywords(resume_text)
+    keyword_analysis = match_keywords(resume_keywords, extract_keywords(job_text))
+    if config.SKILL_MATCHING if use_skills is None else use_skills:
+        add_skill_match(keyword_analysis, resume_text, job_text)
+    return keyword_analysis
+
+
+def analyze_with_free_ai(resume_text, job_description):
+    """FREE AI analysis using Hugging Face (NO API KEY NEEDED!)"""
+    return get_default_client().analyze_sync(resume_text, job_description)
+
+
+def rule_based_analysis(resume_text, job_description, keyword_analysis, profile=None):
+    """Advanced rule-based analysis"""
+
+    if profile is None:
+        profile = parse_resume(resume_text)
+
+    keyword_score = min(keyword_analysis['match_percentage'], 100)
+
+    has_experience = profile.has_experience
+    has_education = profile.has_education
+    has_skills = profile.has_skills
+    has_achievements = profile.has_achievements
+    has_metrics = profile.has_metrics
+
+    # Improved scoring
+    experience_score = 85 if (has_experience and has_achievements) else (70 if has_experience else 45)
+    education_score = 85 if has_education else 50
+
+    # Better skills score based on keyword matching, or on the share of the
+    # job's taxonomy skills covered when skill matching found any
+    matched_count = len(keyword_analysis['matched_keywords'])
+    skill_percentage = keyword_analysis.get('skill_match_percentage')
+    if skill_percentage is not None:
+        if skill_percentage >= 80:
+            skills_score = 95
+        elif skill_percentage >= 60:
+            skills_score = 85
+        elif skill_percentage >= 45:
+            skills_score = 75
+        elif skill_percentage >= 30:
+            skills_score = 65
+        else:
+            skills_score = max(int(skill_percentage * 0.8), 40)
+    elif matched_count >= 15:
+        skills_score = 95
+    elif matched_count >= 10:
+        skills_score = 85
+    elif matched_count >= 7:
+        skills_score = 75
+    elif matched_count >= 5:
+        skills_score = 65
+    else:
+        skills_score = max(int(keyword_score * 0.8), 40)
+
+    if has_metrics:
+        experience_score = min(experience_score + 10, 100)
+
+    # Recalculated overall score with better weights
+    overall_score = int(
+        (keyword_score * 0.35) +
+        (experience_score * 0.30) +
+        (skills_score * 0.25) +
+        (education_score * 0.10)
+    )
+
+    strengths = []
+    if len(keyword_analysis['matched_keywords']) >= 10:
+        strengths.append(f"Excellent keyword alignment with {len(keyword_analysis['matched_keywords'])} key terms")
+    elif len(keyword_analysis['matched_keywords']) >= 7:
+        strengths.append(f"Strong keyword coverage with {len(keyword_analysis['matched_keywords'])} relevant terms")
+    elif len(keyword_analysis['matched_keywords']) >= 5:
+        strengths.append(f"Good keyword coverage with {len(keyword_analysis['matched_keywords'])} relevant terms")
+
+    if has_experience and has_achievements:
+        strengths.append("Strong track record with documented achievements")
+    elif has_experience:
+        strengths.append("Relevant work experience clearly presented")
+
+    if has_metrics:
+        strengths.append("Quantified accomplishments with specific metrics")
+
+    if has_skills:
+        strengths.append("Technical skills clearly highlighted")
+
+    if len(strengths) < 3:
+        strengths.append("Resume is well-formatted and professional")
+
+    weaknesses = []
+    missing_count = len(keyword_analysis['missing_keywords'])
+
+    if missing_count >= 10:
+        weaknesses.append(f"Missing {missing_count} important technical terms from job posting")
+    elif missing_count >= 7:
+        weaknesses.append(f"Could incorporate {missing_count} additional relevant keywords")
+    elif missing_count >= 4:
+        weaknesses.append(f"Consider adding {missing_count} more technical terms from job description")
+
+    if not has_metrics:
+        weaknesses.append("Add quantifiable achievements with numbers and percentages")
+
+    if not has_achievements:
+        weaknesses.append("Include more action verbs and accomplishments")
+
+    if keyword_score < 40:
+        weaknesses.append("Needs significantly better alignment with job requirements")
+    elif keyword_score < 60:
+        weaknesses.append("Could improve keyword alignment with job posting")
+
+    if len(weaknesses) < 3:
+        weaknesses.append("Consider tailoring resume more specifically to this role")
+
+    recommendations = []
+    if len(keyword_analysis['missing_keywords']) > 0 and len(keyword_analysis['missing_keywords']) <= 10:
+        top = ', '.join(keyword_analysis['missing_keywords'][:3])
+        recommendations.append(f"Incorporate these technical terms if applicable: {top}")
+    elif len(keyword_analysis['missing_keywords']) > 10:
+        recommendations.append(f"Add more technical keywords from the job description to improve ATS matching")
+
+    if not has_metrics:
+        recommendations.append("Add specific numbers and percentages to quantify impact")
+    else:
+        recommendations.append("Expand quantifiable results across all experience sections")
+
+    if keyword_score < 60:
+        recommendations.append("Mirror the job description's technical terminology in your resume")
+    else:
+        recommendations.append("Emphasize most relevant technical experience in the top section")
+
+    if overall_score >= 80:
+        assessment = "Excellent match. Strong alignment with job requirements and relevant qualifications."
+    elif overall_score >= 70:
+        assessment = "Very good match. Your background aligns well with most key requirements."
+    elif overall_score >= 60:
+        assessment = "Good match. Solid qualifications with room for targeted optimization."
+    elif overall_score >= 50:
+        assessment = "Moderate match. Relevant elements present but needs better highlighting of applicable skills."
+    else:
+        assessment = "Fair match. Consider significantly tailoring resume to emphasize transferable technical skills."
+
+    return {
+        'match_score': overall_score,
+        'overall_assessment': assessment,
+        'strengths': strengths[:3],
+        'weaknesses': weaknesses[:3],
+        'experience_score': experience_score,
+        'skills_score': skills_score,
+        'education_score': education_score,
+        'recommendations': recommendations[:3]
+    }
+
+
+def calculate_ats_score(resume_text, keyword_analysis, profile=None):
+    """ATS score: keyword match plus bonus points for good resume structure"""
+    if profile is None:
+        profile = parse_resume(resume_text)
+
+    base_ats = keyword_analysis['match_percentage']
+
+    ats_bonus = 0
+    if profile.ats_experience:
+        ats_bonus += 5
+    if profile.ats_education:
+        ats_bonus += 5
+    if profile.ats_skills:
+        ats_bonus += 5
+    if profile.ats_metrics:
+        ats_bonus += 5
+
+    return min(int(base_ats + ats_bonus), 100)
+
+
+def complete_ai_analysis(ai_analysis, resume_text, keyword_analysis, profile=None):
+    """Attach keyword, ATS and alignment sections to a model analysis"""
+    analysis = ai_analysis
+    analysis['keyword_matches'] = keyword_analysis['matched_keywords']
+    analysis['missing_skills'] = keyword_analysis['missing_keywords']
+
+    ats_score = calculate_ats_score(resume_text, keyword_analysis, profile)
+
+    if ats_score < 70:
+        ats_issues = ["Low keyword density", "May not pass automated screening"]
+        ats_improvements = ["Add more relevant keywords", "Use standard section headings"]
+    else:
+        ats_issues = ["Good keyword coverage"]
+        ats_improvements = ["Continue using industry terminology", "Maintain clear structure"]
+
+    analysis['ats_compatibility'] = {
+        'score': ats_score,
+        'issues': ats_issues,
+        'improvements': ats_improvements
+    }
+
+    analysis['experience_alignment'] = {
+        'score': analysis.get('experience_score', 70),
+        'summary': 'Based on work history'
+    }
+    analysis['skills_alignment'] = {
+        'score': analysis.get('skills_score', 70),
+        'summary': f'Matched {len(keyword_analysis["matched_keywords"])} skills'
+    }
+    analysis['education_alignment'] = {
+        'score': analysis.get('education_score', 70),
+        'summary': 'Based on education'
+    }
+
+    return analysis
+
+
+def complete_rule_based_analysis(resume_text, job_description, keyword_analysis, profile=None):
+    """Rule-based analysis with keyword, ATS and alignment sections attached"""
+    analysis = rule_based_analysis(resume_text, job_description, keyword_analysis, profile)
+
+    analysis['keyword_matches'] = keyword_analysis['matched_keywords']
+    analysis['missing_skills'] = keyword_analysis['missing_keywords']
+
+    ats_score = calculate_ats_score(resume_text, keyword_analysis, profile)
+
+    if ats_score < 60:
+        ats_issues = ["Limited keyword optimization", "May struggle with ATS"]
+        ats_improvements = ["Increase keyword density", "Mirror job description terms", "Use standard headers"]
+    elif ats_score < 75:
+        ats_issues = ["Moderate ATS compatibility"]
+        ats_improvements = ["Add more industry keywords", "Use bullet points"]
+    else:
+        ats_issues = ["Strong ATS compatibility"]
+        ats_improvements = ["Maintain keyword strategy", "Keep clear formatting"]
+
+    analysis['ats_compatibility'] = {
+        'score': ats_score,
+        'issues': ats_issues,
+        'improvements': ats_improvements
+    }
+
+    analysis['experience_alignment'] = {
+        'score': analysis['experience_score'],
+        'summary': 'Based on work history'
+    }
+    analysis['skills_alignment'] = {
+        'score': analysis['skills_score'],
+        'summary': f'{len(keyword_analysis["matched_keywords"])} matching keywords'
+    }
+    analysis['education_alignment'] = {
+        'score': analysis['education_score'],
+        'summary': 'Based on education'
+    }
+
+    return analysis
+
+
+def _match_job(resume_text, job_description, job_profile):
+    """(parsed resume, keyword analysis), reusing a stored job profile if given"""
+    profile = parse_resume(resume_text)
+    if job_profile is None:
+        return profile, calculate_keyword_match(resume_text, job_description, profile.keywords)
+    keyword_analysis = match_keywords(profile.keywords, job_profile.keywords, job_profile.top_keywords)
+    if config.SKILL_MATCHING:
+        add_skill_match(keyword_analysis, resume_text, job_description)
+    return profile, keyword_analysis
+
+
+def analyze_resume(resume_text, job_description, use_ai=True, on_status=None, job_profile=None):
+    """Main analysis - tries FREE AI first, uses rule-based as backup
+
+    ``on_status(level, message)`` is called with progress updates ("info" or
+    "success") so callers can surface them; the web app forwards them to
+    Streamlit, the batch CLI ignores them.
+
+    Pass a ``job_profile`` (e.g. from resumematch.job_store) to match against
+    its precomputed keywords instead of tokenizing the job description; the
+    description may then be None to use the stored text.
+    """
+
+    def status(level, message):
+        if on_status is not None:
+            on_status(level, message)
+
+    if job_description is None:
+        job_description = job_profile.description
+
+    with metrics.timed("keyword_match"):
+        profile, keyword_analysis = _match_job(resume_text, job_description, job_profile)
+
+    ai_analysis = None
+    if use_ai:
+        status("info", "Attempting AI analysis... (30-60 seconds)")
+        ai_analysis = analyze_with_free_ai(resume_text, job_description)
+
+    if ai_analysis:
+        metrics.increment("ai_success")
+        status("success", "AI analysis complete!")
+        analysis = complete_ai_analysis(ai_analysis, resume_text, keyword_analysis, profile)
+    else:
+        if use_ai:
+            metrics.increment("ai_fallback")
+        status("info", "Using advanced keyword analysis")
+        with metrics.timed("rule_based"):
+            analysis = complete_rule_based_analysis(resume_text, job_description, keyword_analysis, profile)
+    return _with_semantic_match(analysis, resume_text, job_description)
+
+
+def _with_semantic_match(analysis, resume_text, job_description):
+    """Attach the offline semantic score when RESUMEMATCH_SEMANTIC is on"""
+    if config.SEMANTIC_SCORING:
+        # Imported here so numpy is only loaded when the scorer is enabled
+        from resumematch.semantic import semantic_match
+
+        with metrics.timed("semantic_match"):
+            analysis['semantic_match'] = semantic_match(resume_text, job_description)
+    return analysis
+
+
+_ai_executor = None
+
+
+def _get_ai_executor():
+    global _ai_executor
+    if _ai_executor is None:
+        _ai_executor = ThreadPoolExecutor(max_workers=config.HF_MAX_CONCURRENCY,
+                                          thread_name_prefix='resumematch-ai')
+    return _ai_executor
+
+
+def analyze_resume_with_budget(resume_text, job_description, budget_seconds, on_result=None, job_profile=None):
+    """Race the AI analysis against the rule-based one within a latency budget
+
+    The AI call starts in the background first, then the rule-based result is
+    computed and handed to ``on_result(analysis, source)`` straight away. If
+    the AI result arrives before ``budget_seconds`` have passed since the
+    call, it replaces the rule-based one and ``on_result`` is called again
+    with source "ai". A late AI call keeps running and lands in the client's
+    cache, so a rerun of the same pair gets it immediately.
+
+    Returns the best analysis available at the deadline, with a ``timings``
+    entry recording both paths; ``ai_ms`` is filled in when a late AI call
+    finishes. ``job_profile`` is used as in analyze_resume.
+    """
+    if job_description is None:
+        job_description = job_profile.description
+    started = time.perf_counter()
+    ai_future = _get_ai_executor().submit(analyze_with_free_ai, resume_text, job_description)
+
+    with metrics.timed("keyword_match"):
+        profile, keyword_analysis = _match_job(resume_text, job_description, job_profile)
+    with metrics.timed("rule_based"):
+        analysis = complete_rule_based_analysis(resume_text, job_description, keyword_analysis, profile)
+    analysis = _with_semantic_match(analysis, resume_text, job_description)
+    rule_based_ms = (time.perf_counter() - started) * 1000
+    timings = {'budget_ms': budget_seconds * 1000, 'rule_based_ms': rule_based_ms,
+               'ai_ms': None, 'ai_status': 'timed_out', 'source': 'rule_based'}
+    analysis['timings'] = timings
+
+    def record_ai_ms(future):
+        # Also runs for a call that misses the budget, so a late AI call's
+        # time still lands in the returned timings
+        if timings['ai_ms'] is None:
+            timings['ai_ms'] = (time.perf_counter() - started) * 1000
+
+    ai_future.add_done_callback(record_ai_ms)
+    if on_result is not None:
+        on_result(analysis, 'rule_based')
+
+    remaining = budget_seconds - (time.perf_counter() - started)
+    try:
+        ai_analysis = ai_future.result(timeout=max(remaining, 0))
+    except FuturesTimeout:
+        metrics.increment("ai_timeout")
+        return analysis
+    except Exception:
+        ai_analysis = None
+
+    timings['ai_ms'] = (time.perf_counter() - started) * 1000
+    if not ai_analysis:
+        metrics.increment("ai_fallback")
+        timings['ai_status'] = 'failed'
+        return analysis
+
+    metrics.increment("ai_success")
+    timings['ai_status'] = 'completed'
+    timings['source'] = 'ai'
+    semantic = analysis.get('semantic_match')
+    analysis = complete_ai_analysis(ai_analysis, resume_text, keyword_analysis, profile)
+    if semantic is not None:
+        analysis['semantic_match'] = semantic
+    analysis['timings'] = timings
+    if on_result is not None:
+        on_result(analysis, 'ai')
+    return analysis
@@ -0,0 +1,464 @@
+"""Compact on-disk store of tokenized resumes for multi-million resume corpora.
+
+``KeywordIndex`` keeps postings as Python dicts of strings and saves the whole
+index as one JSON file, which suits thousands of resumes but not millions. A
+``CorpusStore`` interns every term to an integer id and keeps each resume's
+term counts in CSR form: flat ``indices`` (term ids, ascending within a
+resume) and ``counts`` arrays, with ``indptr`` marking where each resume's
+run starts. Terms and resume ids are string tables: UTF-8 bytes plus an array
+of offsets.
+
+Each array is a plain native-endian file that is memory-mapped with numpy, so
+opening a corpus takes the same time for ten resumes as for ten million, pages
+are only read as a search touches them, and several scoring processes share
+one copy in the page cache. A search marks the job's terms in a boolean mask
+over the vocabulary and counts hits a block of resumes at a time.
+
+Writes only append. Adding a resume id again supersedes its earlier row, and
+``remove`` clears the row's byte in ``live``. ``compact`` copies the live rows
+and the terms they still use into a new generation directory and switches
+``CURRENT`` to it atomically; a process that has the old generation open
+keeps reading it until it calls ``refresh``. One writer at a time.
+
+Needs numpy (``pip install numpy``).
+
+Usage:
+    python -m resumematch.corpus add corpus/ resumes/
+    python -m resumematch.corpus query corpus/ job.txt -k 20
+    python -m resumematch.corpus remove corpus/ resumes/old.pdf
+    python -m resumematch.corpus compact corpus/
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+from array import array
+from collections import Counter
+from multiprocessing import Pool
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from resumematch.batch import iter_resume_paths, keywords_for_file
+from resumematch.core import extract_keywords
+
+FORMAT_VERSION = 1
+
+# Resumes buffered before add_keywords flushes, and handled per block when
+# searching or compacting
+BLOCK_ROWS = 16384
+
+# File -> array typecode; the numpy dtype of each is np.dtype(typecode)
+ARRAY_FILES = {
+    'indptr': 'Q',
+    'indices': 'I',
+    'counts': 'I',
+    'live': 'B',
+    'terms.off': 'Q',
+    'ids.off': 'Q',
+}
+BLOB_FILES = ('terms.bin', 'ids.bin')
+
+
+def _gather(offsets, items):
+    """(positions, lengths) of the runs offsets gives for items, concatenated"""
+    starts = offsets[items].astype(np.int64)
+    lengths = offsets[items + 1].astype(np.int64) - starts
+    before = np.cumsum(lengths) - lengths
+    positions = np.arange(int(lengths.sum()), dtype=np.int64) + np.repeat(starts - before, lengths)
+    return positions, lengths
+
+
+def _append(path, values):
+    with open(path, 'ab') as f:
+        if isinstance(values, (bytes, bytearray)):
+            f.write(values)
+        else:
+            values.tofile(f)
+
+
+def _create_generation(directory):
+    os.makedirs(directory)
+    for name, typecode in ARRAY_FILES.items():
+        _append(os.path.join(directory, name), array(typecode, [0] if name in ('indptr', 'terms.off', 'ids.off') else []))
+    for name in BLOB_FILES:
+        _append(os.path.join(directory, name), b'')
+
+
+def _write_current(path, generation):
+    """Point CURRENT at a generation, replacing the file atomically"""
+    tmp_path = os.path.join(path, 'CURRENT.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': FORMAT_VERSION, 'generation': generation}, f)
+    os.replace(tmp_path, os.path.join(path, 'CURRENT'))
+
+
+class CorpusStore:
+    """Memory-mapped CSR store of resume keyword counts
+
+    Open read-only to score against a corpus; ``writable=True`` creates the
+    store if needed and allows add, remove and compact.
+    """
+
+    def __init__(self, path, writable=False):
+        if np is None:
+            raise ImportError("Run: pip install numpy")
+        self.path = path
+        self.writable = writable
+        self._pending = []
+        if writable and not os.path.exists(os.path.join(path, 'CURRENT')):
+            os.makedirs(path, exist_ok=True)
+            _create_generation(os.path.join(path, 'gen-0'))
+            _write_current(path, 0)
+        self.refresh()
+
+    def _file(self, name):
+        return os.path.join(self._directory, name)
+
+    def _map(self, name, count):
+        dtype = np.dtype(ARRAY_FILES.get(name, 'B'))
+        if count == 0:
+            return np.zeros(0, dtype=dtype)
+        return np.memmap(self._file(name), dtype=dtype, mode='r', shape=(count,))
+
+    def _length(self, name):
+        return os.path.getsize(self._file(name)) // np.dtype(ARRAY_FILES[name]).itemsize
+
+    def refresh(self):
+        """Map the current generation again, picking up appends and compactions
+
+        Only rows whose ``indptr`` entry was written count, so a flush that
+        was interrupted leaves the store as it was before it; a writable
+        store truncates such partial tails.
+        """
+        with open(os.path.join(self.path, 'CURRENT'), encoding='utf-8') as f:
+            current = json.load(f)
+        if current['version'] != FORMAT_VERSION:
+            raise ValueError(f"Unsupported corpus store version {current['version']}")
+        self.generation = current['generation']
+        self._directory = os.path.join(self.path, f"gen-{self.generation}")
+
+        rows = min(self._length('indptr') - 1, self._length('ids.off') - 1, self._length('live'))
+        terms = self._length('terms.off') - 1
+        self._indptr = self._map('indptr', rows + 1)
+        self._ids_off = self._map('ids.off', rows + 1)
+        self._terms_off = self._map('terms.off', terms + 1)
+        nnz = int(self._indptr[rows])
+        if self.writable:
+            sizes = {
+                'indptr': rows + 1, 'ids.off': rows + 1, 'live': rows,
+                'indices': nnz, 'counts': nnz, 'terms.off': terms + 1,
+                'ids.bin': int(self._ids_off[rows]), 'terms.bin': int(self._terms_off[terms]),
+            }
+            for name, count in sizes.items():
+                size = count * np.dtype(ARRAY_FILES.get(name, 'B')).itemsize
+                if os.path.getsize(self._file(name)) != size:
+                    os.truncate(self._file(name), size)
+        self._indices = self._map('indices', nnz)
+        self._counts = self._map('counts', nnz)
+        self._live = self._map('live', rows)
+        self._ids = self._map('ids.bin', int(self._ids_off[rows]))
+        self._terms = self._map('terms.bin', int(self._terms_off[terms]))
+        self.rows = rows
+        self.term_count = terms
+        # Built on first use: reading them is the only step that grows with
+        # the corpus
+        self._term_ids = None
+        self._term_list = None
+        self._row_ids = None
+
+    def __len__(self):
+        return int(np.count_nonzero(self._live))
+
+    def __contains__(self, resume_id):
+        return resume_id in self._live_rows()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Write any queued resumes"""
+        if self.writable:
+            self.flush()
+
+    def _strings(self, blob, offsets, count):
+        data = bytes(blob)
+        bounds = offsets[:count + 1].tolist()
+        return [data[start:end].decode('utf-8') for start, end in zip(bounds, bounds[1:])]
+
+    def _vocabulary(self):
+        """term -> term id for every interned term"""
+        if self._term_ids is None:
+            self._term_list = self._strings(self._terms, self._terms_off, self.term_count)
+            self._term_ids = {term: term_id for term_id, term in enumerate(self._term_list)}
+        return self._term_ids
+
+    def _live_rows(self):
+        """resume id -> its live row"""
+        if self._row_ids is None:
+            ids = self._strings(self._ids, self._ids_off, self.rows)
+            self._row_ids = {ids[row]: row for row in np.flatnonzero(self._live).tolist()}
+        return self._row_ids
+
+    def resume_id(self, row):
+        return bytes(self._ids[self._ids_off[row]:self._ids_off[row + 1]]).decode('utf-8')
+
+    def row_keywords(self, row):
+        """Counter of term -> count for one row"""
+        self._vocabulary()
+        start, end = int(self._indptr[row]), int(self._indptr[row + 1])
+        return Counter(dict(zip((self._term_list[term_id] for term_id in self._indices[start:end].tolist()),
+                                self._counts[start:end].tolist())))
+
+    def get(self, resume_id):
+        """The stored keyword Counter of a resume, or None"""
+        row = self._live_rows().get(resume_id)
+        return None if row is None else self.row_keywords(row)
+
+    def _check_writable(self):
+        if not self.writable:
+            raise ValueError("Corpus store was opened read-only")
+
+    def add(self, resume_id, resume_text):
+        """Queue a resume, superseding any earlier version with the same id"""
+        self.add_keywords(resume_id, extract_keywords(resume_text))
+
+    def add_keywords(self, resume_id, keywords):
+        """Queue an already tokenized resume (a Counter from extract_keywords)
+
+        Queued resumes are written by flush, which runs every BLOCK_ROWS
+        resumes and on close.
+        """
+        self._check_writable()
+        self._pending.append((resume_id, keywords))
+        if len(self._pending) >= BLOCK_ROWS:
+            self.flush()
+
+    def flush(self):
+        """Append queued resumes to the store"""
+        self._check_writable()
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        term_ids = self._vocabulary()
+        row_ids = self._live_rows()
+
+        new_terms = bytearray()
+        terms_off = array('Q')
+        terms_end = int(self._terms_off[self.term_count])
+        indices, counts = array('I'), array('I')
+        indptr = array('Q')
+        nnz = int(self._indptr[self.rows])
+        ids = bytearray()
+        ids_off = array('Q')
+        ids_end = int(self._ids_off[self.rows])
+        for resume_id, keywords in pending:
+            row_terms = []
+            for term, count in keywords.items():
+                term_id = term_ids.get(term)
+                if term_id is None:
+                    term_id = term_ids[term] = len(self._term_list)
+                    self._term_list.append(term)
+                    encoded = term.encode('utf-8')
+                    new_terms += encoded
+                    terms_end += len(encoded)
+                    terms_off.append(terms_end)
+                row_terms.append((term_id, count))
+            row_terms.sort()
+            indices.extend(term_id for term_id, _ in row_terms)
+            counts.extend(count for _, count in row_terms)
+            nnz += len(row_terms)
+            indptr.append(nnz)
+            encoded = resume_id.encode('utf-8')
+            ids += encoded
+            ids_end += len(encoded)
+            ids_off.append(ids_end)
+
+        # Rows are committed by their indptr entry, so it is written last
+        for name, values in (('terms.bin', new_terms), ('terms.off', terms_off), ('indices', indices),
+                             ('counts', counts), ('ids.bin', ids), ('ids.off', ids_off),
+                             ('live', array('B', [1]) * len(pending)), ('indptr', indptr)):
+            _append(self._file(name), values)
+
+        superseded = []
+        for row, (resume_id, _) in enumerate(pending, self.rows):
+            if resume_id in row_ids:
+                superseded.append(row_ids[resume_id])
+            row_ids[resume_id] = row
+        self._clear_rows(superseded)
+
+        term_ids, term_list = self._term_ids, self._term_list
+        self.refresh()
+        self._term_ids, self._term_list, self._row_ids = term_ids, term_list, row_ids
+
+    def _clear_rows(self, rows):
+        if not rows:
+            return
+        with open(self._file('live'), 'r+b') as f:
+            for row in sorted(rows):
+                f.seek(row)
+                f.write(b'\0')
+
+    def remove(self, resume_id):
+        """Drop a resume; its row stays on disk until compact. Unknown ids are ignored"""
+        self._check_writable()
+        self.flush()
+        row = self._live_rows().pop(resume_id, None)
+        if row is None:
+            return False
+        self._clear_rows([row])
+        return True
+
+    def search(self, job_text, top_k=10):
+        """Rank stored resumes against a job description
+
+        Scores and keyword lists are the same as ``KeywordIndex.search``.
+        """
+        job_keywords = extract_keywords(job_text)
+        if not job_keywords or not self.rows:
+            return []
+        term_ids = self._vocabulary()
+        mask = np.zeros(self.term_count, dtype=bool)
+        mask[[term_ids[term] for term in job_keywords if term in term_ids]] = True
+
+        common = np.zeros(self.rows, dtype=np.int64)
+        for start in range(0, self.rows, BLOCK_ROWS):
+            stop = min(start + BLOCK_ROWS, self.rows)
+            bounds = self._indptr[start:stop + 1].astype(np.int64)
+            hits = np.zeros(int(bounds[-1] - bounds[0]) + 1, dtype=np.int32)
+            np.cumsum(mask[self._indices[bounds[0]:bounds[-1]]], out=hits[1:])
+            bounds -= bounds[0]
+            common[start:stop] = hits[bounds[1:]] - hits[bounds[:-1]]
+        common[self._live == 0] = 0
+
+        candidates = np.flatnonzero(common)
+        if len(candidates) > top_k:
+            candidates = candidates[np.argpartition(-common[candidates], top_k - 1)[:top_k]]
+        # Highest first; ties in the order the resumes were added
+        top = candidates[np.lexsort((candidates, -common[candidates]))]
+
+        top_job_keywords = [k for k, v in job_keywords.most_common(20)]
+        results = []
+        for row in top.tolist():
+            present = set(self._indices[self._indptr[row]:self._indptr[row + 1]].tolist())
+            matched = [k for k in top_job_keywords if term_ids.get(k) in present]
+            missing = [k for k in top_job_keywords if term_ids.get(k) not in present]
+            results.append({
+                'resume_id': self.resume_id(row),
+                'match_percentage': (int(common[row]) / len(job_keywords)) * 100,
+                'matched_keywords': matched[:10],
+                'missing_keywords': missing[:10]
+            })
+        return results
+
+    def compact(self):
+        """Rewrite the live rows and the terms they use as a new generation
+
+        Works a block of rows at a time, so memory stays bounded by the
+        vocabulary size rather than the corpus. Returns the number of rows
+        dropped.
+        """
+        self._check_writable()
+        self.flush()
+        live_rows = np.flatnonzero(self._live)
+        used = np.zeros(self.term_count, dtype=bool)
+        for start in range(0, len(live_rows), BLOCK_ROWS):
+            positions, _ = _gather(self._indptr, live_rows[start:start + BLOCK_ROWS])
+            used[self._indices[positions]] = True
+        used_terms = np.flatnonzero(used)
+        new_term_ids = (np.cumsum(used) - 1).astype(np.uint32)
+
+        generation = self.generation + 1
+        directory = os.path.join(self.path, f"gen-{generation}")
+        # Left over from a compaction that never switched CURRENT
+        shutil.rmtree(directory, ignore_errors=True)
+        _create_generation(directory)
+
+        def append(name, values):
+            _append(os.path.join(directory, name), values)
+
+        positions, lengths = _gather(self._terms_off, used_terms)
+        append('terms.bin', np.asarray(self._terms[positions]))
+        append('terms.off', np.cumsum(lengths, dtype=np.uint64))
+
+        nnz = ids_end = 0
+        for start in range(0, len(live_rows), BLOCK_ROWS):
+            rows = live_rows[start:start + BLOCK_ROWS]
+            positions, lengths = _gather(self._indptr, rows)
+            append('indices', new_term_ids[self._indices[positions]])
+            append('counts', np.asarray(self._counts[positions]))
+            id_positions, id_lengths = _gather(self._ids_off, rows)
+            append('ids.bin', np.asarray(self._ids[id_positions]))
+            append('ids.off', (ids_end + np.cumsum(id_lengths)).astype(np.uint64))
+            append('live', np.ones(len(rows), dtype=np.uint8))
+            append('indptr', (nnz + np.cumsum(lengths)).astype(np.uint64))
+            nnz += int(lengths.sum())
+            ids_end += int(id_lengths.sum())
+
+        dropped = self.rows - len(live_rows)
+        old_directory = self._directory
+        _write_current(self.path, generation)
+        self.refresh()
+        # Open maps of the old files stay valid after they are unlinked
+        shutil.rmtree(old_directory, ignore_errors=True)
+        return dropped
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Maintain and query a memory-mapped resume corpus store")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    add = commands.add_parser('add', help="add (or refresh) resumes from a directory")
+    add.add_argument('corpus')
+    add.add_argument('resumes')
+    add.add_argument('-w', '--workers', type=int, default=os.cpu_count())
+
+    remove = commands.add_parser('remove', help="remove resumes by id (their path)")
+    remove.add_argument('corpus')
+    remove.add_argument('resume_ids', nargs='+')
+
+    query = commands.add_parser('query', help="rank stored resumes against a job description")
+    query.add_argument('corpus')
+    query.add_argument('job')
+    query.add_argument('-k', '--top', type=int, default=10)
+
+    compact = commands.add_parser('compact', help="drop removed and superseded resumes and unused terms")
+    compact.add_argument('corpus')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'query':
+        store = CorpusStore(args.corpus)
+        with open(args.job, encoding='utf-8') as f:
+            job_description = f.read()
+        for hit in store.search(job_description, top_k=args.top):
+            print(json.dumps(hit))
+        return
+
+    with CorpusStore(args.corpus, writable=True) as store:
+        if args.command == 'add':
+            with Pool(args.workers) as pool:
+                for path, keywords, error in pool.imap_unordered(keywords_for_file, iter_resume_paths(args.resumes)):
+                    if error:
+                        print(f"{path}: {error}", file=sys.stderr)
+                    else:
+                        store.add_keywords(path, keywords)
+            store.flush()
+        elif args.command == 'remove':
+            removed = sum(store.remove(resume_id) for resume_id in args.resume_ids)
+            print(f"Removed {removed} resumes", file=sys.stderr)
+        else:
+            dropped = store.compact()
+            print(f"Dropped {dropped} rows", file=sys.stderr)
+        print(f"Corpus holds {len(store)} resumes and {store.term_count} terms", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""Near-duplicate resume detection with MinHash signatures and LSH.
+
+Applicant pools hold the same resume several times, often lightly edited. A
+resume's text is cut into overlapping three-word shingles and summarised by
+a MinHash signature: for each of 128 hash functions, the smallest hash of
+any shingle. The share of positions where two signatures agree estimates the
+Jaccard similarity of the two shingle sets.
+
+Signatures are split into 16 bands of 8 rows. Two resumes become candidates
+when any band hashes the same; candidates are then checked against the full
+signatures. With these settings a pair at 0.8 similarity is found about 95%
+of the time, and one at 0.9 almost always.
+
+``DedupIndex`` keeps signatures and band buckets in SQLite, by default a
+private temporary database on disk, so a run over 100k resumes stays within
+SQLite's page cache rather than holding every signature in Python objects.
+A payload (for the batch runner, the finished analysis) can be stored with
+each document so duplicates reuse it. Needs numpy (``pip install numpy``).
+
+Usage:
+    python -m resumematch.dedup resumes/ --threshold 0.8
+"""
+
+import argparse
+import hashlib
+import json
+import sqlite3
+import sys
+import threading
+import zlib
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from resumematch.tokenizer import default_tokenizer
+
+# Hash functions are (a * x + b) mod this prime, truncated to 32 bits
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = 0xFFFFFFFF
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    doc_id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL,
+    signature BLOB NOT NULL,
+    payload TEXT
+);
+CREATE TABLE IF NOT EXISTS buckets (
+    band INTEGER NOT NULL,
+    bucket INTEGER NOT NULL,
+    doc_id INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS buckets_lookup ON buckets (band, bucket);
+"""
+
+
+class MinHasher:
+    """MinHash signatures over word shingles"""
+
+    def __init__(self, num_perm=128, shingle_words=3, seed=1):
+        if np is None:
+            raise ImportError("Run: pip install numpy")
+        self.num_perm = num_perm
+        self.shingle_words = shingle_words
+        rng = np.random.RandomState(seed)
+        # a and b span the whole prime field so small shingle hashes are
+        # mixed too; a * x wraps at 2**64 before the modulus, as in the
+        # usual MinHash implementations
+        self._a = rng.randint(1, MERSENNE_PRIME, num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, MERSENNE_PRIME, num_perm, dtype=np.uint64)
+
+    def shingles(self, text):
+        """crc32 hashes of the overlapping word shingles in text"""
+        words = default_tokenizer.tokens(text)
+        size = self.shingle_words
+        if len(words) <= size:
+            return {zlib.crc32(" ".join(words).encode('utf-8'))} if words else set()
+        return {zlib.crc32(" ".join(words[start:start + size]).encode('utf-8'))
+                for start in range(len(words) - size + 1)}
+
+    def signature(self, text):
+        """uint32 array of num_perm minimum hashes"""
+        shingles = self.shingles(text)
+        if not shingles:
+            return np.full(self.num_perm, MAX_HASH, dtype=np.uint32)
+        hashes = np.fromiter(shingles, dtype=np.uint64, count=len(shingles))
+        permuted = (np.outer(hashes, self._a) + self._b) % np.uint64(MERSENNE_PRIME)
+        return (permuted.min(axis=0) & np.uint64(MAX_HASH)).astype(np.uint32)
+
+
+def similarity(first, second):
+    """Estimated Jaccard similarity of two signatures"""
+    return float(np.count_nonzero(first == second)) / len(first)
+
+
+class DedupIndex:
+    """LSH index of MinHash signatures in SQLite
+
+    ``path`` defaults to a private temporary database on disk that is
+    deleted when the index is closed.
+    """
+
+    def __init__(self, path='', threshold=0.8, num_perm=128, bands=16):
+        if np is None:
+            raise ImportError("Run: pip install numpy")
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def _buckets(self, signature):
+        rows = self.rows
+        for band in range(self.bands):
+            digest = hashlib.blake2b(signature[band * rows:(band + 1) * rows].tobytes(), digest_size=8).digest()
+            yield band, int.from_bytes(digest, 'big', signed=True)
+
+    def query(self, signature):
+        """(doc_id, key, similarity) of the closest indexed near-duplicate, or None"""
+        signature = np.asarray(signature, dtype=np.uint32)
+        best = None
+        with self._lock:
+            candidates = set()
+            for band, bucket in self._buckets(signature):
+                candidates.update(doc_id for doc_id, in self._conn.execute(
+                    "SELECT doc_id FROM buckets WHERE band = ? AND bucket = ?", (band, bucket)))
+            for doc_id in sorted(candidates):
+                key, stored = self._conn.execute(
+                    "SELECT key, signature FROM documents WHERE doc_id = ?", (doc_id,)).fetchone()
+                score = similarity(signature, np.frombuffer(stored, dtype=np.uint32))
+                if score >= self.threshold and (best is None or score > best[2]):
+                    best = (doc_id, key, score)
+        return best
+
+    def add(self, key, signature, payload=None):
+        """Index a document and return its doc_id"""
+        signature = np.asarray(signature, dtype=np.uint32)
+        with self._lock:
+            with self._conn:
+                doc_id = self._conn.execute(
+                    "INSERT INTO documents (key, signature, payload) VALUES (?, ?, ?)",
+                    (key, signature.tobytes(), payload)
+                ).lastrowid
+                self._conn.executemany(
+                    "INSERT INTO buckets (band, bucket, doc_id) VALUES (?, ?, ?)",
+                    [(band, bucket, doc_id) for band, bucket in self._buckets(signature)]
+                )
+        return doc_id
+
+    def check(self, key, signature):
+        """(doc_id, duplicate) for a new document
+
+        ``duplicate`` is the (doc_id, key, similarity) of an indexed
+        near-duplicate, in which case nothing is added; otherwise it is None
+        and doc_id is the newly indexed document.
+        """
+        duplicate = self.query(signature)
+        if duplicate is not None:
+            return duplicate[0], duplicate
+        return self.add(key, signature), None
+
+    def set_payload(self, doc_id, payload):
+        with self._lock:
+            with self._conn:
+                self._conn.execute("UPDATE documents SET payload = ? WHERE doc_id = ?", (payload, doc_id))
+
+    def get_payload(self, doc_id):
+        with self._lock:
+            row = self._conn.execute("SELECT payload FROM documents WHERE doc_id = ?", (doc_id,)).fetchone()
+        return row[0] if row else None
+
+    def close(self):
+        self._conn.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="List near-duplicate resumes in a directory")
+    parser.add_argument('resumes', help="directory of PDF/DOCX resumes")
+    parser.add_argument('--threshold', type=float, default=0.8, help="estimated Jaccard similarity to flag")
+    args = parser.parse_args(argv)
+
+    from resumematch.batch import iter_resume_paths
+    from resumematch.cache import extract_text_cached
+    from resumematch.core import ExtractionError
+
+    hasher = MinHasher()
+    index = DedupIndex(threshold=args.threshold)
+    flagged = 0
+    for path in iter_resume_paths(args.resumes):
+        try:
+            with open(path, 'rb') as f:
+                text = extract_text_cached(f.read(), path)
+        except ExtractionError as e:
+            print(f"{path}: {e}", file=sys.stderr)
+            continue
+        _, duplicate = index.check(path, hasher.signature(text))
+        if duplicate is not None:
+            flagged += 1
+            print(json.dumps({'file': path, 'duplicate_of': duplicate[1], 'similarity': round(duplicate[2], 3)}))
+    print(f"{flagged} near-duplicates among {flagged + len(index)} resumes", file=sys.stderr)
+    index.close()
+
+
+if __name__ == "__main__":
+    main()
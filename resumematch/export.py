@@ -0,0 +1,230 @@
+"""Streaming JSONL and CSV report writers for batch runs.
+
+Records are written and flushed one at a time, so a run of any size never
+holds more than the current record in memory. Each record carries the file's
+content hash; reopening a report with ``resume=True`` collects the hashes
+already written so a restarted run can skip them.
+
+A JSONL record is the single-report download (``date``, ``file``,
+``analysis``) plus ``file_hash``; failed files get an ``error`` instead of an
+``analysis``. CSV rows flatten the same analysis dict into columns.
+"""
+
+import csv
+import json
+import os
+import sys
+from datetime import datetime
+
+# Flattened analysis columns, in the order the web report shows them
+CSV_FIELDS = [
+    'date', 'file', 'file_hash', 'error',
+    'match_score', 'overall_assessment',
+    'experience_score', 'skills_score', 'education_score', 'ats_score',
+    'strengths', 'weaknesses', 'recommendations',
+    'keyword_matches', 'missing_skills', 'ats_issues', 'ats_improvements',
+    'duplicate_of', 'similarity'
+]
+
+LIST_SEPARATOR = '; '
+
+
+def make_record(file, file_hash, analysis=None, error=None):
+    """Report record for one resume, matching the single-report download"""
+    record = {
+        'date': datetime.now().isoformat(),
+        'file': file,
+        'file_hash': file_hash
+    }
+    if error is not None:
+        record['error'] = error
+    else:
+        record['analysis'] = analysis
+    return record
+
+
+def _truncate_partial_line(path):
+    """Drop a half-written last line left behind by a crashed run"""
+    with open(path, 'rb+') as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        if size == 0:
+            return
+        f.seek(size - 1)
+        if f.read(1) == b'\n':
+            return
+        position = size
+        while position > 0:
+            step = min(4096, position)
+            position -= step
+            f.seek(position)
+            newline = f.read(step).rfind(b'\n')
+            if newline != -1:
+                f.truncate(position + newline + 1)
+                return
+        f.truncate(0)
+
+
+class ReportWriter:
+    """Base class: open for append, track scored resumes, flush per record
+
+    ``completed`` holds the file hashes of resumes scored successfully, the
+    ones a resumed run skips; records with an error are left out so they are
+    tried again. ``scores`` maps each scored file's path to its match score,
+    old records and new, for ranking.
+    """
+
+    def __init__(self, path, resume=False, stream=None):
+        self.path = path
+        self.completed = set()
+        self.scores = {}
+        self._owns_file = stream is None
+        if stream is not None:
+            self._file = stream
+            self._start(False)
+            return
+        exists = resume and os.path.exists(path) and os.path.getsize(path) > 0
+        if exists:
+            self._truncate_partial(path)
+            exists = os.path.getsize(path) > 0
+        if exists:
+            for file_hash, file, score in self._scan(path):
+                self._track(file_hash, file, score)
+        self._file = open(path, 'a' if exists else 'w', encoding='utf-8', newline='')
+        self._start(exists)
+
+    def _truncate_partial(self, path):
+        _truncate_partial_line(path)
+
+    def _scan(self, path):
+        raise NotImplementedError
+
+    def _start(self, appending):
+        pass
+
+    def write(self, record):
+        self._write(record)
+        self._file.flush()
+        analysis = record.get('analysis')
+        self._track(record.get('file_hash'), record['file'], analysis['match_score'] if analysis else None)
+
+    def _track(self, file_hash, file, score):
+        if file_hash and score is not None:
+            self.completed.add(file_hash)
+            self.scores[file] = score
+
+    def close(self):
+        if self._owns_file:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class JsonlReportWriter(ReportWriter):
+    """One JSON record per line"""
+
+    def _scan(self, path):
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                analysis = record.get('analysis')
+                yield record.get('file_hash'), record.get('file'), analysis['match_score'] if analysis else None
+
+    def _write(self, record):
+        self._file.write(json.dumps(record) + "\n")
+
+
+def flatten_record(record):
+    """CSV row for a report record"""
+    row = {'date': record['date'], 'file': record['file'],
+           'file_hash': record['file_hash'], 'error': record.get('error', ''),
+           'duplicate_of': record.get('duplicate_of', ''), 'similarity': record.get('similarity', '')}
+    analysis = record.get('analysis')
+    if analysis:
+        row['match_score'] = analysis['match_score']
+        row['overall_assessment'] = analysis['overall_assessment']
+        row['experience_score'] = analysis['experience_alignment']['score']
+        row['skills_score'] = analysis['skills_alignment']['score']
+        row['education_score'] = analysis['education_alignment']['score']
+        row['ats_score'] = analysis['ats_compatibility']['score']
+        for field in ('strengths', 'weaknesses', 'recommendations', 'keyword_matches', 'missing_skills'):
+            row[field] = LIST_SEPARATOR.join(str(item) for item in analysis.get(field, []))
+        row['ats_issues'] = LIST_SEPARATOR.join(analysis['ats_compatibility']['issues'])
+        row['ats_improvements'] = LIST_SEPARATOR.join(analysis['ats_compatibility']['improvements'])
+    return row
+
+
+def _number(value):
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+class CsvReportWriter(ReportWriter):
+    """Flattened analysis, one row per resume
+
+    Resuming needs a report with this version's columns; one written with
+    different columns raises ValueError rather than getting mismatched rows
+    appended to it.
+    """
+
+    def _truncate_partial(self, path):
+        # A quoted field can hold newlines, so the last complete record is
+        # found with the CSV parser rather than at the last newline
+        consumed = 0
+        complete = False
+        boundary = 0
+        header = None
+
+        def lines(f):
+            nonlocal consumed, complete
+            for line in f:
+                consumed += len(line)
+                complete = line.endswith(b'\n')
+                yield line.decode('utf-8', errors='replace')
+            complete = False
+
+        with open(path, 'rb') as f:
+            for row in csv.reader(lines(f)):
+                if not complete:
+                    break
+                boundary = consumed
+                if header is None:
+                    header = row
+        if header is not None and header != CSV_FIELDS:
+            raise ValueError(f"{path} has different columns than this version writes; "
+                             f"write to a new file instead of resuming")
+        if boundary < os.path.getsize(path):
+            with open(path, 'rb+') as f:
+                f.truncate(boundary)
+
+    def _scan(self, path):
+        with open(path, encoding='utf-8', newline='') as f:
+            for row in csv.DictReader(f):
+                score = row.get('match_score')
+                yield row.get('file_hash'), row.get('file'), _number(score) if score else None
+
+    def _start(self, appending):
+        self._writer = csv.DictWriter(self._file, fieldnames=CSV_FIELDS, extrasaction='ignore')
+        if not appending:
+            self._writer.writeheader()
+
+    def _write(self, record):
+        self._writer.writerow(flatten_record(record))
+
+
+def open_report(path, resume=False):
+    """Writer for path, CSV for .csv files and JSONL otherwise; "-" is stdout"""
+    if path == '-':
+        return JsonlReportWriter(path, stream=sys.stdout)
+    if path.lower().endswith('.csv'):
+        return CsvReportWriter(path, resume=resume)
+    return JsonlReportWriter(path, resume=resume)
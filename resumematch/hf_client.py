@@ -0,0 +1,243 @@
+"""Pooled, cached client for the Hugging Face inference call.
+
+One ``requests.Session`` is shared by every call so connections are reused.
+A semaphore bounds how many requests are in flight, 503 "model is loading"
+responses are retried with backoff, and successful analyses are cached by
+(resume snippet, job snippet, endpoint, parameters) so the same pair is never
+paid for twice. ``analyze`` is the async entry point; ``analyze_sync`` is for
+callers without an event loop.
+
+Point ``RESUMEMATCH_HF_API_URL`` at a local stub server to run without the
+real endpoint.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from resumematch import config, metrics
+from resumematch.llm_json import LLMJSONError, extract_object
+
+RESUME_SNIPPET_CHARS = 2500
+JOB_SNIPPET_CHARS = 1500
+
+DEFAULT_PARAMETERS = {
+    "max_new_tokens": 800,
+    "temperature": 0.5,
+    "return_full_text": False
+}
+
+REQUIRED_FIELDS = ['match_score', 'overall_assessment', 'strengths', 'weaknesses', 'recommendations']
+
+ANALYSIS_SCHEMA = {
+    'match_score': int,
+    'overall_assessment': str,
+    'strengths': list,
+    'weaknesses': list,
+    'experience_score': int,
+    'skills_score': int,
+    'education_score': int,
+    'recommendations': list
+}
+
+# Longest single wait between retries, whatever the server estimates
+MAX_BACKOFF_SECONDS = 30
+
+
+def build_prompt(resume_snippet, job_snippet):
+    return f"""Analyze resume vs job. Be professional.
+
+RESUME:
+{resume_snippet}
+
+JOB:
+{job_snippet}
+
+Return ONLY this JSON (no other text):
+{{
+  "match_score": 75,
+  "overall_assessment": "Professional 2-3 sentence summary",
+  "strengths": ["strength 1", "strength 2", "strength 3"],
+  "weaknesses": ["weakness 1", "weakness 2", "weakness 3"],
+  "experience_score": 75,
+  "skills_score": 80,
+  "education_score": 70,
+  "recommendations": ["tip 1", "tip 2", "tip 3"]
+}}"""
+
+
+def parse_analysis(result):
+    """Pull the analysis dict out of an inference response, or None
+
+    Failures are counted as ai_json_parse_failure plus one of
+    ai_json_no_object, ai_json_truncated, ai_json_invalid or ai_json_schema.
+    """
+    if isinstance(result, list) and len(result) > 0:
+        generated_text = result[0].get('generated_text', '')
+    elif isinstance(result, dict):
+        generated_text = result.get('generated_text', '')
+    else:
+        return None
+
+    try:
+        return extract_object(generated_text, ANALYSIS_SCHEMA, REQUIRED_FIELDS)
+    except LLMJSONError as e:
+        metrics.increment("ai_json_parse_failure")
+        metrics.increment(f"ai_json_{e.reason}")
+        return None
+
+
+class InferenceClient:
+    """Shared-connection client for the resume analysis model"""
+
+    def __init__(self, api_url=None, timeout=None, max_concurrency=None, max_retries=None,
+                 backoff=2.0, cache_entries=None, parameters=None):
+        self.api_url = api_url or config.HF_API_URL
+        self.timeout = timeout or config.HF_TIMEOUT
+        self.max_concurrency = max_concurrency or config.HF_MAX_CONCURRENCY
+        self.max_retries = config.HF_MAX_RETRIES if max_retries is None else max_retries
+        self.backoff = backoff
+        self.cache_entries = config.HF_CACHE_ENTRIES if cache_entries is None else cache_entries
+        self.parameters = dict(parameters or DEFAULT_PARAMETERS)
+
+        # requests is only imported once a client is built, so importing the
+        # scoring core stays cheap for callers that never use the AI
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_concurrency)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({"Content-Type": "application/json"})
+
+        # A thread semaphore rather than an asyncio one, so the bound holds
+        # across event loops and for analyze_sync callers too.
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._key_locks = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def cache_key(self, resume_snippet, job_snippet):
+        payload = json.dumps([resume_snippet, job_snippet, self.api_url, self.parameters], sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _cache_get(self, key):
+        with self._cache_lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+                return self._cache[key]
+            self.cache_misses += 1
+            return None
+
+    def _cache_put(self, key, value):
+        with self._cache_lock:
+            self._cache[key] = value
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_entries:
+                self._cache.popitem(last=False)
+
+    def _key_lock(self, key):
+        with self._cache_lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _retry_delay(self, response, attempt):
+        delay = self.backoff * (2 ** attempt)
+        try:
+            estimated = response.json().get('estimated_time')
+        except (ValueError, AttributeError):
+            estimated = None
+        try:
+            delay = max(delay, float(estimated or 0))
+        except (TypeError, ValueError):
+            pass
+        return min(delay, MAX_BACKOFF_SECONDS)
+
+    def _post(self, prompt):
+        """POST the prompt, retrying while the model is loading"""
+        for attempt in range(self.max_retries + 1):
+            with self._slots:
+                response = self.session.post(
+                    self.api_url,
+                    json={"inputs": prompt, "parameters": self.parameters},
+                    timeout=self.timeout
+                )
+            if response.status_code != 503 or attempt == self.max_retries:
+                return response
+            metrics.increment("ai_retry")
+            time.sleep(self._retry_delay(response, attempt))
+        return response
+
+    def analyze_sync(self, resume_text, job_description):
+        """Blocking analysis; returns the analysis dict or None"""
+        resume_snippet = resume_text[:RESUME_SNIPPET_CHARS]
+        job_snippet = job_description[:JOB_SNIPPET_CHARS]
+        key = self.cache_key(resume_snippet, job_snippet)
+
+        cached = self._cache_get(key)
+        if cached is not None:
+            metrics.increment("ai_cache_hit")
+            return dict(cached)
+
+        # Identical concurrent requests wait for the first one and reuse it.
+        # The lock is only dropped once the result is cached, so a caller
+        # arriving after that finds the cache rather than a fresh lock.
+        with self._key_lock(key):
+            try:
+                with self._cache_lock:
+                    cached = self._cache.get(key)
+                if cached is not None:
+                    return dict(cached)
+
+                analysis = self._request(resume_snippet, job_snippet)
+                if analysis is None:
+                    return None
+                self._cache_put(key, analysis)
+                return dict(analysis)
+            finally:
+                with self._cache_lock:
+                    self._key_locks.pop(key, None)
+
+    def _request(self, resume_snippet, job_snippet):
+        """One analysis from the endpoint, or None"""
+        try:
+            with metrics.timed("ai_call"):
+                response = self._post(build_prompt(resume_snippet, job_snippet))
+            if response.status_code != 200:
+                metrics.increment("ai_http_error")
+                return None
+            return parse_analysis(response.json())
+        except Exception:
+            metrics.increment("ai_request_error")
+            return None
+
+    async def analyze(self, resume_text, job_description):
+        """Async analysis; the HTTP call runs on a worker thread"""
+        import asyncio
+        return await asyncio.to_thread(self.analyze_sync, resume_text, job_description)
+
+    async def analyze_many(self, pairs):
+        """Analyze (resume_text, job_description) pairs concurrently"""
+        import asyncio
+        return await asyncio.gather(*(self.analyze(resume, job) for resume, job in pairs))
+
+    def close(self):
+        self.session.close()
+
+
+_default_client = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client():
+    """Process-wide client configured from resumematch.config"""
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = InferenceClient()
+        return _default_client
@@ -0,0 +1,172 @@
+"""Inverted keyword index for ranking a resume corpus against a job.
+
+Resumes are tokenized once with ``extract_keywords`` on ingest. Matching a job
+description then only tokenizes the job and walks the posting lists of its
+keywords, so the cost depends on the job and the postings it touches rather
+than on the total length of every resume.
+
+Usage:
+    python -m resumematch.index add corpus.json resumes/
+    python -m resumematch.index query corpus.json job.txt -k 20
+    python -m resumematch.index remove corpus.json resumes/old.pdf
+"""
+
+import argparse
+import heapq
+import json
+import os
+import sys
+from collections import Counter, defaultdict
+from multiprocessing import Pool
+
+from resumematch.batch import iter_resume_paths, keywords_for_file
+from resumematch.core import extract_keywords
+
+
+class KeywordIndex:
+    """Term -> posting list of {resume_id: count}, with incremental updates"""
+
+    def __init__(self):
+        self.postings = defaultdict(dict)
+        # Forward map so a resume can be removed without scanning every term
+        self.documents = {}
+
+    def __len__(self):
+        return len(self.documents)
+
+    def __contains__(self, resume_id):
+        return resume_id in self.documents
+
+    def add(self, resume_id, resume_text):
+        """Index a resume, replacing any earlier version with the same id"""
+        self.add_keywords(resume_id, extract_keywords(resume_text))
+
+    def add_keywords(self, resume_id, keywords):
+        """Index an already tokenized resume (a Counter from extract_keywords)"""
+        if resume_id in self.documents:
+            self.remove(resume_id)
+        for term, count in keywords.items():
+            self.postings[term][resume_id] = count
+        self.documents[resume_id] = list(keywords)
+
+    def remove(self, resume_id):
+        """Drop a resume from the index; unknown ids are ignored"""
+        terms = self.documents.pop(resume_id, None)
+        if terms is None:
+            return False
+        for term in terms:
+            posting = self.postings.get(term)
+            if posting is None:
+                continue
+            posting.pop(resume_id, None)
+            if not posting:
+                del self.postings[term]
+        return True
+
+    def contains_term(self, resume_id, term):
+        posting = self.postings.get(term)
+        return posting is not None and resume_id in posting
+
+    def search(self, job_text, top_k=10):
+        """Rank indexed resumes against a job description
+
+        Scores use the same formula as ``calculate_keyword_match`` and each
+        hit carries the same matched/missing keyword lists.
+        """
+        job_keywords = extract_keywords(job_text)
+        if not job_keywords:
+            return []
+
+        common = Counter()
+        for term in job_keywords:
+            posting = self.postings.get(term)
+            if posting:
+                common.update(posting.keys())
+
+        top = heapq.nlargest(top_k, common.items(), key=lambda item: item[1])
+        top_job_keywords = [k for k, v in job_keywords.most_common(20)]
+
+        results = []
+        for resume_id, common_count in top:
+            matched = [k for k in top_job_keywords if self.contains_term(resume_id, k)]
+            missing = [k for k in top_job_keywords if not self.contains_term(resume_id, k)]
+            results.append({
+                'resume_id': resume_id,
+                'match_percentage': (common_count / len(job_keywords)) * 100,
+                'matched_keywords': matched[:10],
+                'missing_keywords': missing[:10]
+            })
+        return results
+
+    def to_dict(self):
+        return {
+            'documents': self.documents,
+            'postings': self.postings
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        index = cls()
+        index.documents = dict(data['documents'])
+        index.postings = defaultdict(dict, data['postings'])
+        return index
+
+    def save(self, path):
+        """Persist the index as JSON, replacing the file atomically"""
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """Load an index saved with save(); a missing file gives an empty index"""
+        if not os.path.exists(path):
+            return cls()
+        with open(path, encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Maintain and query a resume keyword index")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    add = commands.add_parser('add', help="add (or refresh) resumes from a directory")
+    add.add_argument('index')
+    add.add_argument('resumes')
+    add.add_argument('-w', '--workers', type=int, default=os.cpu_count())
+
+    remove = commands.add_parser('remove', help="remove resumes by id (their path)")
+    remove.add_argument('index')
+    remove.add_argument('resume_ids', nargs='+')
+
+    query = commands.add_parser('query', help="rank indexed resumes against a job description")
+    query.add_argument('index')
+    query.add_argument('job')
+    query.add_argument('-k', '--top', type=int, default=10)
+
+    args = parser.parse_args(argv)
+    index = KeywordIndex.load(args.index)
+
+    if args.command == 'add':
+        with Pool(args.workers) as pool:
+            for path, keywords, error in pool.imap_unordered(keywords_for_file, iter_resume_paths(args.resumes)):
+                if error:
+                    print(f"{path}: {error}", file=sys.stderr)
+                else:
+                    index.add_keywords(path, keywords)
+        index.save(args.index)
+        print(f"Index holds {len(index)} resumes", file=sys.stderr)
+    elif args.command == 'remove':
+        removed = sum(index.remove(resume_id) for resume_id in args.resume_ids)
+        index.save(args.index)
+        print(f"Removed {removed} resumes", file=sys.stderr)
+    else:
+        with open(args.job, encoding='utf-8') as f:
+            job_description = f.read()
+        for hit in index.search(job_description, top_k=args.top):
+            print(json.dumps(hit))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""SQLite store of preprocessed job descriptions.
+
+A job description is ingested once: its whitespace is normalized, it is
+tokenized, and its keyword counts and top 20 keywords are stored next to the
+text. Analyses then reference the job by id, or by its text (looked up by
+content hash), and get a ``JobProfile`` back without tokenizing the job
+again. Loaded profiles are also kept in a small in-memory LRU.
+
+Usage:
+    python -m resumematch.job_store jobs.sqlite add job.txt --title "Data Analyst"
+    python -m resumematch.job_store jobs.sqlite import jobs.csv
+    python -m resumematch.job_store jobs.sqlite list
+    python -m resumematch.job_store jobs.sqlite remove JOB_ID
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sqlite3
+import sys
+import threading
+from collections import Counter, OrderedDict
+from datetime import datetime
+
+from resumematch import config
+from resumematch.multi_job import JobProfile, build_job_profile, parse_jobs
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    content_hash TEXT NOT NULL,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    keywords TEXT NOT NULL,
+    top_keywords TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_content_hash ON jobs (content_hash);
+"""
+
+_SPACES = re.compile(r'[ \t\f\v]+')
+
+
+def normalize_description(text):
+    """Unify line endings, collapse runs of spaces and drop blank edges"""
+    lines = (_SPACES.sub(' ', line).strip() for line in text.replace('\r\n', '\n').replace('\r', '\n').split('\n'))
+    return "\n".join(lines).strip()
+
+
+def content_hash(text):
+    return hashlib.sha256(normalize_description(text).encode('utf-8')).hexdigest()
+
+
+class JobStore:
+    """Persistent job profiles keyed by id, with lookup by content hash
+
+    ``path`` defaults to RESUMEMATCH_JOB_STORE; without one the store lives
+    in memory for the life of the process.
+    """
+
+    def __init__(self, path=None, cache_entries=256):
+        self.path = path or config.JOB_STORE_PATH or ':memory:'
+        # One connection shared across threads (Streamlit serves sessions on
+        # threads); the lock serializes access to it.
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+        self._cache = OrderedDict()
+        self.cache_entries = cache_entries
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def __contains__(self, job_id):
+        return self.get(job_id) is not None
+
+    def _remember(self, profile):
+        self._cache[profile.job_id] = profile
+        self._cache.move_to_end(profile.job_id)
+        while len(self._cache) > self.cache_entries:
+            self._cache.popitem(last=False)
+        return profile
+
+    def add(self, description, title=None, job_id=None):
+        """Ingest a job description and return its JobProfile
+
+        The id defaults to the first 16 hex digits of the content hash, so
+        adding the same text twice returns the stored profile. An explicit
+        id replaces whatever was stored under it.
+        """
+        description = normalize_description(description)
+        digest = content_hash(description)
+        if job_id is None:
+            job_id = digest[:16]
+            existing = self.get(job_id)
+            if existing is not None:
+                return existing
+        job_id = str(job_id)
+        profile = build_job_profile(job_id, description, title)
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (job_id, digest, profile.title, description,
+                     json.dumps(list(profile.keywords.items())), json.dumps(profile.top_keywords),
+                     datetime.now().isoformat())
+                )
+            return self._remember(profile)
+
+    def _load(self, row):
+        job_id, title, description, keywords, top_keywords = row
+        return JobProfile(job_id, title, Counter(dict(json.loads(keywords))),
+                          json.loads(top_keywords), description)
+
+    def get(self, job_id):
+        """JobProfile for job_id, or None"""
+        job_id = str(job_id)
+        with self._lock:
+            if job_id in self._cache:
+                self._cache.move_to_end(job_id)
+                return self._cache[job_id]
+            row = self._conn.execute(
+                "SELECT job_id, title, description, keywords, top_keywords FROM jobs WHERE job_id = ?",
+                (job_id,)
+            ).fetchone()
+            return self._remember(self._load(row)) if row else None
+
+    def find(self, description):
+        """JobProfile of a stored job with the same normalized text, or None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT job_id FROM jobs WHERE content_hash = ? LIMIT 1", (content_hash(description),)
+            ).fetchone()
+        return self.get(row[0]) if row else None
+
+    def ingest(self, description, title=None):
+        """Stored profile for this text, adding it first if it is new"""
+        return self.find(description) or self.add(description, title)
+
+    def remove(self, job_id):
+        job_id = str(job_id)
+        with self._lock:
+            self._cache.pop(job_id, None)
+            with self._conn:
+                return self._conn.execute("DELETE FROM jobs WHERE job_id = ?", (job_id,)).rowcount > 0
+
+    def list(self):
+        """(job_id, title, created_at) for every stored job, oldest first"""
+        with self._lock:
+            return self._conn.execute("SELECT job_id, title, created_at FROM jobs ORDER BY created_at").fetchall()
+
+    def profiles(self):
+        """Every stored JobProfile"""
+        return [self.get(job_id) for job_id, _, _ in self.list()]
+
+    def close(self):
+        self._conn.close()
+
+
+_default_store = None
+_default_store_lock = threading.Lock()
+
+
+def get_default_store():
+    """Process-wide store at RESUMEMATCH_JOB_STORE (in memory if unset)"""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = JobStore()
+        return _default_store
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Maintain a store of preprocessed job descriptions")
+    parser.add_argument('store', help="SQLite file")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    add = commands.add_parser('add', help="ingest one job description from a text file")
+    add.add_argument('job')
+    add.add_argument('--title')
+    add.add_argument('--id', dest='job_id')
+
+    load = commands.add_parser('import', help="ingest every job in a CSV, JSON, JSONL or ---separated file")
+    load.add_argument('jobs')
+
+    commands.add_parser('list', help="list stored jobs")
+
+    remove = commands.add_parser('remove', help="remove jobs by id")
+    remove.add_argument('job_ids', nargs='+')
+
+    args = parser.parse_args(argv)
+    store = JobStore(args.store)
+
+    if args.command == 'add':
+        with open(args.job, encoding='utf-8') as f:
+            profile = store.add(f.read(), title=args.title, job_id=args.job_id)
+        print(profile.job_id)
+    elif args.command == 'import':
+        with open(args.jobs, 'rb') as f:
+            jobs = parse_jobs(f.read(), args.jobs)
+        for job_id, title, description in jobs:
+            # parse_jobs numbers records that carry no id; let those fall
+            # back to content-hash ids so separate imports do not collide
+            if isinstance(job_id, int):
+                job_id = None
+            print(store.add(description, title=title, job_id=job_id).job_id)
+    elif args.command == 'list':
+        for job_id, title, created_at in store.list():
+            print(json.dumps({'job_id': job_id, 'title': title, 'created_at': created_at}))
+    else:
+        removed = sum(store.remove(job_id) for job_id in args.job_ids)
+        print(f"Removed {removed} jobs", file=sys.stderr)
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
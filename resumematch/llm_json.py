@@ -0,0 +1,180 @@
+"""Pull a JSON object out of free-form model output.
+
+Generated text is rarely clean JSON: the object sits between sentences or
+inside a ```json fence, keys and strings come in single quotes, and lists end
+with a trailing comma. ``ObjectScanner`` walks the text once, character by
+character, tracking nesting depth and string state, and hands back each
+balanced top-level ``{...}`` as soon as it closes. While it copies an object
+out it rewrites single-quoted strings to double-quoted ones and drops
+trailing commas, so the result usually parses with ``json.loads``.
+
+Candidates never overlap, so finding the first usable object is linear in
+the length of the output however deeply it nests. Text can be fed in pieces,
+which lets a streamed response be scanned as it arrives.
+
+``extract_object`` returns the first candidate that parses and matches a
+schema, or raises ``LLMJSONError`` whose ``reason`` says what went wrong.
+"""
+
+import json
+
+_WHITESPACE = ' \t\r\n'
+
+
+class LLMJSONError(ValueError):
+    """No usable JSON object; ``reason`` is one of no_object, truncated,
+    invalid or schema"""
+
+    def __init__(self, message, reason):
+        super().__init__(message)
+        self.reason = reason
+
+
+class ObjectScanner:
+    """Incremental scanner for balanced top-level JSON objects"""
+
+    def __init__(self):
+        self._depth = 0
+        self._quote = None      # quote character of the open string, if any
+        self._escaped = False
+        self._buffer = []
+
+    @property
+    def inside_object(self):
+        """True while an object has been opened but not closed"""
+        return self._depth > 0
+
+    def feed(self, text):
+        """Scan more text and return the objects it completed, as strings"""
+        found = []
+        buffer = self._buffer
+        for char in text:
+            if self._depth == 0:
+                # Outside an object only an opening brace matters; prose,
+                # fences and stray apostrophes are skipped
+                if char == '{':
+                    self._depth = 1
+                    buffer.append(char)
+                continue
+
+            if self._quote is not None:
+                if self._escaped:
+                    self._escaped = False
+                    # \' is not a JSON escape; the quote needs none once the
+                    # string is double-quoted
+                    if char == "'" and self._quote == "'":
+                        buffer[-1] = char
+                    else:
+                        buffer.append(char)
+                elif char == '\\':
+                    self._escaped = True
+                    buffer.append(char)
+                elif char == self._quote:
+                    self._quote = None
+                    buffer.append('"')
+                elif char == '"':
+                    # A double quote inside a single-quoted string
+                    buffer.append('\\"')
+                else:
+                    buffer.append(char)
+                continue
+
+            if char == '"' or char == "'":
+                self._quote = char
+                buffer.append('"')
+            elif char == '{' or char == '[':
+                self._depth += 1
+                buffer.append(char)
+            elif char == '}' or char == ']':
+                # Drop a trailing comma: [1, 2, ] and {"a": 1, }
+                end = len(buffer)
+                while end and buffer[end - 1] in _WHITESPACE:
+                    end -= 1
+                if end and buffer[end - 1] == ',':
+                    del buffer[end - 1:]
+                buffer.append(char)
+                self._depth -= 1
+                if self._depth == 0:
+                    found.append("".join(buffer))
+                    buffer.clear()
+            else:
+                buffer.append(char)
+        return found
+
+
+def _check_field(value, expected):
+    """value converted to the expected type, or None if it cannot be"""
+    if expected is int:
+        if isinstance(value, bool):
+            return None
+        if isinstance(value, (int, float)):
+            return int(round(value))
+        if isinstance(value, str):
+            try:
+                return int(round(float(value.strip().rstrip('%'))))
+            except ValueError:
+                return None
+        return None
+    if expected is str:
+        return value.strip() if isinstance(value, str) else None
+    if expected is list:
+        if isinstance(value, str):
+            value = [value]
+        if isinstance(value, list) and all(isinstance(item, str) for item in value):
+            return [item.strip() for item in value if item.strip()]
+        return None
+    return value if isinstance(value, expected) else None
+
+
+def validate(data, schema, required=()):
+    """Check a parsed object against {field: type}
+
+    Returns the object with fields coerced where that is unambiguous
+    (numeric strings to int, a lone string to a one-item list), or raises
+    LLMJSONError. Fields not in the schema are kept as they are; optional
+    fields of the wrong type are dropped.
+    """
+    if not isinstance(data, dict):
+        raise LLMJSONError("Expected a JSON object", reason="schema")
+    missing = [field for field in required if field not in data]
+    if missing:
+        raise LLMJSONError(f"Missing fields: {', '.join(missing)}", reason="schema")
+    cleaned = dict(data)
+    for field, expected in schema.items():
+        if field not in data:
+            continue
+        value = _check_field(data[field], expected)
+        if value is not None:
+            cleaned[field] = value
+        elif field in required:
+            raise LLMJSONError(f"Field {field!r} should be {expected.__name__}", reason="schema")
+        else:
+            del cleaned[field]
+    return cleaned
+
+
+def extract_object(text, schema=None, required=()):
+    """First JSON object in text that parses and matches schema
+
+    Raises LLMJSONError with reason "no_object" when the text holds no
+    object, "truncated" when it ends inside one, and "invalid" or "schema"
+    when every object found failed to parse or to validate.
+    """
+    scanner = ObjectScanner()
+    error = None
+    for candidate in scanner.feed(text):
+        try:
+            # strict=False lets raw newlines and tabs appear inside strings
+            data = json.loads(candidate, strict=False)
+        except ValueError as e:
+            error = LLMJSONError(f"Invalid JSON: {e}", reason="invalid")
+            continue
+        try:
+            return validate(data, schema or {}, required)
+        except LLMJSONError as e:
+            error = e
+    if error is None:
+        if scanner.inside_object:
+            raise LLMJSONError("Output ended inside a JSON object", reason="truncated")
+        raise LLMJSONError("No JSON object in output", reason="no_object")
+    raise error
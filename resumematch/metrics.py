@@ -0,0 +1,176 @@
+"""Per-stage timers and counters for the analysis pipeline.
+
+Stages are timed with ``with metrics.timed("extraction"):`` and events counted
+with ``metrics.increment("ai_success")``. Everything lands in one
+process-wide registry that renders the Prometheus text format, either to a
+file (for node-exporter's textfile collector) or over a small HTTP endpoint.
+
+Metrics are off unless ``RESUMEMATCH_METRICS=1``. While off, ``timed`` hands
+back a shared no-op context manager and ``increment`` returns at once, so the
+instrumentation costs one attribute check per call.
+"""
+
+import os
+import threading
+import time
+from contextlib import nullcontext
+
+from resumematch import config
+
+PREFIX = 'resumematch'
+
+# Seconds; the AI call dominates the top end
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+enabled = config.METRICS_ENABLED
+
+_lock = threading.Lock()
+_counters = {}
+_histograms = {}
+_last_seconds = {}
+_noop = nullcontext()
+
+
+class _Timer:
+    __slots__ = ('stage', 'started')
+
+    def __init__(self, stage):
+        self.stage = stage
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        observe(self.stage, time.perf_counter() - self.started)
+        return False
+
+
+def timed(stage):
+    """Context manager timing one run of a pipeline stage"""
+    if not enabled:
+        return _noop
+    return _Timer(stage)
+
+
+def observe(stage, seconds):
+    """Record a stage duration measured elsewhere"""
+    if not enabled:
+        return
+    with _lock:
+        histogram = _histograms.get(stage)
+        if histogram is None:
+            histogram = _histograms[stage] = [[0] * len(BUCKETS), 0, 0.0]
+        buckets, _, _ = histogram
+        for index, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                buckets[index] += 1
+        histogram[1] += 1
+        histogram[2] += seconds
+        _last_seconds[stage] = seconds
+
+
+def increment(name, amount=1):
+    """Add to a counter, e.g. increment("ai_fallback")"""
+    if not enabled:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + amount
+
+
+def enable(on=True):
+    global enabled
+    enabled = on
+
+
+def reset():
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
+        _last_seconds.clear()
+
+
+def snapshot():
+    """Counters, most recent duration per stage and per-stage totals"""
+    with _lock:
+        return {
+            'counters': dict(_counters),
+            'last_seconds': dict(_last_seconds),
+            'stages': {stage: {'count': count, 'total_seconds': total}
+                       for stage, (_, count, total) in _histograms.items()}
+        }
+
+
+def render_prometheus():
+    """All metrics in the Prometheus text exposition format"""
+    lines = []
+    with _lock:
+        for name in sorted(_counters):
+            metric = f"{PREFIX}_{name}_total"
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {_counters[name]}")
+
+        if _histograms:
+            metric = f"{PREFIX}_stage_seconds"
+            lines.append(f"# HELP {metric} Time spent in each analysis pipeline stage.")
+            lines.append(f"# TYPE {metric} histogram")
+            for stage in sorted(_histograms):
+                buckets, count, total = _histograms[stage]
+                for bound, bucket_count in zip(BUCKETS, buckets):
+                    lines.append(f'{metric}_bucket{{stage="{stage}",le="{bound}"}} {bucket_count}')
+                lines.append(f'{metric}_bucket{{stage="{stage}",le="+Inf"}} {count}')
+                lines.append(f'{metric}_sum{{stage="{stage}"}} {total}')
+                lines.append(f'{metric}_count{{stage="{stage}"}} {count}')
+    return "\n".join(lines) + "\n"
+
+
+def write_textfile(path=None):
+    """Atomically write the metrics to path (default RESUMEMATCH_METRICS_FILE)"""
+    path = path or config.METRICS_FILE
+    if not enabled or not path:
+        return
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(render_prometheus())
+    os.replace(tmp_path, path)
+
+
+def _serve_metrics(handler):
+    if handler.path.rstrip('/') not in ('', '/metrics'):
+        handler.send_error(404)
+        return
+    body = render_prometheus().encode('utf-8')
+    handler.send_response(200)
+    handler.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+    handler.send_header('Content-Length', str(len(body)))
+    handler.end_headers()
+    handler.wfile.write(body)
+
+
+_server = None
+
+
+def start_http_server(port=None, host='0.0.0.0'):
+    """Serve /metrics on a background thread, once per process"""
+    global _server
+    port = port or config.METRICS_PORT
+    if not enabled or not port:
+        return None
+    # http.server is only imported when metrics are actually served
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        do_GET = _serve_metrics
+
+        def log_message(self, format, *args):
+            pass
+
+    with _lock:
+        if _server is None:
+            try:
+                _server = ThreadingHTTPServer((host, port), MetricsHandler)
+            except OSError:
+                # Another process on this host already serves the port
+                return None
+            threading.Thread(target=_server.serve_forever, name='resumematch-metrics', daemon=True).start()
+    return _server
@@ -0,0 +1,129 @@
+"""Rank many job descriptions for one resume.
+
+Each job is tokenized once into a ``JobProfile`` (keyword counts plus its top
+20 keywords). Ranking a resume then parses the resume once and runs the
+same keyword match and ``rule_based_analysis`` scoring as a single-job
+analysis against every stored profile.
+
+Usage:
+    python -m resumematch.multi_job resume.pdf jobs.csv -k 20
+"""
+
+import argparse
+import csv
+import io
+import json
+from collections import namedtuple
+
+from resumematch.cache import extract_text_cached
+from resumematch.core import (
+    ExtractionError,
+    extract_keywords,
+    match_keywords,
+    rule_based_analysis,
+)
+from resumematch.sections import parse_resume
+
+JobProfile = namedtuple('JobProfile', 'job_id title keywords top_keywords description', defaults=(None,))
+
+JOB_SEPARATOR = '---'
+
+
+def build_job_profile(job_id, description, title=None):
+    """Tokenize a job description once for reuse across resumes"""
+    keywords = extract_keywords(description)
+    top_keywords = [k for k, v in keywords.most_common(20)]
+    return JobProfile(job_id, title or str(job_id), keywords, top_keywords, description)
+
+
+def rank_jobs(resume_text, job_profiles, top_k=None):
+    """Score a resume against every job profile, best match first
+
+    Each result has the job id and title, the rule-based ``match_score`` and
+    the keyword match details for that job.
+    """
+    profile = parse_resume(resume_text)
+    results = []
+    for job in job_profiles:
+        keyword_analysis = match_keywords(profile.keywords, job.keywords, job.top_keywords)
+        # rule_based_analysis only needs the job through keyword_analysis
+        analysis = rule_based_analysis(resume_text, None, keyword_analysis, profile)
+        results.append({
+            'job_id': job.job_id,
+            'title': job.title,
+            'match_score': analysis['match_score'],
+            'match_percentage': keyword_analysis['match_percentage'],
+            'matched_keywords': keyword_analysis['matched_keywords'],
+            'missing_keywords': keyword_analysis['missing_keywords']
+        })
+    results.sort(key=lambda result: (-result['match_score'], -result['match_percentage']))
+    return results[:top_k] if top_k else results
+
+
+def parse_jobs(data, filename):
+    """Read job descriptions from CSV, JSON, JSONL or plain text bytes
+
+    CSV and JSON records need a ``description`` field and may carry ``id``
+    and ``title``. Plain text holds one job per block, separated by lines of
+    ``---``. Returns a list of (job_id, title, description).
+    """
+    text = data.decode('utf-8-sig') if isinstance(data, bytes) else data
+    name = filename.lower()
+
+    if name.endswith('.csv'):
+        records = list(csv.DictReader(io.StringIO(text)))
+    elif name.endswith('.jsonl'):
+        records = [json.loads(line) for line in text.splitlines() if line.strip()]
+    elif name.endswith('.json'):
+        records = json.loads(text)
+        if isinstance(records, dict):
+            records = records.get('jobs', [])
+    else:
+        blocks = []
+        current = []
+        for line in text.splitlines():
+            if line.strip() == JOB_SEPARATOR:
+                blocks.append("\n".join(current))
+                current = []
+            else:
+                current.append(line)
+        blocks.append("\n".join(current))
+        records = [{'description': block} for block in blocks if block.strip()]
+
+    jobs = []
+    for number, record in enumerate(records, 1):
+        description = (record.get('description') or '').strip()
+        if not description:
+            continue
+        job_id = record.get('id') or number
+        title = record.get('title') or description.splitlines()[0][:80]
+        jobs.append((job_id, title, description))
+    return jobs
+
+
+def build_job_profiles(jobs):
+    """JobProfiles for (job_id, title, description) tuples"""
+    return [build_job_profile(job_id, description, title) for job_id, title, description in jobs]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rank job descriptions for one resume")
+    parser.add_argument('resume', help="PDF or DOCX resume")
+    parser.add_argument('jobs', help="CSV, JSON, JSONL or ---separated text file of job descriptions")
+    parser.add_argument('-k', '--top', type=int, default=10)
+    args = parser.parse_args(argv)
+
+    with open(args.resume, 'rb') as f:
+        try:
+            resume_text = extract_text_cached(f.read(), args.resume)
+        except ExtractionError as e:
+            parser.exit(1, f"{e}\n")
+    with open(args.jobs, 'rb') as f:
+        job_profiles = build_job_profiles(parse_jobs(f.read(), args.jobs))
+
+    for rank, result in enumerate(rank_jobs(resume_text, job_profiles, top_k=args.top), 1):
+        print(json.dumps({'rank': rank, **result}))
+
+
+if __name__ == "__main__":
+    main()
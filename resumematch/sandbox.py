@@ -0,0 +1,132 @@
+"""Document extraction in a child process that can be killed.
+
+A hostile upload (a decompression bomb, a PDF whose content stream sends the
+parser into a loop) can tie up the process reading it. ``extract_text_isolated``
+runs the parser in a separate process with an address-space limit and
+kills it if it has not answered within the time budget. The web server or
+batch driver only ever sees an ``ExtractionError`` with a ``code``.
+
+Children are forked from a forkserver that has already imported the
+parsers, so each extraction costs a fork rather than a fresh interpreter.
+Pool workers are daemonic and cannot start children of their own; there the
+time budget is enforced between pages instead. The extraction child itself is
+not daemonic, so a long PDF can still be split across page workers inside it
+(which inherit its memory limit). It leads its own process group, so on a
+timeout or crash the parent kills the page workers along with it.
+"""
+
+import io
+import multiprocessing
+import os
+import signal
+import threading
+import time
+
+from resumematch import config
+from resumematch.core import ExtractionError, extract_text, shutdown_page_pool
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+# Extra time the child gets to report its own timeout before it is killed
+KILL_GRACE_SECONDS = 2
+
+PRELOAD_MODULES = ['__main__', 'resumematch.core', 'pypdf', 'pdfplumber', 'docx']
+
+_context = None
+_context_lock = threading.Lock()
+
+
+def _get_context():
+    global _context
+    with _context_lock:
+        if _context is None:
+            if 'forkserver' in multiprocessing.get_all_start_methods():
+                _context = multiprocessing.get_context('forkserver')
+                _context.set_forkserver_preload(PRELOAD_MODULES)
+            else:
+                _context = multiprocessing.get_context('spawn')
+        return _context
+
+
+def _limit_memory(max_memory_mb):
+    if resource is None or not max_memory_mb:
+        return
+    limit = max_memory_mb * 1024 * 1024
+    try:
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ValueError, OSError):
+        pass
+
+
+def _kill_group(pgid):
+    """SIGKILL a child's process group, page workers included"""
+    if not hasattr(os, 'killpg'):
+        return
+    try:
+        os.killpg(pgid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def _extract_in_child(conn, data, filename, timeout, max_memory_mb):
+    if hasattr(os, 'setpgrp'):
+        # Page workers forked from here join this group, so the parent can
+        # kill them all at once
+        os.setpgrp()
+    _limit_memory(max_memory_mb)
+    try:
+        result = ('ok', extract_text(io.BytesIO(data), filename, deadline=time.monotonic() + timeout))
+    except ExtractionError as e:
+        result = ('error', e.code, str(e))
+    except MemoryError:
+        result = ('error', 'memory', f"Extraction used more than the {max_memory_mb} MB memory limit")
+    except Exception as e:
+        result = ('error', 'failed', f"Extraction failed: {str(e)}")
+    finally:
+        shutdown_page_pool()
+    conn.send(result)
+    conn.close()
+
+
+def extract_text_isolated(data, filename, timeout=None, max_memory_mb=None):
+    """Extract text from file bytes in a killable child process
+
+    Raises ExtractionError; ``code`` is "timeout" when the budget ran out,
+    "memory" or "crashed" when the child hit its memory limit or died.
+    """
+    timeout = config.EXTRACT_TIMEOUT_SECONDS if timeout is None else timeout
+    max_memory_mb = config.EXTRACT_MAX_MEMORY_MB if max_memory_mb is None else max_memory_mb
+    if timeout <= 0:
+        return extract_text(io.BytesIO(data), filename)
+    if multiprocessing.current_process().daemon:
+        return extract_text(io.BytesIO(data), filename, deadline=time.monotonic() + timeout)
+
+    context = _get_context()
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=_extract_in_child, name='resumematch-extract',
+                              args=(sender, data, filename, timeout, max_memory_mb))
+    process.start()
+    sender.close()
+    result = None
+    try:
+        if not receiver.poll(timeout + KILL_GRACE_SECONDS):
+            raise ExtractionError(f"Extraction took longer than the {timeout:g} second limit", code="timeout")
+        result = receiver.recv()
+    except EOFError:
+        # The child died without answering, typically killed for memory
+        raise ExtractionError("Extraction process exited unexpectedly; the file may be too complex",
+                              code="crashed") from None
+    finally:
+        receiver.close()
+        if process.is_alive() or result is None:
+            _kill_group(process.pid)
+            process.kill()
+        process.join()
+
+    if result[0] == 'ok':
+        return result[1]
+    _, code, message = result
+    raise ExtractionError(message, code=code)
@@ -0,0 +1,121 @@
+"""Section-aware resume parsing.
+
+``parse_resume`` splits extracted text into its sections (summary,
+experience, education, skills, projects) by their headings and tokenizes
+each one once, recording its token count and the metrics it quotes
+("35%", "$2M", "5 years"). The keyword counts and scoring flags are built
+from those per-section results, so they match the tokenizer's whole-text
+profile. A resume with a non-empty experience, education or skills section
+also gets the matching ``has_*`` and ``ats_*`` flags when none of the
+tokenizer's flag words appear in it (a "Work History" or "Academic
+Background" section). A ``ParsedResume`` has every field of
+``TextProfile``, so ``rule_based_analysis`` and ``calculate_ats_score`` take
+it in place of a profile. Results are memoized on the text, so scoring one
+resume against many job descriptions parses it once.
+
+Text before the first recognised heading goes under "header" (usually the
+name and contact details); headings for anything else (certifications,
+awards, ...) start an "other" section.
+"""
+
+import re
+from collections import Counter, namedtuple
+from functools import lru_cache
+
+from resumematch import config
+from resumematch.tokenizer import FLAGS, TextProfile, default_tokenizer
+
+SECTION_HEADINGS = {
+    'summary': ('summary', 'professional summary', 'profile', 'professional profile',
+                'objective', 'career objective', 'about me'),
+    'experience': ('experience', 'work experience', 'professional experience', 'employment',
+                   'employment history', 'work history', 'relevant experience', 'career history'),
+    'education': ('education', 'education and training', 'academic background', 'academics'),
+    'skills': ('skills', 'technical skills', 'core skills', 'key skills', 'core competencies',
+               'competencies', 'technologies', 'tools and technologies'),
+    'projects': ('projects', 'personal projects', 'selected projects', 'key projects'),
+    'other': ('certifications', 'certificates', 'licenses', 'awards', 'honors', 'publications',
+              'languages', 'interests', 'volunteering', 'volunteer experience', 'references',
+              'activities', 'achievements'),
+}
+
+SECTIONS = ('header',) + tuple(SECTION_HEADINGS)
+
+_HEADING_LOOKUP = {heading: section for section, headings in SECTION_HEADINGS.items()
+                   for heading in headings}
+_LONGEST_HEADING = max(len(heading) for heading in _HEADING_LOOKUP)
+_HEADING_STRIP = re.compile(r'[^a-z ]+')
+_METRIC_PATTERN = re.compile(r'\$\d[\d,.]*[KkMmBb]?|\d+(?:\.\d+)?%|\d+\+|\d+ years')
+
+# Flags a section heading sets on its own
+SECTION_FLAGS = {
+    'experience': ('has_experience', 'ats_experience'),
+    'education': ('has_education', 'ats_education'),
+    'skills': ('has_skills', 'ats_skills'),
+}
+
+ParsedResume = namedtuple('ParsedResume', TextProfile._fields + ('sections', 'section_tokens', 'metrics'))
+
+
+def heading_section(line):
+    """Section a line introduces, or None if it is not a heading"""
+    if len(line) > _LONGEST_HEADING + 8:
+        return None
+    normalized = " ".join(_HEADING_STRIP.sub(' ', line.lower().replace('&', ' and ')).split())
+    return _HEADING_LOOKUP.get(normalized)
+
+
+def _blocks(text):
+    """(section, heading line, body lines) for each run of lines under one heading"""
+    section, heading, lines = 'header', "", []
+    for line in text.splitlines():
+        found = heading_section(line.strip())
+        if found is None:
+            lines.append(line)
+            continue
+        yield section, heading, lines
+        section, heading, lines = found, line, []
+    yield section, heading, lines
+
+
+def split_sections(text):
+    """Map of section name to its text, in the order the sections appear"""
+    sections = {}
+    for section, _, lines in _blocks(text):
+        if lines:
+            sections[section] = (sections[section] + "\n" if section in sections else "") + "\n".join(lines)
+    return {name: body.strip() for name, body in sections.items() if body.strip()}
+
+
+@lru_cache(maxsize=config.PARSE_CACHE_ENTRIES)
+def parse_resume(text):
+    """ParsedResume for extracted resume text; treat the result as read-only"""
+    tokenizer = default_tokenizer
+    counts = Counter()
+    bodies = {}
+    section_tokens = {}
+    metrics = {}
+    flags = dict.fromkeys(FLAGS, False)
+    for section, heading, lines in _blocks(text):
+        body = "\n".join(lines)
+        if lines:
+            bodies[section] = (bodies[section] + "\n" if section in bodies else "") + body
+        # Blocks are counted in document order, so keyword order (and
+        # most_common tie-breaking) is the same as for the whole text
+        counts.update(tokenizer.tokens(heading))
+        body_tokens = tokenizer.tokens(body)
+        counts.update(body_tokens)
+        if body_tokens:
+            section_tokens[section] = section_tokens.get(section, 0) + len(body_tokens)
+        block = f"{heading}\n{body}"
+        tokenizer.scan_flag_words(block.lower(), flags)
+        metrics.update(dict.fromkeys(_METRIC_PATTERN.findall(block)))
+
+    for section, names in SECTION_FLAGS.items():
+        if section in section_tokens:
+            flags.update(dict.fromkeys(names, True))
+    flags['has_metrics'] = any(metric.startswith('$') or metric.endswith(('%', '+')) for metric in metrics)
+    flags['ats_metrics'] = any(metric.endswith(('%', '+', 'years')) for metric in metrics)
+    sections = {name: body.strip() for name, body in bodies.items() if body.strip()}
+    return ParsedResume(tokenizer.filter_counts(counts), sections=sections,
+                        section_tokens=section_tokens, metrics=tuple(metrics), **flags)
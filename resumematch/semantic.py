@@ -0,0 +1,209 @@
+"""Offline semantic match scorer built on hashed n-gram embeddings.
+
+The remote model only ever sees the first 2,500 characters of a resume. This
+scorer reads all of it, on the CPU and without any model download: both
+documents are cut into overlapping word windows ("chunks"), every chunk is
+embedded by hashing its words, word bigrams and character 3-5-grams into a
+fixed number of signed buckets (the hashing trick), and chunks are compared
+by cosine similarity. Subword n-grams let "analytics"/"analyst" or
+"postgres"/"postgresql" partly match where exact keywords do not.
+
+The score is the average, over job chunks, of the best similarity any
+resume chunk reaches, so it asks "is each part of the job covered somewhere
+in the resume". The best chunk pairs are returned for display.
+
+Embeddings are cached per document hash, so rescoring a resume against
+another job only embeds the job, and each word's n-gram buckets are kept in
+a bounded LRU. Needs numpy (``pip install numpy``).
+
+Usage:
+    python -m resumematch.semantic resume.pdf job.txt
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+import threading
+import zlib
+from collections import OrderedDict
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from resumematch import config
+from resumematch.tokenizer import STOP_WORDS, default_tokenizer
+
+BIGRAM_WEIGHT = 0.5
+SUBWORD_WEIGHT = 0.3
+
+# Distinct words whose n-gram buckets each embedder keeps
+WORD_CACHE_ENTRIES = 65536
+
+
+class HashingEmbedder:
+    """Signed feature hashing of words, bigrams and character n-grams"""
+
+    def __init__(self, dim=1024, char_ngrams=(3, 5), chunk_words=60, stride=40, cache_entries=None):
+        if np is None:
+            raise ImportError("Run: pip install numpy")
+        self.dim = dim
+        self.char_ngrams = char_ngrams
+        self.chunk_words = chunk_words
+        self.stride = stride
+        self.cache_entries = config.SEMANTIC_CACHE_ENTRIES if cache_entries is None else cache_entries
+        # token -> (bucket indices, signed weights); bounded, since a
+        # long-running server sees an open-ended vocabulary
+        self._word_features = lru_cache(maxsize=WORD_CACHE_ENTRIES)(self._compute_word_features)
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _hash(self, feature):
+        # crc32 rather than hash(): stable across processes and runs
+        value = zlib.crc32(feature.encode('utf-8'))
+        return value % self.dim, 1.0 if value & 0x80000000 else -1.0
+
+    def _compute_word_features(self, word):
+        bucket, sign = self._hash(word)
+        buckets, weights = [bucket], [sign]
+        padded = f"<{word}>"
+        low, high = self.char_ngrams
+        for n in range(low, high + 1):
+            for start in range(len(padded) - n + 1):
+                bucket, sign = self._hash(padded[start:start + n])
+                buckets.append(bucket)
+                weights.append(sign * SUBWORD_WEIGHT)
+        return tuple(buckets), tuple(weights)
+
+    def words(self, text):
+        """(word, start, end) for each word that is embedded"""
+        return [span for span in default_tokenizer.token_spans(text)
+                if span[0] not in STOP_WORDS and len(span[0]) > 1]
+
+    def chunk(self, words):
+        """Overlapping windows of chunk_words words, stride words apart"""
+        if len(words) <= self.chunk_words:
+            return [words] if words else []
+        last = len(words) - self.chunk_words
+        starts = list(range(0, last + 1, self.stride))
+        if starts[-1] != last:
+            starts.append(last)
+        return [words[start:start + self.chunk_words] for start in starts]
+
+    def embed_chunks(self, chunks):
+        """L2-normalized chunk x dim matrix, built in one bincount
+
+        chunks are lists of words.
+        """
+        indices, weights = [], []
+        for row, words in enumerate(chunks):
+            offset = row * self.dim
+            for word in words:
+                buckets, signs = self._word_features(word)
+                indices.extend(offset + bucket for bucket in buckets)
+                weights.extend(signs)
+            for first, second in zip(words, words[1:]):
+                bucket, sign = self._hash(f"{first} {second}")
+                indices.append(offset + bucket)
+                weights.append(sign * BIGRAM_WEIGHT)
+        matrix = np.bincount(np.asarray(indices, dtype=np.int64), weights=np.asarray(weights),
+                             minlength=len(chunks) * self.dim).reshape(len(chunks), self.dim)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return (matrix / norms).astype(np.float32)
+
+    def embed(self, text):
+        """(chunk passages, embedding matrix) for a document, cached by its hash"""
+        key = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+        chunks = self.chunk(self.words(text))
+        # Passages are shown as the original text; offsets index the
+        # lowercased copy, which only differs in length for rare characters
+        source = text if len(text.lower()) == len(text) else text.lower()
+        passages = [" ".join(source[chunk[0][1]:chunk[-1][2]].split()) for chunk in chunks]
+        result = (passages, self.embed_chunks([[word for word, _, _ in chunk] for chunk in chunks]))
+        with self._lock:
+            self._cache[key] = result
+            while len(self._cache) > self.cache_entries:
+                self._cache.popitem(last=False)
+        return result
+
+
+def semantic_match(resume_text, job_description, top_pairs=3, embedder=None):
+    """Similarity-based match between a resume and a job description
+
+    Returns ``match_score`` (0-100, mean over job chunks of the best resume
+    chunk similarity), ``document_similarity`` (cosine of the mean chunk
+    embeddings) and ``best_pairs``: the top job/resume chunk pairs with
+    their similarity.
+    """
+    embedder = embedder or get_default_embedder()
+    resume_chunks, resume_matrix = embedder.embed(resume_text)
+    job_chunks, job_matrix = embedder.embed(job_description)
+    if not resume_chunks or not job_chunks:
+        return {'match_score': 0, 'document_similarity': 0.0, 'best_pairs': []}
+
+    similarity = job_matrix @ resume_matrix.T
+    best_resume = similarity.argmax(axis=1)
+    best = similarity[np.arange(len(job_chunks)), best_resume]
+
+    resume_mean = resume_matrix.mean(axis=0)
+    job_mean = job_matrix.mean(axis=0)
+    denominator = float(np.linalg.norm(resume_mean) * np.linalg.norm(job_mean)) or 1.0
+
+    pairs = []
+    for job_index in np.argsort(-best)[:top_pairs]:
+        pairs.append({
+            'job_chunk': job_chunks[job_index],
+            'resume_chunk': resume_chunks[best_resume[job_index]],
+            'similarity': round(float(best[job_index]), 3)
+        })
+    return {
+        'match_score': int(round(max(float(best.mean()), 0.0) * 100)),
+        'document_similarity': round(float(resume_mean @ job_mean) / denominator, 3),
+        'best_pairs': pairs
+    }
+
+
+_default_embedder = None
+_default_embedder_lock = threading.Lock()
+
+
+def get_default_embedder():
+    global _default_embedder
+    with _default_embedder_lock:
+        if _default_embedder is None:
+            _default_embedder = HashingEmbedder()
+        return _default_embedder
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Offline semantic match of a resume against a job description")
+    parser.add_argument('resume', help="PDF or DOCX resume")
+    parser.add_argument('job', help="text file containing the job description")
+    parser.add_argument('--pairs', type=int, default=3, help="best-matching chunk pairs to show")
+    args = parser.parse_args(argv)
+
+    from resumematch.cache import extract_text_cached
+    from resumematch.core import ExtractionError
+
+    with open(args.resume, 'rb') as f:
+        try:
+            resume_text = extract_text_cached(f.read(), args.resume)
+        except ExtractionError as e:
+            parser.exit(1, f"{e}\n")
+    with open(args.job, encoding='utf-8') as f:
+        job_description = f.read()
+    json.dump(semantic_match(resume_text, job_description, top_pairs=args.pairs), sys.stdout, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""Skill taxonomy matching with an Aho-Corasick automaton.
+
+The tokenizer only keeps single words of four or more characters, so "machine
+learning", "CI/CD", "SQL", "AWS" and "C++" are split up or dropped, and
+"postgres" never matches "PostgreSQL". A ``SkillTaxonomy`` maps each
+canonical skill to its aliases and compiles every alias into one
+Aho-Corasick automaton. Scanning a document walks it once, character by
+character, so the cost depends on the length of the text and not on how many
+skills the taxonomy holds.
+
+Matches must start and end on word boundaries, and where two overlap the
+leftmost, then longest, wins ("deep learning" rather than "learning").
+
+The bundled taxonomy is ``resumematch/data/skills.json``: an object of
+canonical name to a list of aliases. The canonical name is matched too,
+unless the entry is written ``{"aliases": [...], "match_name": false}``,
+which is how one-letter names such as "C" and "R" are kept from matching
+stray letters. Point ``RESUMEMATCH_SKILLS_FILE`` at another file of the same
+shape to use your own.
+"""
+
+import json
+import os
+import re
+import threading
+from collections import Counter, deque
+from functools import lru_cache
+
+from resumematch import config
+
+DEFAULT_SKILLS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'skills.json')
+
+_SPACES = re.compile(r'\s+')
+
+
+def normalize(text):
+    """Lowercase and collapse whitespace, as both patterns and text are"""
+    return _SPACES.sub(' ', text.lower())
+
+
+class SkillTaxonomy:
+    """Canonical skills and their aliases, compiled into one automaton"""
+
+    def __init__(self, skills):
+        """skills maps canonical name to a list of aliases (or to
+        {"aliases": [...], "match_name": false})"""
+        self.skills = {}
+        patterns = {}
+        for canonical, entry in skills.items():
+            if isinstance(entry, dict):
+                aliases = list(entry.get('aliases', ()))
+                if entry.get('match_name', True):
+                    aliases.insert(0, canonical)
+            else:
+                aliases = [canonical] + list(entry)
+            terms = [term for term in dict.fromkeys(normalize(alias).strip() for alias in aliases) if term]
+            self.skills[canonical] = terms
+            for term in terms:
+                # An alias listed under two skills counts for the first
+                patterns.setdefault(term, canonical)
+        self._compile(patterns)
+
+    @classmethod
+    def from_file(cls, path):
+        with open(path, encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def __len__(self):
+        return len(self.skills)
+
+    def _compile(self, patterns):
+        # Trie as a list of per-state transition dicts; state 0 is the root
+        goto = [{}]
+        outputs = [()]
+        for term, canonical in patterns.items():
+            state = 0
+            for char in term:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    outputs.append(())
+                state = next_state
+            outputs[state] = ((len(term), canonical),)
+
+        # Failure links in breadth-first order; each state's outputs absorb
+        # those of its failure state so a scan never walks the chain to emit
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                target = goto[fallback].get(char, 0)
+                fail[next_state] = target if target != next_state else 0
+                outputs[next_state] = outputs[next_state] + outputs[fail[next_state]]
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = outputs
+        self.pattern_count = len(patterns)
+
+    def scan(self, text):
+        """(start, end, canonical) for each skill mention in normalized text
+
+        Offsets index ``normalize(text)``; overlapping hits are resolved
+        leftmost-longest.
+        """
+        text = normalize(text)
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        length = len(text)
+        hits = []
+        state = 0
+        for end, char in enumerate(text, 1):
+            transitions = goto[state]
+            while char not in transitions and state:
+                state = fail[state]
+                transitions = goto[state]
+            state = transitions.get(char, 0)
+            if not outputs[state]:
+                continue
+            if end < length and text[end].isalnum():
+                continue
+            for size, canonical in outputs[state]:
+                start = end - size
+                if start == 0 or not text[start - 1].isalnum():
+                    hits.append((start, end, canonical))
+
+        hits.sort(key=lambda hit: (hit[0], -hit[1]))
+        resolved = []
+        covered = 0
+        for start, end, canonical in hits:
+            if start >= covered:
+                resolved.append((start, end, canonical))
+                covered = end
+        return resolved
+
+    def find(self, text):
+        """Counter of canonical skill name to number of mentions"""
+        return Counter(canonical for _, _, canonical in self.scan(text))
+
+    def terms(self, canonical):
+        """Normalized names and aliases a canonical skill is matched by"""
+        return self.skills.get(canonical, [])
+
+
+_default_taxonomy = None
+_default_taxonomy_lock = threading.Lock()
+
+
+def get_default_taxonomy():
+    """Process-wide taxonomy from RESUMEMATCH_SKILLS_FILE or the bundled file"""
+    global _default_taxonomy
+    with _default_taxonomy_lock:
+        if _default_taxonomy is None:
+            _default_taxonomy = SkillTaxonomy.from_file(config.SKILLS_FILE or DEFAULT_SKILLS_FILE)
+        return _default_taxonomy
+
+
+@lru_cache(maxsize=config.PARSE_CACHE_ENTRIES)
+def skill_counts(text):
+    """Default-taxonomy skill counts for a document; treat as read-only"""
+    return get_default_taxonomy().find(text)
+
+
+def match_skills(resume_skills, job_skills, limit=10):
+    """Skill match between two skill Counters
+
+    ``skill_match_percentage`` is the share of the job's skills the resume
+    mentions (None when the job names none). Matched and missing skills are
+    listed most-mentioned in the job first.
+    """
+    ranked = [skill for skill, _ in job_skills.most_common()]
+    matched = [skill for skill in ranked if skill in resume_skills]
+    missing = [skill for skill in ranked if skill not in resume_skills]
+    return {
+        'skill_match_percentage': len(matched) / len(ranked) * 100 if ranked else None,
+        'matched_skills': matched[:limit],
+        'missing_skills': missing[:limit]
+    }
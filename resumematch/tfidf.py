@@ -0,0 +1,181 @@
+"""Vectorized TF-IDF / cosine similarity scoring for bulk screening.
+
+The resume corpus is tokenized with ``extract_keywords`` (so the terms are the
+same ones ``calculate_keyword_match`` compares), turned into a sparse
+documents x vocabulary matrix weighted by IDF across the corpus, and
+L2-normalized. Scoring any number of job descriptions is then one sparse
+matrix multiply.
+
+Needs numpy and scipy (``pip install numpy scipy``).
+
+Usage:
+    python -m resumematch.tfidf resumes/ job1.txt job2.txt -k 20
+"""
+
+import argparse
+import json
+import os
+import sys
+from multiprocessing import Pool
+
+try:
+    import numpy as np
+    from scipy import sparse
+except ImportError:
+    np = sparse = None
+
+from resumematch.batch import iter_resume_paths, keywords_for_file
+from resumematch.core import extract_keywords
+
+
+class TfidfScorer:
+    """TF-IDF model of a resume corpus that scores jobs by cosine similarity"""
+
+    def __init__(self, sublinear_tf=True):
+        if sparse is None:
+            raise ImportError("Run: pip install numpy scipy")
+        self.sublinear_tf = sublinear_tf
+        self.vocabulary = {}
+        self.terms = []
+        self.resume_ids = []
+        self.idf = None
+        self.matrix = None
+
+    def fit(self, documents):
+        """Build the model from (resume_id, keyword Counter) pairs"""
+        vocabulary = {}
+        resume_ids = []
+        rows, cols, values = [], [], []
+        for row, (resume_id, keywords) in enumerate(documents):
+            resume_ids.append(resume_id)
+            for term, count in keywords.items():
+                col = vocabulary.get(term)
+                if col is None:
+                    col = vocabulary[term] = len(vocabulary)
+                rows.append(row)
+                cols.append(col)
+                values.append(count)
+
+        n_docs, n_terms = len(resume_ids), len(vocabulary)
+        cols = np.asarray(cols, dtype=np.int32)
+        counts = sparse.csr_matrix(
+            (np.asarray(values, dtype=np.float32), (np.asarray(rows, dtype=np.int32), cols)),
+            shape=(n_docs, n_terms)
+        )
+        document_frequency = np.bincount(cols, minlength=n_terms)
+        # Smoothed IDF, as in scikit-learn, so terms in every resume keep a
+        # small positive weight.
+        self.idf = (np.log((1 + n_docs) / (1 + document_frequency)) + 1).astype(np.float32)
+        self.vocabulary = vocabulary
+        self.terms = sorted(vocabulary, key=vocabulary.get)
+        self.resume_ids = resume_ids
+        self.matrix = self._weight(counts)
+        return self
+
+    def fit_texts(self, documents):
+        """Build the model from (resume_id, resume_text) pairs"""
+        return self.fit((resume_id, extract_keywords(text)) for resume_id, text in documents)
+
+    def _weight(self, counts):
+        counts = counts.tocsr()
+        if self.sublinear_tf:
+            counts.data = 1 + np.log(counts.data)
+        weighted = counts @ sparse.diags(self.idf)
+        norms = np.sqrt(np.asarray(weighted.multiply(weighted).sum(axis=1)).ravel())
+        norms[norms == 0] = 1
+        return sparse.diags(1 / norms) @ weighted
+
+    def transform_jobs(self, job_keywords):
+        """Job keyword Counters -> normalized TF-IDF rows in the corpus vocabulary
+
+        Job terms no resume uses are dropped; they cannot add to any score.
+        """
+        rows, cols, values = [], [], []
+        for row, keywords in enumerate(job_keywords):
+            for term, count in keywords.items():
+                col = self.vocabulary.get(term)
+                if col is not None:
+                    rows.append(row)
+                    cols.append(col)
+                    values.append(count)
+        counts = sparse.csr_matrix(
+            (np.asarray(values, dtype=np.float32), (rows, cols)),
+            shape=(len(job_keywords), len(self.vocabulary))
+        )
+        return self._weight(counts)
+
+    def similarity(self, job_texts):
+        """Dense resumes x jobs matrix of cosine similarities in [0, 1]"""
+        jobs = self.transform_jobs([extract_keywords(text) for text in job_texts])
+        return (self.matrix @ jobs.T).toarray()
+
+    def _resume_terms(self, row):
+        start, stop = self.matrix.indptr[row], self.matrix.indptr[row + 1]
+        return {self.terms[col] for col in self.matrix.indices[start:stop]}
+
+    def rank(self, job_texts, top_k=10):
+        """Top resumes for each job, with matched/missing keyword lists
+
+        Returns one list of hits per job description, best first. Hits carry
+        ``similarity`` (0-100) plus the same matched/missing keywords that
+        ``calculate_keyword_match`` reports.
+        """
+        job_keywords = [extract_keywords(text) for text in job_texts]
+        scores = (self.matrix @ self.transform_jobs(job_keywords).T).toarray()
+        k = min(top_k, len(self.resume_ids))
+
+        results = []
+        for column, keywords in enumerate(job_keywords):
+            job_scores = scores[:, column]
+            if k == 0:
+                results.append([])
+                continue
+            top = np.argpartition(-job_scores, k - 1)[:k]
+            top = top[np.argsort(-job_scores[top], kind='stable')]
+            top_job_keywords = [term for term, count in keywords.most_common(20)]
+
+            hits = []
+            for row in top:
+                resume_terms = self._resume_terms(row)
+                matched = [term for term in top_job_keywords if term in resume_terms]
+                missing = [term for term in top_job_keywords if term not in resume_terms]
+                hits.append({
+                    'resume_id': self.resume_ids[row],
+                    'similarity': float(job_scores[row]) * 100,
+                    'matched_keywords': matched[:10],
+                    'missing_keywords': missing[:10]
+                })
+            results.append(hits)
+        return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rank a directory of resumes against job descriptions by TF-IDF similarity")
+    parser.add_argument('resumes', help="directory of PDF/DOCX resumes")
+    parser.add_argument('jobs', nargs='+', help="text files containing job descriptions")
+    parser.add_argument('-k', '--top', type=int, default=10)
+    parser.add_argument('-w', '--workers', type=int, default=os.cpu_count())
+    args = parser.parse_args(argv)
+
+    documents = []
+    with Pool(args.workers) as pool:
+        for path, keywords, error in pool.imap(keywords_for_file, iter_resume_paths(args.resumes), chunksize=8):
+            if error:
+                print(f"{path}: {error}", file=sys.stderr)
+            else:
+                documents.append((path, keywords))
+
+    scorer = TfidfScorer().fit(documents)
+
+    job_texts = []
+    for job_path in args.jobs:
+        with open(job_path, encoding='utf-8') as f:
+            job_texts.append(f.read())
+
+    for job_path, hits in zip(args.jobs, scorer.rank(job_texts, top_k=args.top)):
+        for rank, hit in enumerate(hits, 1):
+            print(json.dumps({'job': job_path, 'rank': rank, **hit}))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+"""SQLite-backed work queue for running analyses off the web server's threads.
+
+The web app submits (resume text, job description) pairs and polls for the
+result; a pool of worker processes started with ``serve`` claims tasks and
+runs ``analyze_resume``. No broker is involved: the queue is one SQLite file
+in WAL mode, so any number of app and worker processes on the node can share
+it.
+
+A claimed task carries a lease that its worker renews while it runs. If the
+worker crashes, the lease runs out and the next worker to look claims the
+task again, up to RESUMEMATCH_QUEUE_MAX_ATTEMPTS times. The supervisor also
+restarts worker processes that die.
+
+Task ids are content hashes of the request, so submitting the same pair
+again returns the finished result instead of queuing a second AI call.
+
+Usage:
+    python -m resumematch.work_queue queue.sqlite -w 8
+"""
+
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+import socket
+import sqlite3
+import sys
+import threading
+import time
+
+from resumematch import config
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    task_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    lease_expires REAL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status, created_at);
+"""
+
+QUEUED, RUNNING, DONE, FAILED = 'queued', 'running', 'done', 'failed'
+
+
+def task_key(resume_text, job_description, use_ai):
+    payload = json.dumps([resume_text, job_description, use_ai])
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class WorkQueue:
+    """Tasks in one SQLite file, shared by submitters and workers"""
+
+    def __init__(self, path=None, max_attempts=None):
+        self.path = path or config.QUEUE_PATH
+        self.max_attempts = max_attempts or config.QUEUE_MAX_ATTEMPTS
+        # isolation_level=None: transactions are opened explicitly, so a
+        # claim can take the write lock before it reads (BEGIN IMMEDIATE)
+        self._conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def _execute(self, sql, params=()):
+        """Run a write and return the number of rows it changed"""
+        with self._lock:
+            return self._conn.execute(sql, params).rowcount
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def submit(self, resume_text, job_description, use_ai=True):
+        """Queue an analysis and return its task id
+
+        A finished or in-flight task for the same request is reused; a
+        failed one is queued again.
+        """
+        task_id = task_key(resume_text, job_description, use_ai)
+        payload = json.dumps({'resume_text': resume_text, 'job_description': job_description, 'use_ai': use_ai})
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO tasks (task_id, status, payload, created_at, updated_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (task_id) DO UPDATE SET status = ?, error = NULL, attempts = 0, "
+                "created_at = excluded.created_at, updated_at = excluded.updated_at WHERE status = ?",
+                (task_id, QUEUED, payload, now, now, QUEUED, FAILED)
+            )
+        return task_id
+
+    def claim(self, worker, lease_seconds=None):
+        """Lease the oldest runnable task to worker: (task_id, payload) or None
+
+        Runnable means queued, or running under a lease that has expired
+        because its worker died. Tasks that have used up their attempts are
+        marked failed instead.
+        """
+        lease_seconds = lease_seconds or config.QUEUE_LEASE_SECONDS
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                while True:
+                    row = conn.execute(
+                        "SELECT task_id, payload, attempts FROM tasks "
+                        "WHERE status = ? OR (status = ? AND lease_expires < ?) "
+                        "ORDER BY created_at LIMIT 1",
+                        (QUEUED, RUNNING, now)
+                    ).fetchone()
+                    if row is None:
+                        conn.execute("COMMIT")
+                        return None
+                    task_id, payload, attempts = row
+                    if attempts >= self.max_attempts:
+                        conn.execute(
+                            "UPDATE tasks SET status = ?, error = ?, updated_at = ? WHERE task_id = ?",
+                            (FAILED, f"Analysis did not finish after {attempts} attempts", now, task_id)
+                        )
+                        continue
+                    conn.execute(
+                        "UPDATE tasks SET status = ?, attempts = attempts + 1, worker = ?, "
+                        "lease_expires = ?, updated_at = ? WHERE task_id = ?",
+                        (RUNNING, worker, now + lease_seconds, now, task_id)
+                    )
+                    conn.execute("COMMIT")
+                    return task_id, json.loads(payload)
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def renew(self, task_id, worker, lease_seconds=None):
+        """Extend a running task's lease; False if the worker no longer holds it"""
+        lease_seconds = lease_seconds or config.QUEUE_LEASE_SECONDS
+        now = time.time()
+        return self._execute(
+            "UPDATE tasks SET lease_expires = ?, updated_at = ? WHERE task_id = ? AND status = ? AND worker = ?",
+            (now + lease_seconds, now, task_id, RUNNING, worker)
+        ) > 0
+
+    def complete(self, task_id, result):
+        self._execute(
+            "UPDATE tasks SET status = ?, result = ?, lease_expires = NULL, updated_at = ? WHERE task_id = ?",
+            (DONE, json.dumps(result), time.time(), task_id)
+        )
+
+    def fail(self, task_id, error):
+        self._execute(
+            "UPDATE tasks SET status = ?, error = ?, lease_expires = NULL, updated_at = ? WHERE task_id = ?",
+            (FAILED, error, time.time(), task_id)
+        )
+
+    def status(self, task_id):
+        """{status, result, error, attempts, position} for a task, or None
+
+        ``position`` is the number of queued tasks ahead of this one.
+        """
+        rows = self._query(
+            "SELECT status, result, error, attempts, created_at FROM tasks WHERE task_id = ?", (task_id,)
+        )
+        if not rows:
+            return None
+        status, result, error, attempts, created_at = rows[0]
+        position = 0
+        if status == QUEUED:
+            position = self._query(
+                "SELECT COUNT(*) FROM tasks WHERE status = ? AND created_at < ?", (QUEUED, created_at)
+            )[0][0]
+        return {
+            'status': status,
+            'result': json.loads(result) if result else None,
+            'error': error,
+            'attempts': attempts,
+            'position': position
+        }
+
+    def counts(self):
+        """Number of tasks in each status"""
+        return dict(self._query("SELECT status, COUNT(*) FROM tasks GROUP BY status"))
+
+    def purge(self, max_age_seconds):
+        """Delete finished and failed tasks last touched more than max_age_seconds ago"""
+        return self._execute(
+            "DELETE FROM tasks WHERE status IN (?, ?) AND updated_at < ?",
+            (DONE, FAILED, time.time() - max_age_seconds)
+        )
+
+    def close(self):
+        self._conn.close()
+
+
+_default_queue = None
+_default_queue_lock = threading.Lock()
+
+
+def get_default_queue():
+    """Process-wide queue at RESUMEMATCH_QUEUE"""
+    global _default_queue
+    with _default_queue_lock:
+        if _default_queue is None:
+            _default_queue = WorkQueue()
+        return _default_queue
+
+
+def _keep_leased(queue, task_id, worker, lease_seconds, done):
+    while not done.wait(lease_seconds / 3):
+        if not queue.renew(task_id, worker, lease_seconds):
+            return
+
+
+def worker_loop(path, lease_seconds=None, poll_seconds=None, max_tasks=None):
+    """Claim and run tasks until max_tasks have been handled (forever by default)"""
+    from resumematch.core import analyze_resume
+
+    lease_seconds = lease_seconds or config.QUEUE_LEASE_SECONDS
+    poll_seconds = poll_seconds or config.QUEUE_POLL_SECONDS
+    queue = WorkQueue(path)
+    worker = f"{socket.gethostname()}:{os.getpid()}"
+    handled = 0
+    while max_tasks is None or handled < max_tasks:
+        task = queue.claim(worker, lease_seconds)
+        if task is None:
+            time.sleep(poll_seconds)
+            continue
+        task_id, payload = task
+        done = threading.Event()
+        heartbeat = threading.Thread(target=_keep_leased, args=(queue, task_id, worker, lease_seconds, done),
+                                     daemon=True)
+        heartbeat.start()
+        try:
+            analysis = analyze_resume(payload['resume_text'], payload['job_description'], use_ai=payload['use_ai'])
+        except Exception as e:
+            queue.fail(task_id, f"Analysis failed: {str(e)}")
+        else:
+            queue.complete(task_id, analysis)
+        finally:
+            done.set()
+            heartbeat.join()
+        handled += 1
+    queue.close()
+
+
+def serve(path, workers, lease_seconds=None, poll_seconds=None, retention_seconds=None):
+    """Run a pool of worker processes, restarting any that die, until interrupted"""
+    retention_seconds = retention_seconds or config.QUEUE_RETENTION_SECONDS
+    WorkQueue(path).close()  # create the schema once, before the workers start
+
+    def start():
+        process = multiprocessing.Process(target=worker_loop, args=(path, lease_seconds, poll_seconds),
+                                          name='resumematch-queue-worker')
+        process.start()
+        return process
+
+    processes = [start() for _ in range(workers)]
+    queue = WorkQueue(path)
+    last_purge = 0
+    try:
+        while True:
+            time.sleep(1)
+            for index, process in enumerate(processes):
+                if not process.is_alive():
+                    print(f"Worker {process.pid} exited with code {process.exitcode}; restarting",
+                          file=sys.stderr)
+                    processes[index] = start()
+            if time.time() - last_purge > 3600:
+                queue.purge(retention_seconds)
+                last_purge = time.time()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join()
+        queue.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run analysis workers for a ResumeMatch work queue")
+    parser.add_argument('queue', nargs='?', default=config.QUEUE_PATH, help="SQLite queue file")
+    parser.add_argument('-w', '--workers', type=int, default=config.QUEUE_WORKERS, help="worker processes")
+    args = parser.parse_args(argv)
+    if not args.queue:
+        parser.error("give a queue file or set RESUMEMATCH_QUEUE")
+    print(f"Serving {args.queue} with {args.workers} workers", file=sys.stderr)
+    serve(args.queue, args.workers)
+
+
+if __name__ == "__main__":
+    main()
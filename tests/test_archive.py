@@ -0,0 +1,80 @@
+"""ResumeArchive member filtering and size/count limits on in-memory ZIPs."""
+
+import io
+import zipfile
+
+import pytest
+
+from resumematch import config
+from resumematch.archive import ArchiveError, ResumeArchive, score_members
+
+
+def make_zip(members):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, data in members:
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+def test_yields_resumes_and_records_other_members():
+    data = make_zip([
+        ("resumes/", b""),
+        ("resumes/a.pdf", b"pdf bytes"),
+        ("resumes/b.DOCX", b"docx bytes"),
+        ("resumes/notes.txt", b"text"),
+        ("__MACOSX/resumes/._a.pdf", b"metadata"),
+        ("resumes/.DS_Store", b"metadata"),
+    ])
+    with ResumeArchive(data) as archive:
+        assert list(archive) == [("resumes/a.pdf", b"pdf bytes"), ("resumes/b.DOCX", b"docx bytes")]
+        assert [name for name, _ in archive.errors] == ["resumes/notes.txt"]
+        assert archive.bytes_read == len(b"pdf bytes") + len(b"docx bytes")
+
+
+def test_file_count_limit():
+    data = make_zip([(f"r{number}.pdf", b"x") for number in range(5)])
+    archive = ResumeArchive(data, max_files=3)
+    assert [name for name, _ in archive] == ["r0.pdf", "r1.pdf", "r2.pdf"]
+    assert [name for name, _ in archive.errors] == ["r3.pdf", "r4.pdf"]
+    assert all("more than 3 resumes" in message for _, message in archive.errors)
+
+
+def test_total_size_limit_counts_uncompressed_bytes():
+    # Highly compressible, so the archive itself is tiny
+    data = make_zip([(f"r{number}.pdf", b"\0" * 4000) for number in range(4)])
+    assert len(data) < 4000
+    archive = ResumeArchive(data, max_total_bytes=10000)
+    assert [name for name, _ in archive] == ["r0.pdf", "r1.pdf"]
+    assert [name for name, _ in archive.errors] == ["r2.pdf", "r3.pdf"]
+    assert archive.bytes_read <= 10000
+
+
+def test_member_size_limit(monkeypatch):
+    monkeypatch.setattr(config, 'PDF_MAX_BYTES', 1024 * 1024)
+    data = make_zip([("big.pdf", b"\0" * (1024 * 1024 + 1)), ("small.pdf", b"x")])
+    archive = ResumeArchive(data)
+    assert [name for name, _ in archive] == ["small.pdf"]
+    assert archive.errors == [("big.pdf", "File is larger than the 1 MB limit")]
+
+
+def test_corrupt_member_is_recorded():
+    data = bytearray(make_zip([("a.pdf", b"resume " * 100), ("b.pdf", b"other")]))
+    # Flip a byte of a.pdf's compressed data so its CRC check fails
+    offset = data.index(b"a.pdf") + len(b"a.pdf") + 2
+    data[offset] ^= 0xFF
+    archive = ResumeArchive(bytes(data))
+    assert [name for name, _ in archive] == ["b.pdf"]
+    assert archive.errors[0][0] == "a.pdf"
+
+
+def test_not_a_zip():
+    with pytest.raises(ArchiveError):
+        ResumeArchive(b"definitely not a zip")
+
+
+def test_score_members_records_errors(monkeypatch):
+    monkeypatch.setattr(config, 'EXTRACT_TIMEOUT_SECONDS', 0)
+    records = list(score_members([("bad.pdf", b"not a pdf"), ("empty.docx", b"")], "Python developer", workers=2))
+    assert sorted(record['file'] for record in records) == ["bad.pdf", "empty.docx"]
+    assert all('error' in record and record['file_hash'] for record in records)
@@ -0,0 +1,74 @@
+"""TextCache eviction and extraction-settings keying."""
+
+import os
+
+import pytest
+
+from resumematch import cache as cache_module
+from resumematch import config
+from resumematch.cache import TextCache, extract_text_cached, extraction_key
+from resumematch.core import ExtractionError
+
+
+def test_memory_tier_evicts_least_recently_used():
+    cache = TextCache(max_entries=2)
+    cache.put('a', "text a")
+    cache.put('b', "text b")
+    assert cache.get('a') == "text a"
+    cache.put('c', "text c")
+    assert cache.get('b') is None
+    assert cache.get('a') == "text a" and cache.get('c') == "text c"
+    assert cache.stats()['memory_entries'] == 2
+
+
+def test_disk_tier_evicts_to_low_water_mark(tmp_path):
+    cache = TextCache(max_entries=1, disk_dir=str(tmp_path), max_disk_bytes=1000)
+    for index in range(10):
+        cache.put(f"key{index}", "x" * 100)
+        # Distinct mtimes, oldest first
+        os.utime(cache._disk_path(f"key{index}"), (index, index))
+    assert len(os.listdir(tmp_path)) == 10
+
+    cache.put('key10', "x" * 100)
+    names = sorted(os.listdir(tmp_path))
+    sizes = sum(os.path.getsize(tmp_path / name) for name in names)
+    assert sizes <= 1000 * cache_module.DISK_LOW_WATER
+    # The oldest files went first
+    assert 'key0.txt' not in names and 'key10.txt' in names and 'key9.txt' in names
+
+
+def test_disk_hit_survives_a_new_process(tmp_path):
+    TextCache(disk_dir=str(tmp_path)).put('key', "resume text")
+    fresh = TextCache(disk_dir=str(tmp_path))
+    assert fresh.get('key') == "resume text"
+    assert fresh.stats()['disk_hits'] == 1
+
+
+def test_disk_size_is_seeded_from_existing_files(tmp_path):
+    (tmp_path / 'old.txt').write_text("y" * 950)
+    cache = TextCache(disk_dir=str(tmp_path), max_disk_bytes=1000)
+    cache.put('new', "z" * 100)
+    assert not (tmp_path / 'old.txt').exists()
+    assert (tmp_path / 'new.txt').exists()
+
+
+def test_key_changes_with_extraction_settings(monkeypatch):
+    data = b"%PDF-1.4 not really a pdf"
+    key = extraction_key(data)
+    assert extraction_key(data) == key
+    monkeypatch.setattr(config, 'PDF_MAX_PAGES', config.PDF_MAX_PAGES + 1)
+    assert extraction_key(data) != key
+    assert extraction_key(data).split('-')[0] == key.split('-')[0]
+
+
+def test_text_cached_under_other_settings_is_not_reused(monkeypatch):
+    monkeypatch.setattr(config, 'EXTRACT_TIMEOUT_SECONDS', 0)
+    data = b"plain bytes"
+    cache = TextCache()
+    cache.put(extraction_key(data), "cached text")
+    assert extract_text_cached(data, 'resume.txt', cache=cache) == "cached text"
+
+    monkeypatch.setattr(config, 'EXTRACT_MAX_CHARS', config.EXTRACT_MAX_CHARS + 1)
+    # A miss, so the file is parsed again (and .txt is not supported)
+    with pytest.raises(ExtractionError):
+        extract_text_cached(data, 'resume.txt', cache=cache)
@@ -0,0 +1,92 @@
+"""CorpusStore search against KeywordIndex, through updates and compaction."""
+
+import random
+from collections import Counter
+
+import pytest
+
+pytest.importorskip('numpy')
+
+from resumematch import corpus  # noqa: E402
+from resumematch.corpus import CorpusStore  # noqa: E402
+from resumematch.index import KeywordIndex  # noqa: E402
+
+VOCABULARY = [f"term{index}" for index in range(300)] + ["python", "kubernetes", "données"]
+JOBS = [" ".join(random.Random(seed).sample(VOCABULARY, 25)) for seed in range(5)] + ["nothing relevant here"]
+
+
+def resumes(count, seed=0):
+    rng = random.Random(seed)
+    for number in range(count):
+        yield f"resumes/r{number:03}.pdf", Counter(rng.choices(VOCABULARY, k=rng.randint(1, 60)))
+
+
+def by_id(results):
+    return {hit['resume_id']: hit for hit in results}
+
+
+def assert_same_results(store, index):
+    for job in JOBS:
+        assert by_id(store.search(job, top_k=1000)) == by_id(index.search(job, top_k=1000))
+        # Top hits agree up to the order of tied scores
+        top = [hit['match_percentage'] for hit in store.search(job, top_k=5)]
+        assert top == [hit['match_percentage'] for hit in index.search(job, top_k=5)]
+
+
+@pytest.fixture
+def small_blocks(monkeypatch):
+    # Several flush, search and compaction blocks even for a small corpus
+    monkeypatch.setattr(corpus, 'BLOCK_ROWS', 7)
+
+
+def test_search_matches_keyword_index(tmp_path, small_blocks):
+    path = str(tmp_path / 'corpus')
+    index = KeywordIndex()
+    with CorpusStore(path, writable=True) as store:
+        for resume_id, keywords in resumes(60):
+            store.add_keywords(resume_id, keywords)
+            index.add_keywords(resume_id, keywords)
+    store = CorpusStore(path)
+    assert len(store) == len(index) == 60
+    assert_same_results(store, index)
+    assert store.get("resumes/r005.pdf") == dict(resumes(6))["resumes/r005.pdf"]
+
+
+def test_updates_removals_and_compaction(tmp_path, small_blocks):
+    path = str(tmp_path / 'corpus')
+    index = KeywordIndex()
+    store = CorpusStore(path, writable=True)
+    for resume_id, keywords in resumes(40):
+        store.add_keywords(resume_id, keywords)
+        index.add_keywords(resume_id, keywords)
+    # Re-added resumes supersede their earlier rows
+    for resume_id, keywords in list(resumes(40, seed=1))[::3]:
+        store.add_keywords(resume_id, keywords)
+        index.add_keywords(resume_id, keywords)
+    for number in range(0, 40, 4):
+        assert store.remove(f"resumes/r{number:03}.pdf")
+        index.remove(f"resumes/r{number:03}.pdf")
+    assert not store.remove("resumes/missing.pdf")
+    assert len(store) == len(index) == 30
+    assert_same_results(store, index)
+
+    reader = CorpusStore(path)
+    before = reader.search(JOBS[0], top_k=1000)
+    rows = store.rows
+    assert store.compact() == rows - 30
+    assert store.rows == 30
+    assert_same_results(store, index)
+    assert_same_results(CorpusStore(path), index)
+    # A reader keeps its generation until it refreshes
+    assert reader.search(JOBS[0], top_k=1000) == before
+    reader.refresh()
+    assert by_id(reader.search(JOBS[0], top_k=1000)) == by_id(index.search(JOBS[0], top_k=1000))
+
+
+def test_read_only_store_rejects_writes(tmp_path):
+    path = str(tmp_path / 'corpus')
+    CorpusStore(path, writable=True).close()
+    store = CorpusStore(path)
+    assert store.search(JOBS[0]) == []
+    with pytest.raises(ValueError):
+        store.add("resume.pdf", "Python developer")
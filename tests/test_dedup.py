@@ -0,0 +1,80 @@
+"""MinHash estimates and LSH near-duplicate lookups."""
+
+import random
+
+import pytest
+
+pytest.importorskip('numpy')
+
+from resumematch.dedup import DedupIndex, MinHasher, similarity  # noqa: E402
+
+VOCABULARY = [f"word{index}" for index in range(2000)]
+
+
+def resume(seed, words=300):
+    rng = random.Random(seed)
+    return " ".join(rng.choice(VOCABULARY) for _ in range(words))
+
+
+def edited(text, changes, seed=0):
+    rng = random.Random(seed)
+    words = text.split()
+    for position in rng.sample(range(len(words)), changes):
+        words[position] = "edited"
+    return " ".join(words)
+
+
+def jaccard(hasher, first, second):
+    a, b = set(hasher.shingles(first)), set(hasher.shingles(second))
+    return len(a & b) / len(a | b)
+
+
+@pytest.mark.parametrize('changes', [0, 5, 20, 60])
+def test_signature_similarity_estimates_jaccard(changes):
+    original = resume(1)
+    copy = edited(original, changes)
+    # One signature's estimate has a standard error of about 0.04; the mean
+    # over independent hash families should sit close to the true value
+    hashers = [MinHasher(seed=seed) for seed in range(1, 11)]
+    estimate = sum(similarity(h.signature(original), h.signature(copy)) for h in hashers) / len(hashers)
+    assert estimate == pytest.approx(jaccard(hashers[0], original, copy), abs=0.05)
+
+
+def test_unrelated_resumes_are_dissimilar():
+    hasher = MinHasher()
+    assert similarity(hasher.signature(resume(1)), hasher.signature(resume(2))) < 0.1
+
+
+def test_index_flags_light_edits_only():
+    hasher = MinHasher()
+    index = DedupIndex(threshold=0.8)
+    originals = [resume(seed) for seed in range(20)]
+    doc_ids = []
+    for number, text in enumerate(originals):
+        doc_id, duplicate = index.check(f"r{number}.pdf", hasher.signature(text))
+        assert duplicate is None
+        doc_ids.append(doc_id)
+    assert len(index) == 20
+
+    doc_id, duplicate = index.check("resubmitted.pdf", hasher.signature(edited(originals[7], 4)))
+    assert duplicate is not None
+    assert duplicate[:2] == (doc_ids[7], "r7.pdf") and doc_id == doc_ids[7]
+    assert duplicate[2] >= 0.8
+    # A flagged copy is not indexed
+    assert len(index) == 20
+
+    _, duplicate = index.check("rewritten.pdf", hasher.signature(edited(originals[3], 150)))
+    assert duplicate is None
+    index.close()
+
+
+def test_payload_is_shared_with_duplicates():
+    hasher = MinHasher()
+    index = DedupIndex()
+    text = resume(5)
+    doc_id, _ = index.check("a.pdf", hasher.signature(text))
+    index.set_payload(doc_id, '{"match_score": 64}')
+    duplicate_id, duplicate = index.check("b.pdf", hasher.signature(text))
+    assert duplicate[2] == 1.0
+    assert index.get_payload(duplicate_id) == '{"match_score": 64}'
+    index.close()
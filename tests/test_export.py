@@ -0,0 +1,90 @@
+"""Resuming JSONL and CSV reports after a crash mid-write."""
+
+import csv
+import json
+
+import pytest
+
+from resumematch.export import CSV_FIELDS, make_record, open_report
+
+
+def analysis(score):
+    return {
+        'match_score': score,
+        'overall_assessment': "Good match.\nSee the notes below.",
+        'strengths': ["Python"],
+        'weaknesses': [],
+        'recommendations': [],
+        'experience_alignment': {'score': score},
+        'skills_alignment': {'score': score},
+        'education_alignment': {'score': score},
+        'ats_compatibility': {'score': score, 'issues': [], 'improvements': []},
+    }
+
+
+@pytest.fixture(params=['report.jsonl', 'report.csv'])
+def report(request, tmp_path):
+    return str(tmp_path / request.param)
+
+
+def write_report(path, records):
+    with open_report(path) as writer:
+        for record in records:
+            writer.write(record)
+
+
+def read_files(path):
+    with open(path, encoding='utf-8', newline='') as f:
+        if path.endswith('.csv'):
+            return [row['file'] for row in csv.DictReader(f)]
+        return [json.loads(line)['file'] for line in f]
+
+
+def test_resume_skips_scored_and_retries_failed(report):
+    write_report(report, [make_record('a.pdf', 'h1', analysis(70)),
+                          make_record('b.pdf', 'h2', error="Extraction failed"),
+                          make_record('copy-of-a.pdf', 'h1', analysis(70))])
+    with open_report(report, resume=True) as writer:
+        assert writer.completed == {'h1'}
+        # Identical files at different paths are ranked separately
+        assert writer.scores == {'a.pdf': 70, 'copy-of-a.pdf': 70}
+
+
+def test_resume_drops_half_written_record(report):
+    write_report(report, [make_record('a.pdf', 'h1', analysis(70)), make_record('b.pdf', 'h2', analysis(55))])
+    with open(report, 'rb') as f:
+        data = f.read()
+    # Cut the last record right after the newline inside its assessment
+    cut = data.index(b'See the notes', data.index(b'b.pdf')) if report.endswith('.csv') else data.index(b'b.pdf')
+    with open(report, 'wb') as f:
+        f.write(data[:cut])
+
+    with open_report(report, resume=True) as writer:
+        assert writer.completed == {'h1'}
+        writer.write(make_record('b.pdf', 'h2', analysis(55)))
+    assert read_files(report) == ['a.pdf', 'b.pdf']
+    if report.endswith('.csv'):
+        with open(report, encoding='utf-8', newline='') as f:
+            rows = list(csv.DictReader(f))
+        assert rows[1]['overall_assessment'] == "Good match.\nSee the notes below."
+
+
+def test_resume_after_partial_header_rewrites_it(tmp_path):
+    path = str(tmp_path / 'report.csv')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(",".join(CSV_FIELDS[:3]))
+    with open_report(path, resume=True) as writer:
+        writer.write(make_record('a.pdf', 'h1', analysis(70)))
+    with open(path, encoding='utf-8', newline='') as f:
+        assert next(csv.reader(f)) == CSV_FIELDS
+    assert read_files(path) == ['a.pdf']
+
+
+def test_csv_with_other_columns_is_not_resumed(tmp_path):
+    path = str(tmp_path / 'report.csv')
+    with open(path, 'wb') as f:
+        f.write(b"file,score\r\na.pdf,70\r\n")
+    with pytest.raises(ValueError):
+        open_report(path, resume=True)
+    with open(path, 'rb') as f:
+        assert f.read() == b"file,score\r\na.pdf,70\r\n"
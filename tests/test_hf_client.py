@@ -0,0 +1,111 @@
+"""InferenceClient against a local stub of the inference endpoint."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from resumematch.hf_client import InferenceClient
+
+ANALYSIS = {
+    "match_score": 82,
+    "overall_assessment": "Strong match.",
+    "strengths": ["Python"],
+    "weaknesses": ["No Spark"],
+    "recommendations": ["Mention Spark"]
+}
+
+
+class StubServer(ThreadingHTTPServer):
+    """Answers 503 (model loading) ``loading`` times, then the analysis"""
+
+    def __init__(self, loading=0):
+        super().__init__(('127.0.0.1', 0), StubHandler)
+        self.loading = loading
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/model"
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        self.rfile.read(int(self.headers['Content-Length']))
+        with self.server.lock:
+            self.server.requests += 1
+            loading = self.server.requests <= self.server.loading
+        if loading:
+            # A non-numeric estimate must fall back to the default backoff
+            self._reply(503, {"error": "Model is loading", "estimated_time": "soon"})
+        else:
+            self._reply(200, [{"generated_text": "Here you go:\n" + json.dumps(ANALYSIS)}])
+
+    def _reply(self, status, body):
+        payload = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub():
+    servers = []
+
+    def start(loading=0):
+        server = StubServer(loading)
+        threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def test_retries_while_model_loads(stub):
+    server = stub(loading=2)
+    client = InferenceClient(api_url=server.url, max_retries=3, backoff=0.01)
+    analysis = client.analyze_sync("resume text", "job text")
+    assert analysis['match_score'] == 82
+    assert analysis['strengths'] == ["Python"]
+    assert server.requests == 3
+
+
+def test_gives_up_after_max_retries(stub):
+    server = stub(loading=10)
+    client = InferenceClient(api_url=server.url, max_retries=1, backoff=0.01)
+    assert client.analyze_sync("resume text", "job text") is None
+    assert server.requests == 2
+
+
+def test_repeat_analysis_is_served_from_cache(stub):
+    server = stub()
+    client = InferenceClient(api_url=server.url, backoff=0.01)
+    first = client.analyze_sync("resume text", "job text")
+    second = client.analyze_sync("resume text", "job text")
+    assert first == second
+    assert server.requests == 1
+    assert client.cache_hits == 1
+
+
+def test_concurrent_identical_requests_call_once(stub):
+    server = stub()
+    client = InferenceClient(api_url=server.url, backoff=0.01)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(client.analyze_sync("resume text", "job text")))
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(results) == 8 and all(result['match_score'] == 82 for result in results)
+    assert server.requests == 1
@@ -0,0 +1,59 @@
+"""extract_object on the kinds of output a text-generation model produces."""
+
+import pytest
+
+from resumematch.llm_json import LLMJSONError, ObjectScanner, extract_object
+
+SCHEMA = {'match_score': int, 'strengths': list, 'overall_assessment': str}
+REQUIRED = ('match_score', 'strengths')
+
+
+def test_object_between_prose_and_fences():
+    text = 'Sure! Here is the analysis:\n```json\n{"match_score": 75, "strengths": ["SQL"]}\n```\nHope it helps.'
+    assert extract_object(text, SCHEMA, REQUIRED) == {'match_score': 75, 'strengths': ["SQL"]}
+
+
+def test_single_quotes_and_trailing_commas():
+    text = "{'match_score': '80%', 'strengths': ['Python', 'It\\'s \"fast\"', ], 'note': {'a': [1, 2, ], }, }"
+    data = extract_object(text, SCHEMA, REQUIRED)
+    assert data['match_score'] == 80
+    assert data['strengths'] == ['Python', 'It\'s "fast"']
+    assert data['note'] == {'a': [1, 2]}
+
+
+def test_braces_inside_strings_do_not_close_the_object():
+    text = '{"overall_assessment": "uses {braces} and ]brackets[", "match_score": 61, "strengths": "Go"}'
+    data = extract_object(text, SCHEMA, REQUIRED)
+    assert data['overall_assessment'] == "uses {braces} and ]brackets["
+    assert data['strengths'] == ["Go"]
+
+
+def test_skips_objects_that_fail_the_schema():
+    text = 'Example: {"match_score": "high"}. Answer: {"match_score": 90, "strengths": ["Leadership"]}'
+    assert extract_object(text, SCHEMA, REQUIRED)['match_score'] == 90
+
+
+def test_optional_field_of_wrong_type_is_dropped():
+    data = extract_object('{"match_score": 5, "strengths": [], "overall_assessment": 3}', SCHEMA, REQUIRED)
+    assert 'overall_assessment' not in data
+
+
+@pytest.mark.parametrize('text, reason', [
+    ("I could not analyze this resume.", "no_object"),
+    ('{"match_score": 70, "strengths": ["Python", "SQ', "truncated"),
+    ('{"match_score": 70 "strengths": []}', "invalid"),
+    ('{"strengths": ["Python"]}', "schema"),
+    ('{"match_score": true, "strengths": []}', "schema"),
+])
+def test_failure_reasons(text, reason):
+    with pytest.raises(LLMJSONError) as excinfo:
+        extract_object(text, SCHEMA, REQUIRED)
+    assert excinfo.value.reason == reason
+
+
+def test_scanner_fed_in_pieces():
+    scanner = ObjectScanner()
+    pieces = ['prefix {"a": ', '"x}y", "b": [1', ', 2]}', ' {"c": 3}']
+    found = [obj for piece in pieces for obj in scanner.feed(piece)]
+    assert found == ['{"a": "x}y", "b": [1, 2]}', '{"c": 3}']
+    assert not scanner.inside_object
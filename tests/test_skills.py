@@ -0,0 +1,90 @@
+"""SkillTaxonomy automaton matches against a brute-force scan."""
+
+import random
+from collections import Counter
+
+import pytest
+
+from resumematch.skills import SkillTaxonomy, get_default_taxonomy, match_skills, normalize
+
+SKILLS = {
+    "Machine Learning": ["ML", "machine-learning"],
+    "Deep Learning": [],
+    "Learning Management": ["LMS"],
+    "PostgreSQL": ["postgres", "psql"],
+    "SQL": [],
+    "C++": ["cpp"],
+    "C": {"aliases": ["ansi c"], "match_name": False},
+    "CI/CD": ["continuous integration"],
+    "Java": [],
+    "JavaScript": ["js", "node.js"],
+    "Scikit-learn": ["sklearn"],
+}
+
+
+@pytest.fixture(scope='module')
+def taxonomy():
+    return SkillTaxonomy(SKILLS)
+
+
+def brute_force(taxonomy, text):
+    # Every term at every position, word-bounded, then leftmost-longest
+    text = normalize(text)
+    hits = []
+    for canonical in taxonomy.skills:
+        for term in taxonomy.terms(canonical):
+            start = text.find(term)
+            while start != -1:
+                end = start + len(term)
+                if (start == 0 or not text[start - 1].isalnum()) and (end == len(text) or not text[end].isalnum()):
+                    hits.append((start, end, canonical))
+                start = text.find(term, start + 1)
+    # The first skill listing an alias owns it
+    owners = {}
+    for start, end, canonical in hits:
+        owners.setdefault((start, end), canonical)
+    resolved, covered = [], 0
+    for (start, end), canonical in sorted(owners.items(), key=lambda item: (item[0][0], -item[0][1])):
+        if start >= covered:
+            resolved.append((start, end, canonical))
+            covered = end
+    return resolved
+
+
+@pytest.mark.parametrize('text, expected', [
+    ("Deep learning and machine\n learning", {"Deep Learning": 1, "Machine Learning": 1}),
+    ("C++, CI/CD and Postgres", {"C++": 1, "CI/CD": 1, "PostgreSQL": 1}),
+    ("JavaScript, Java; javas", {"JavaScript": 1, "Java": 1}),
+    ("Java and node.js", {"Java": 1, "JavaScript": 1}),
+    ("Plan B, C or ANSI C", {"C": 1}),
+    ("sklearn/scikit-learn", {"Scikit-learn": 2}),
+    ("postgresql", {"PostgreSQL": 1}),
+    ("", {}),
+])
+def test_find(taxonomy, text, expected):
+    assert dict(taxonomy.find(text)) == expected
+
+
+def test_scan_matches_brute_force_on_random_text(taxonomy):
+    pieces = [term for terms in taxonomy.skills.values() for term in terms]
+    pieces += ["learning", "machine", "java", "script", "c", "+", "/", "-", ".", "x", "postgre", "sq"]
+    rng = random.Random(3)
+    for _ in range(300):
+        text = "".join(rng.choice(pieces) + rng.choice(["", " ", ", ", "\n", "-", "/"])
+                       for _ in range(rng.randint(0, 25)))
+        assert taxonomy.scan(text) == brute_force(taxonomy, text), text
+
+
+def test_default_taxonomy_loads():
+    taxonomy = get_default_taxonomy()
+    assert len(taxonomy) > 50
+    assert taxonomy.find("Experienced with Python and SQL")
+
+
+def test_match_skills_ranks_by_job_mentions():
+    job = SkillTaxonomy(SKILLS).find("SQL, SQL, Java and C++")
+    result = match_skills(SkillTaxonomy(SKILLS).find("Java and SQL"), job)
+    assert result['matched_skills'] == ["SQL", "Java"]
+    assert result['missing_skills'] == ["C++"]
+    assert result['skill_match_percentage'] == pytest.approx(200 / 3)
+    assert match_skills(Counter(), Counter())['skill_match_percentage'] is None
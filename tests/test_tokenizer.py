@@ -0,0 +1,79 @@
+"""Tokenizer output against the original extract_keywords and flag checks."""
+
+import random
+import re
+from collections import Counter
+
+import pytest
+
+from resumematch.tokenizer import STOP_WORDS, Tokenizer
+
+SAMPLE = """Jane Doe - Senior Data Analyst
+EXPERIENCE
+Worked at Acme Corp. (2019-2023): led a team of 5+, improved reporting speed by 35%.
+Built ETL pipelines in Python 3.11, SQL and node.js; saved $120,000 a year.
+EDUCATION
+B.Sc. Statistics, State University. 8 years of Tableau/Power-BI dashboards.
+"""
+
+WORDS = ['Python', 'sql', 'node.js', 'C++', 'data-driven', 'the', 'Experience', 'worked', 'LED', 'degree',
+         'analyst', 'x1', '2023', '35%', '$100', '5+', '7 years', 'team', 'e-mail', 'v2.0', 'étude',
+         'Kubernetes', 'skills', 'bachelor', 'reduced', '...', '-', 'a.b.c', 'MASTER', 'intern']
+
+
+def baseline_keywords(text):
+    # extract_keywords as it was before the tokenizer
+    words = re.findall(r'\b[a-zA-Z][a-zA-Z0-9\.\-]*\b', text.lower())
+    return Counter(w for w in words if w not in STOP_WORDS and len(w) > 3 and not w.isdigit())
+
+
+def baseline_flags(text):
+    lower = text.lower()
+    return {
+        'has_experience': any(w in lower for w in ['experience', 'worked', 'employment', 'intern', 'analyst']),
+        'has_education': any(w in lower for w in ['education', 'degree', 'university', 'bachelor', 'master']),
+        'has_skills': any(w in lower for w in ['skills', 'technologies', 'proficient', 'python', 'sql']),
+        'has_achievements': any(w in lower for w in ['achieved', 'improved', 'increased', 'reduced', 'led',
+                                                     'developed']),
+        'has_metrics': bool(re.search(r'\d+%|\$\d+|\d+\+', text)),
+        'ats_experience': 'experience' in lower or 'work' in lower,
+        'ats_education': 'education' in lower or 'degree' in lower,
+        'ats_skills': 'skills' in lower,
+        'ats_metrics': bool(re.search(r'\d+%|\d+ years|\d+\+', text)),
+    }
+
+
+def random_texts(count=200, seed=7):
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield "".join(rng.choice(WORDS) + rng.choice([' ', '\n', ', ', '/', '(', ') '])
+                      for _ in range(rng.randint(0, 60)))
+
+
+@pytest.mark.parametrize('text', [SAMPLE, "", "   \n"])
+def test_keywords_match_baseline_including_order(text):
+    keywords = Tokenizer().keywords(text)
+    expected = baseline_keywords(text)
+    assert keywords == expected
+    # Insertion order decides most_common ties
+    assert list(keywords) == list(expected)
+
+
+def test_keywords_match_baseline_on_random_text():
+    tokenizer = Tokenizer()
+    for text in random_texts():
+        keywords = tokenizer.keywords(text)
+        assert list(keywords.items()) == list(baseline_keywords(text).items()), text
+
+
+def test_profile_matches_baseline_flags():
+    tokenizer = Tokenizer()
+    for text in [SAMPLE, "", *random_texts(seed=11)]:
+        profile = tokenizer.profile(text)
+        assert profile.keywords == baseline_keywords(text)
+        assert profile._asdict() == {'keywords': profile.keywords, **baseline_flags(text)}, text
+
+
+def test_custom_stop_words_and_length():
+    tokenizer = Tokenizer(stop_words={'python'}, min_length=3)
+    assert tokenizer.keywords("Python SQL and Go") == Counter({'sql': 1, 'and': 1})
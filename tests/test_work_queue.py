@@ -0,0 +1,88 @@
+"""WorkQueue leases, retries and resubmission on a temporary SQLite file."""
+
+import time
+
+import pytest
+
+from resumematch.work_queue import WorkQueue, worker_loop
+
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = WorkQueue(str(tmp_path / 'queue.sqlite'), max_attempts=2)
+    yield queue
+    queue.close()
+
+
+def test_claim_complete_and_resubmit(queue):
+    task_id = queue.submit("resume", "job")
+    assert queue.submit("resume", "job") == task_id
+    assert queue.status(task_id)['status'] == 'queued'
+
+    claimed_id, payload = queue.claim('w1', lease_seconds=30)
+    assert claimed_id == task_id
+    assert payload == {'resume_text': "resume", 'job_description': "job", 'use_ai': True}
+    assert queue.claim('w2', lease_seconds=30) is None
+
+    queue.complete(task_id, {'match_score': 70})
+    # The same request again is answered from the finished task
+    assert queue.submit("resume", "job") == task_id
+    status = queue.status(task_id)
+    assert status['status'] == 'done' and status['result'] == {'match_score': 70}
+
+
+def test_queue_position(queue):
+    first = queue.submit("resume 1", "job")
+    second = queue.submit("resume 2", "job")
+    assert queue.status(first)['position'] == 0
+    assert queue.status(second)['position'] == 1
+
+
+def test_expired_lease_is_claimed_again(queue):
+    task_id = queue.submit("resume", "job")
+    queue.claim('crashed', lease_seconds=0.05)
+    assert queue.claim('w2', lease_seconds=30) is None
+    time.sleep(0.1)
+
+    claimed_id, _ = queue.claim('w2', lease_seconds=30)
+    assert claimed_id == task_id
+    assert queue.status(task_id)['attempts'] == 2
+    # The crashed worker lost its lease; the new holder can renew
+    assert not queue.renew(task_id, 'crashed')
+    assert queue.renew(task_id, 'w2')
+
+
+def test_task_fails_after_max_attempts_and_requeues_on_submit(queue):
+    task_id = queue.submit("resume", "job")
+    for _ in range(2):
+        queue.claim('crashing', lease_seconds=0.01)
+        time.sleep(0.05)
+    assert queue.claim('w', lease_seconds=30) is None
+    status = queue.status(task_id)
+    assert status['status'] == 'failed' and "2 attempts" in status['error']
+
+    queue.submit("resume", "job")
+    status = queue.status(task_id)
+    assert status['status'] == 'queued' and status['attempts'] == 0
+
+
+def test_purge_keeps_pending_tasks(queue):
+    done_id = queue.submit("resume 1", "job")
+    queue.claim('w', lease_seconds=30)
+    queue.complete(done_id, {})
+    pending_id = queue.submit("resume 2", "job")
+    assert queue.purge(-1) == 1
+    assert queue.status(done_id) is None
+    assert queue.status(pending_id)['status'] == 'queued'
+
+
+def test_worker_loop_runs_rule_based_analysis(tmp_path):
+    path = str(tmp_path / 'queue.sqlite')
+    queue = WorkQueue(path)
+    task_id = queue.submit("Data analyst with 5 years of Python and SQL experience", "Python SQL analyst",
+                           use_ai=False)
+    worker_loop(path, lease_seconds=5, poll_seconds=0.01, max_tasks=1)
+    status = queue.status(task_id)
+    assert status['status'] == 'done'
+    assert 0 <= status['result']['match_score'] <= 100
+    queue.close()